@@ -0,0 +1,112 @@
+"""
+Asset build tools for the Fishing Mastery game
+
+Usage:
+    python asset_tools.py atlas [--out assets/atlas]
+    python asset_tools.py validate
+    python asset_tools.py bundle [--out assets/assets.bundle]
+
+atlas     Pack every fish texture into display-ready sheets plus a JSON
+          name -> rect index. The game loads these at startup instead of
+          packing the textures itself.
+validate  Check the fish asset manifest: report species whose texture only
+          resolves through an alias or fuzzy match, species without any
+          texture, and texture files no species uses. Exits with status 1
+          if anything needs fixing. Does not open the game window.
+bundle    Write every asset, already scaled to each size the game draws it
+          at, into one raw-pixel bundle the game memory-maps at startup
+          instead of decoding JPEG/PNG files.
+"""
+
+import argparse
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import fishing_game_modular_fixed as game
+
+
+def build_atlas(args):
+    """Build and save the fish texture atlases"""
+    fish_names = [fish['name'] for fish in game.get_all_fish_list()]
+    for cell_size in (game.FISH_TEXTURE_SIZE, game.FISH_THUMBNAIL_SIZE):
+        atlas = game.FishTextureAtlas.build(fish_names, cell_size)
+        atlas.save(args.out)
+        print(f"{cell_size[0]}x{cell_size[1]}: packed {len(atlas.index)}/{len(fish_names)} fish "
+              f"into {len(atlas.sheets)} sheet(s) in {args.out}")
+    return 0
+
+
+def validate_manifest(args):
+    """Report mismatches between FISH_DATABASE and the fish texture files"""
+    manifest = game.build_asset_manifest()
+    problems = 0
+    for fish_name, texture_path in manifest.items():
+        expected_file = game.get_default_texture_file(fish_name)
+        if texture_path is game.MISSING_TEXTURE:
+            print(f"MISSING   {fish_name}: no texture (expected {expected_file}), using placeholder")
+            problems += 1
+        elif os.path.basename(texture_path) != expected_file:
+            print(f"RENAMED   {fish_name}: resolved to {os.path.basename(texture_path)} (expected {expected_file})")
+            problems += 1
+
+    used_files = {os.path.basename(path) for path in manifest.values() if path is not game.MISSING_TEXTURE}
+    for path in game.list_image_assets([game.FISH_TEXTURE_DIR]):
+        if os.path.basename(path) not in used_files:
+            print(f"UNUSED    {os.path.basename(path)}: not used by any species")
+            problems += 1
+
+    print(f"{len(manifest)} species, {problems} problem(s)")
+    return 1 if problems else 0
+
+
+def bundle_targets(path):
+    """Return the sizes the game draws the asset at (button icons are fitted, not stretched)"""
+    if path.startswith(game.ASSET_DIRS[0]):
+        return [(game.WINDOW_WIDTH, game.WINDOW_HEIGHT)]
+    if path.startswith(game.ASSET_DIRS[1]):
+        return [game.FISH_TEXTURE_SIZE, game.FISH_THUMBNAIL_SIZE]
+    return [game.MENU_BUTTON_SIZE]
+
+
+def build_bundle(args):
+    """Scale every asset to its on-screen sizes and write the bundle"""
+    images = []
+    for path in game.list_image_assets():
+        try:
+            source = pygame.image.load(path)
+        except pygame.error as error:
+            print(f"SKIPPED   {path}: {error}")
+            continue
+        for target in bundle_targets(path):
+            size = game.fit_image_size(source.get_size(), target) if target == game.MENU_BUTTON_SIZE else target
+            images.append((path, target, pygame.transform.scale(source, size)))
+    game.AssetBundle.write(args.out, images)
+    print(f"Wrote {len(images)} images ({os.path.getsize(args.out) // 1024} KB) to {args.out}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fishing Mastery asset build tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    atlas_parser = commands.add_parser("atlas", help="pack fish textures into atlas sheets")
+    atlas_parser.add_argument("--out", default=game.ATLAS_DIR, help="output directory")
+    atlas_parser.set_defaults(run=build_atlas)
+
+    validate_parser = commands.add_parser("validate", help="check the fish asset manifest")
+    validate_parser.set_defaults(run=validate_manifest)
+
+    bundle_parser = commands.add_parser("bundle", help="write the prescaled raw-pixel asset bundle")
+    bundle_parser.add_argument("--out", default=game.ASSET_BUNDLE_PATH, help="bundle file")
+    bundle_parser.set_defaults(run=build_bundle)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,595 @@
+"""
+Performance benchmarks for the Fishing Mastery game
+
+Usage:
+    python benchmarks.py fish-index [--frames 300]
+    python benchmarks.py startup
+    python benchmarks.py cold-start [--runs 5]
+    python benchmarks.py import-time [--runs 5]
+    python benchmarks.py render [--frames 300]
+    python benchmarks.py spawn [--draws 200000]
+    python benchmarks.py batch [--catches 10000000]
+    python benchmarks.py tension [--instances 5000] [--verify 200]
+    python benchmarks.py inventory [--sequences 200] [--operations 300]
+    python benchmarks.py catch-memory [--catches 200000]
+    python benchmarks.py bulk-sell [--sizes 1000,10000,100000]
+    python benchmarks.py hit-test [--clicks 20000]
+    python benchmarks.py inventory-screen [--frames 300]
+
+fish-index  Frame time of the FISH_INDEX screen loading and transforming
+            textures every frame (the old path) versus blitting cached
+            atlas thumbnails and their greyed variants.
+startup     Time until the game is interactive (menu buttons and fish
+            atlases ready) with lazy main-thread loading versus decoding on
+            the preloader's thread pool.
+cold-start  Fresh-process startup time and peak RSS loading assets from the
+            JPEG/PNG files versus from the mmap'ed asset bundle (build it
+            first with: python asset_tools.py bundle).
+import-time Fresh-process import time of the pure game logic module versus
+            the pygame game module.
+render      Per-GameState frame cost and pixels pushed to the display with
+            full flips versus dirty rectangles, with checks that dirty
+            frames push every changed pixel and that the frame after a
+            window expose pushes the whole screen.
+spawn       spawn_fish() cost with the old per-call probability rebuild
+            and linear scan versus the memoized alias sampler, plus a
+            chi-square check that both produce the same species
+            distribution for every rod and cheat mode.
+batch       Spawning and pricing a Monte Carlo run of catches with
+            spawn_fish() in a Python loop versus the NumPy batch API, with
+            checks that the batch follows the alias tables' distribution
+            and prices exactly like calculate_selling_price().
+tension     Line tension stages per second stepping LineTensionStage
+            objects one at a time versus LineTensionBatch, over a sweep of
+            hold/release threshold policies, with a check that the batch
+            reproduces the scalar time_in_target and score exactly.
+inventory   FISH_INDEX queries (missing counts per rarity, caught species,
+            inventory value) scanning the inventory versus reading the
+            Inventory's running counts, plus randomized operation sequences
+            checking the counts against the scans after every operation.
+catch-memory
+            Bytes per stored catch and construction rate with the old
+            nested-dict catches versus CatchRecord objects and the columnar
+            CatchHistory, with a check that all three hold the same catches.
+bulk-sell   Selling by rarity, below a quality tier and all but the best
+            of each species one fish at a time with pop(i) (what clicking
+            rows does) versus one compaction pass, with checks that both
+            earn the same gold and leave the same inventory and counts.
+hit-test    Inventory click cost scanning every row versus RowLayout
+            arithmetic, plus checks of RowLayout and the fish index
+            GridLayout against brute-force rectangle tests along every
+            row and cell edge and at random points.
+inventory-screen
+            Keeping the inventory sorted by price, rarity and quality
+            through a catch with a full sort versus the maintained sorted
+            indexes, plus INVENTORY frame time as the inventory grows
+            (only the rows in view are drawn).
+
+Runs on the SDL dummy video driver, so no window is opened. The checks
+live in tests/checks.py and also run under pytest with fixed seeds and
+small sizes.
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import fishing_game_modular_fixed as game
+import fishing_logic as logic
+from tests import checks
+
+
+def time_frames(draw, frames):
+    """Return the mean milliseconds per call of draw()"""
+    draw()  # Warm up caches
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def report(label, before_ms, after_ms):
+    print(f"{label:<28} before {before_ms:8.3f} ms   after {after_ms:8.3f} ms   "
+          f"speedup {before_ms / after_ms:6.1f}x")
+
+
+def bench_fish_index(args):
+    """Compare FISH_INDEX frame time without and with the fish atlases"""
+    screen, font = checks.setup_screen()
+    game_data = game.GameData()
+    game_data.background = "assets/Background/Stormy.jpg"
+    inventory = checks.make_inventory()
+
+    def draw_uncached():
+        # Without atlases and with the variant and layer caches dropped every
+        # frame this is the old path: load, scale and grey out every texture
+        # and draw every cell per frame
+        game.FISH_VARIANTS.invalidate()
+        game.STATIC_LAYERS.invalidate()
+        game.draw_fish_index_screen(screen, font, inventory, game_data)
+
+    def draw():
+        game.draw_fish_index_screen(screen, font, inventory, game_data)
+
+    game.FISH_ATLAS = game.FISH_THUMBNAIL_ATLAS = None
+    before = time_frames(draw_uncached, args.frames)
+    game.init_fish_atlases()
+    after = time_frames(draw, args.frames)
+    report("FISH_INDEX frame", before, after)
+    print(f"Fish variant cache: {game.FISH_VARIANTS.stats()}")
+
+    # Only visible cells are drawn, so frame cost must not grow with the catalog
+    catalog = game.get_all_fish_list()
+    for species in (len(catalog), 5000):
+        game.FISH_INDEX_VIEW = game.FishIndexView((catalog * (species // len(catalog) + 1))[:species])
+        game.FISH_INDEX_VIEW.scroll_by(game.FISH_INDEX_VIEW.max_scroll() // 2)
+        frame_ms = time_frames(draw, args.frames)
+        print(f"{species:>5} species: {frame_ms:.3f} ms/frame "
+              f"({len(game.FISH_INDEX_VIEW.visible_rows())} of {game.FISH_INDEX_VIEW.row_count()} rows drawn)")
+    return 0
+
+
+def bench_startup(args):
+    """Compare startup-to-interactive time with lazy loading and with threaded preloading"""
+    screen, font = checks.setup_screen()
+    for path in game.list_image_assets():
+        game.decode_image(path)  # Warm the OS file cache so both runs read from memory
+
+    def make_interactive():
+        checks.make_menu_buttons(font)
+        game.init_fish_atlases(directory=os.devnull)  # Always pack, never use a prebuilt atlas
+
+    game.PRELOADED_IMAGES.clear()
+    start = time.perf_counter()
+    make_interactive()
+    before = (time.perf_counter() - start) * 1000
+
+    game.PRELOADED_IMAGES.clear()
+    start = time.perf_counter()
+    preloader = game.AssetPreloader().start()
+    while not preloader.poll():
+        time.sleep(0.001)
+    make_interactive()
+    after = (time.perf_counter() - start) * 1000
+
+    print(f"{len(preloader.paths)} assets, {preloader.workers} decode worker(s) on {os.cpu_count()} CPU(s)")
+    report("Startup to interactive", before, after)
+    return 0
+
+
+def cold_start_child(args):
+    """Run one startup in this (fresh) process and print its cost as JSON"""
+    start = time.perf_counter()
+    screen, font = checks.setup_screen()
+    if args.mode == "bundle":
+        if not game.open_asset_bundle():
+            print(json.dumps({"error": "no up-to-date asset bundle"}))
+            return 1
+    else:
+        game.AssetPreloader().start().finish()
+    checks.make_menu_buttons(font)
+    game.init_fish_atlases(directory=os.devnull)
+    game.load_background("assets/Background/Stormy.jpg")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(json.dumps({"ms": elapsed_ms, "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+    return 0
+
+
+def bench_cold_start(args):
+    """Compare fresh-process startup time and peak RSS: decoding versus the asset bundle"""
+    results = {}
+    for mode in ("decode", "bundle"):
+        runs = []
+        for _ in range(args.runs):
+            output = subprocess.run([sys.executable, __file__, "cold-start-child", mode],
+                                    capture_output=True, text=True, check=True).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+        if "error" in runs[0]:
+            print(f"{mode}: {runs[0]['error']}")
+            return 1
+        results[mode] = (min(run["ms"] for run in runs), max(run["rss_kb"] for run in runs))
+        print(f"{mode:<8} startup {results[mode][0]:8.1f} ms   peak RSS {results[mode][1] / 1024:7.1f} MB")
+    report("Cold start", results["decode"][0], results["bundle"][0])
+    return 0
+
+
+IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print((time.perf_counter() - start) * 1000, 'pygame' in sys.modules)
+"""
+
+
+def bench_import_time(args):
+    """Measure the import time of each entry point in fresh interpreters"""
+    for module in ("fishing_logic", "fishing_game_modular_fixed"):
+        timings = []
+        for _ in range(args.runs):
+            output = subprocess.run([sys.executable, "-c", IMPORT_PROBE.format(module=module)],
+                                    capture_output=True, text=True, check=True).stdout
+            elapsed_ms, pygame_loaded = output.strip().splitlines()[-1].split()
+            timings.append(float(elapsed_ms))
+        print(f"import {module:<28} {min(timings):8.2f} ms   pygame loaded: {pygame_loaded}")
+    return 0
+
+
+def bench_render(args):
+    """Compare full flips with dirty rectangles for every GameState"""
+    screen, font = checks.setup_screen()
+    small_font = game.get_font(24)
+    game.init_fish_atlases()
+    game_data = game.GameData()
+    game_data.background = "assets/Background/Stormy.jpg"
+    game_data.inventory = checks.make_inventory(every=5)
+    buttons = checks.make_menu_buttons(font)
+    dt = 1 / game.FPS
+
+    screen_pixels = screen.get_width() * screen.get_height()
+    failures = 0
+    print(f"{'state':<20} {'full ms':>9} {'dirty ms':>9} {'full px/frame':>14} {'dirty px/frame':>15} "
+          f"{'pushed':>9} {'after expose':>13}")
+    for label, state, stage_number in checks.render_scenarios(game_data):
+        results = {}
+        for mode in game.DirtyRectRenderer.MODES:
+            game.RENDERER = game.DirtyRectRenderer(mode)
+            stages = checks.make_stages()
+            stages[4].space_held = True
+            start = time.perf_counter()
+            for _ in range(args.frames):
+                if state == game.GameState.FISHING:
+                    stages[stage_number - 1].update(dt)
+                game.RENDERER.begin_frame(game.get_scene_key(state, stage_number, game_data))
+                game.draw_game_state(screen, font, small_font, state, stage_number, stages, buttons, game_data)
+                game.RENDERER.end_frame()
+            elapsed_ms = (time.perf_counter() - start) * 1000 / args.frames
+            # The first frame of a scene is always a full flip; report the steady state
+            steady_pixels = (game.RENDERER.total_pixels - screen.get_width() * screen.get_height()) / max(1, args.frames - 1)
+            results[mode] = (elapsed_ms, steady_pixels)
+
+        # Dirty frames must leave the display showing what was drawn, and an
+        # exposed window, having lost its contents, must be pushed in full
+        mismatched, exposed_pixels = checks.render_check(screen, font, small_font, state, stage_number, game_data,
+                                                         buttons, min(args.frames, 30))
+        failures += mismatched > 0 or exposed_pixels < screen_pixels
+        print(f"{label:<20} {results['full'][0]:9.3f} {results['dirty'][0]:9.3f} "
+              f"{results['full'][1]:14.0f} {results['dirty'][1]:15.0f} "
+              f"{'match' if not mismatched else f'{mismatched} DIFFER':>9} "
+              f"{'full' if exposed_pixels >= screen_pixels else 'PARTIAL':>13}")
+    print(f"dirty frames match what was drawn and expose repaints the full screen in every state: "
+          f"{'PASS' if not failures else 'FAIL'}")
+    return 1 if failures else 0
+
+
+def bench_spawn(args):
+    """Compare spawn_fish speed and check the alias sampler's species distribution"""
+    failures = 0
+    for rod, luck in logic.GameData().rod_luck.items():
+        for cheat_mode in (False, True):
+            label = f"{rod}{' (cheat)' if cheat_mode else ''}"
+            before = time_frames(lambda: checks.spawn_fish_linear(luck, cheat_mode), args.draws)
+            after = time_frames(lambda: logic.spawn_fish(luck, cheat_mode), args.draws)
+            print(f"{label:<22} linear {before * 1e6:7.0f} ns   alias {after * 1e6:7.0f} ns   "
+                  f"speedup {before / after:5.1f}x")
+
+            # Two-sample chi-square over every species: old function vs alias sampler, and
+            # the alias tables must encode the old probabilities exactly (up to rounding)
+            statistic, limit, degrees = checks.spawn_distribution(luck, cheat_mode, args.draws, args.draws)
+            table_error = checks.spawn_table_error(luck, cheat_mode)
+
+            passed = statistic < limit and table_error < 1e-12
+            failures += not passed
+            print(f"{'':<22} chi2 {statistic:6.1f} (limit {limit:5.1f}, {degrees} df)   "
+                  f"table error {table_error:.1e}   {'PASS' if passed else 'FAIL'}")
+    return 1 if failures else 0
+
+
+def bench_batch(args):
+    """Compare looped and batched spawning/pricing and check the batch results"""
+    import numpy as np  # Only the batch benchmark needs NumPy
+    import fishing_batch as batch
+
+    rng = np.random.default_rng(1)
+    game_data = logic.GameData()
+    luck = game_data.rod_luck["Novice Rod"]
+    loop_catches = min(args.catches, 200000)
+    qualities = rng.uniform(0, 100, loop_catches)
+
+    start = time.perf_counter()
+    for quality in qualities:
+        fish = logic.spawn_fish(luck, False)
+        logic.calculate_selling_price(fish['rarity'], quality, game_data)
+    loop_seconds = (time.perf_counter() - start) * args.catches / loop_catches
+
+    start = time.perf_counter()
+    rarity_codes, species = batch.spawn_fish_batch(args.catches, luck, False, rng)
+    prices = batch.calculate_selling_prices(rarity_codes, rng.uniform(0, 100, args.catches))
+    batch_seconds = time.perf_counter() - start
+    print(f"{args.catches:,} catches: loop {loop_seconds:7.2f} s (extrapolated from {loop_catches:,})   "
+          f"batch {batch_seconds:6.2f} s   speedup {loop_seconds / batch_seconds:5.0f}x")
+
+    # Goodness of fit of the batch species counts against the alias tables, and
+    # every batch price must equal the scalar price, including the 10x cheat
+    statistic, limit, rarity_matches = checks.batch_distribution(rarity_codes, species, luck)
+    check = slice(0, min(args.catches, 100000))
+    mismatches = checks.batch_price_mismatches(rarity_codes[check], rng.uniform(0, 100, check.stop))
+
+    passed = statistic < limit and rarity_matches and not mismatches
+    print(f"chi2 {statistic:.1f} (limit {limit:.1f})   rarity codes consistent: {rarity_matches}   "
+          f"price mismatches: {mismatches}/{2 * check.stop}   mean price {prices.mean():,.0f}   "
+          f"{'PASS' if passed else 'FAIL'}")
+    return 0 if passed else 1
+
+
+def bench_tension(args):
+    """Compare scalar and batched line tension simulation and check they agree exactly"""
+    import numpy as np
+
+    offsets = np.linspace(-60, 60, args.instances)
+    checked = np.linspace(0, args.instances - 1, min(args.verify, args.instances)).astype(int)
+    failures = 0
+    for label, knobs in checks.TENSION_VARIANTS:
+        start = time.perf_counter()
+        time_in_target, scores = checks.run_batch_tension(offsets, knobs)
+        batch_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scalar = [checks.run_scalar_tension(offsets[i], knobs) for i in checked]
+        scalar_seconds = (time.perf_counter() - start) * args.instances / len(checked)
+        mismatches = checks.tension_mismatches(checked, scalar, time_in_target, scores)
+        failures += mismatches > 0
+
+        best = int(scores.argmax())
+        print(f"{label}: {args.instances:,} stages   scalar {scalar_seconds:6.2f} s (extrapolated from "
+              f"{len(checked)})   batch {batch_seconds:5.2f} s   speedup {scalar_seconds / batch_seconds:4.0f}x")
+        print(f"    best threshold offset {offsets[best]:+.1f} px: score {scores[best]:.1f}   "
+              f"mean score {scores.mean():.1f}   mismatches vs scalar: {mismatches}/{len(checked)}   "
+              f"{'PASS' if not mismatches else 'FAIL'}")
+    return 1 if failures else 0
+
+
+def bench_inventory(args):
+    """Compare scanned and incrementally maintained FISH_INDEX queries and check they agree"""
+    rng = random.Random(1)
+    for size in (20, 200, 2000):
+        plain = [checks.random_catch(rng) for _ in range(size)]
+        inventory = logic.Inventory(plain)
+        queries = max(100, 200000 // size)
+        before = time_frames(lambda: (logic.get_missing_fish_counts(plain), logic.get_caught_species(plain),
+                                      sum(fish.price for fish in plain)), queries)
+        after = time_frames(lambda: (logic.get_missing_fish_counts(inventory), logic.get_caught_species(inventory),
+                                     inventory.total_value), queries)
+        report(f"index queries, {size} fish", before, after)
+
+    # Property check: after every operation the running counts equal the scans
+    failures = 0
+    operations = {}
+    for sequence in range(args.sequences):
+        operation = checks.inventory_sequence(sequence, args.operations, operations)
+        if operation is not None:
+            failures += 1
+            print(f"sequence {sequence}: counts diverged from the scans after {operation}")
+    checked = sum(operations.values())
+    print(f"{args.sequences} random sequences, {checked:,} operations "
+          f"({', '.join(f'{name} {count}' for name, count in sorted(operations.items()))}): "
+          f"{failures} diverged   {'PASS' if not failures else 'FAIL'}")
+    return 1 if failures else 0
+
+
+def measure_catches(build, catches):
+    """Build a store of catches; return (store, bytes allocated per catch, catches per second)"""
+    rng = random.Random(1)
+    logic.random.seed(1)
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = build((rng.uniform(0, 100) for _ in range(4)) for _ in range(catches))
+    seconds = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return store, allocated / catches, catches / seconds
+
+
+def bench_catch_memory(args):
+    """Compare the memory held per catch by nested dicts, CatchRecord objects and CatchHistory"""
+    game_data = logic.GameData()
+    game_data.current_rod = "Master Rod"
+    layouts = [
+        ("nested dicts", lambda scores: [checks.create_caught_fish_dict(list(s), game_data) for s in scores]),
+        ("CatchRecord list", lambda scores: [logic.create_caught_fish(list(s), game_data) for s in scores]),
+        ("CatchHistory", lambda scores: logic.CatchHistory(logic.create_caught_fish(list(s), game_data) for s in scores)),
+    ]
+    stores = []
+    for label, build in layouts:
+        store, per_catch, rate = measure_catches(build, args.catches)
+        stores.append(store)
+        print(f"{label:<18} {per_catch:7.1f} bytes/catch   {rate:9,.0f} catches/s built")
+
+    # Same seeds, so all three must hold the same catches
+    mismatches = checks.catch_store_mismatches(*stores)
+    print(f"{args.catches:,} catches, {mismatches} mismatches   {'PASS' if not mismatches else 'FAIL'}")
+    return 1 if mismatches else 0
+
+
+def bench_bulk_sell(args):
+    """Compare one-at-a-time and single-pass bulk selling and check they agree"""
+    failures = 0
+    for size in (int(size) for size in args.sizes.split(",")):
+        rng = random.Random(size)
+        catches = [checks.random_catch(rng) for _ in range(size)]
+        for label, bulk, make_sold in checks.BULK_SELLS:
+            slow, fast = logic.GameData(), logic.GameData()
+            slow.inventory, fast.inventory = logic.Inventory(catches), logic.Inventory(catches)
+            start = time.perf_counter()
+            slow_earned = checks.sell_one_at_a_time(slow, make_sold(slow.inventory))
+            before = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            fast_earned = bulk(fast)
+            after = (time.perf_counter() - start) * 1000
+            agree = checks.bulk_sell_agrees(slow, fast, slow_earned, fast_earned)
+            failures += not agree
+            report(f"{label}, {size} fish", before, after)
+            print(f"{'':<28} sold {size - len(fast.inventory)}, earned {fast_earned:,}   {'PASS' if agree else 'FAIL'}")
+    return 1 if failures else 0
+
+
+def bench_hit_test(args):
+    """Compare scanned and arithmetic inventory hit tests and check both layouts against brute force"""
+    rng = random.Random(1)
+    layout = game.INVENTORY_ROWS
+    for count in (20, 1000, 100000):
+        clicks = [(rng.randrange(game.WINDOW_WIDTH), rng.randrange(layout.row_y(count) + 50)) for _ in range(args.clicks)]
+        scanned = clicks[:max(10, min(len(clicks), 1000000 // count))]  # The scan is O(rows) per click
+        start = time.perf_counter()
+        for click in scanned:
+            checks.inventory_row_scan(click, count)
+        before = (time.perf_counter() - start) * 1e6 / len(scanned)
+        start = time.perf_counter()
+        for click in clicks:
+            layout.row_at(click, count)
+        after = (time.perf_counter() - start) * 1e6 / len(clicks)
+        print(f"{count:>7} rows   scan {before:10.2f} us/click   arithmetic {after:6.2f} us/click   "
+              f"speedup {before / after:8.0f}x")
+
+    failures = 0
+    for scroll in (0, 37, layout.row_y(25) - layout.top):
+        points, mismatches = checks.row_hit_mismatches(layout, 25, scroll, rng, args.clicks)
+        failures += mismatches > 0
+        print(f"inventory rows, scroll {scroll}: {points:,} points, {mismatches} mismatches   "
+              f"{'PASS' if not mismatches else 'FAIL'}")
+
+    view = game.FishIndexView()
+    for scroll in (0, 37, view.max_scroll()):
+        points, mismatches = checks.fish_cell_mismatches(view, scroll, rng, args.clicks // 10)
+        failures += mismatches > 0
+        print(f"fish index, scroll {scroll}: {points:,} points, {mismatches} mismatches   "
+              f"{'PASS' if not mismatches else 'FAIL'}")
+
+    mismatches = checks.visible_row_mismatches(layout, view)
+    failures += mismatches > 0
+    print(f"visible rows of both layouts at every scroll offset: {mismatches} mismatches   "
+          f"{'PASS' if not mismatches else 'FAIL'}")
+    return 1 if failures else 0
+
+
+def bench_inventory_screen(args):
+    """Compare full re-sorts with maintained sorted indexes and time the virtualized inventory screen"""
+    rng = random.Random(1)
+    for size in (1000, 10000, 100000):
+        catches = [checks.random_catch(rng) for _ in range(size + 50)]
+        plain = catches[:size]
+        inventory = logic.Inventory(plain)
+        for order in logic.SORT_KEYS:
+            inventory.sorted_catches(order)
+        new_catches = iter(catches[size:])
+
+        def full_sort():
+            # A catch arrives and the screen re-sorts the whole inventory
+            plain.append(next(new_catches))
+            return [sorted(plain, key=key, reverse=True)[:12] for key in logic.SORT_KEYS.values()]
+
+        def maintained():
+            inventory.append(next(new_catches))
+            return [inventory.sorted_catches(order, 0, 12) for order in logic.SORT_KEYS]
+
+        before = time_frames(full_sort, 20)
+        new_catches = iter(catches[size:])
+        after = time_frames(maintained, 20)
+        report(f"catch + 3 sorts, {size} fish", before, after)
+
+    screen, font = checks.setup_screen()
+    game_data = game.GameData()
+    view = game.INVENTORY_VIEW
+    for size in (20, 1000, 5000):
+        game_data.inventory = logic.Inventory(checks.random_catch(rng) for _ in range(size))
+        game_data.inventory_capacity = max(20, size)
+        game_data.inventory_version += 1
+        for order in view.SORT_ORDERS:
+            view.order = order
+            view.scroll = view.max_scroll(size) // 2
+            frame_ms = time_frames(lambda: game.draw_inventory_screen(screen, font, game_data.inventory,
+                                                                       game_data.gold, game_data), args.frames)
+            print(f"{size:>5} fish, {view.SORT_LABELS[order]:<12} {frame_ms:.3f} ms/frame "
+                  f"({len(view.visible_rows(size))} of {size} rows drawn)")
+    view.order = None
+    view.scroll = 0
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fishing Mastery performance benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    fish_index_parser = commands.add_parser("fish-index", help="FISH_INDEX frame time")
+    fish_index_parser.add_argument("--frames", type=int, default=300)
+    fish_index_parser.set_defaults(run=bench_fish_index)
+
+    startup_parser = commands.add_parser("startup", help="startup-to-interactive time")
+    startup_parser.set_defaults(run=bench_startup)
+
+    cold_start_parser = commands.add_parser("cold-start", help="startup time and RSS: decode vs bundle")
+    cold_start_parser.add_argument("--runs", type=int, default=5)
+    cold_start_parser.set_defaults(run=bench_cold_start)
+
+    import_parser = commands.add_parser("import-time", help="import time of the logic and game modules")
+    import_parser.add_argument("--runs", type=int, default=5)
+    import_parser.set_defaults(run=bench_import_time)
+
+    render_parser = commands.add_parser("render", help="full flip vs dirty rect frame cost per state")
+    render_parser.add_argument("--frames", type=int, default=300)
+    render_parser.set_defaults(run=bench_render)
+
+    spawn_parser = commands.add_parser("spawn", help="spawn_fish speed and distribution check")
+    spawn_parser.add_argument("--draws", type=int, default=200000)
+    spawn_parser.set_defaults(run=bench_spawn)
+
+    batch_parser = commands.add_parser("batch", help="looped vs NumPy batch spawning and pricing")
+    batch_parser.add_argument("--catches", type=int, default=10000000)
+    batch_parser.set_defaults(run=bench_batch)
+
+    tension_parser = commands.add_parser("tension", help="scalar vs NumPy batch line tension physics")
+    tension_parser.add_argument("--instances", type=int, default=5000)
+    tension_parser.add_argument("--verify", type=int, default=200, help="instances replayed with the scalar class")
+    tension_parser.set_defaults(run=bench_tension)
+
+    inventory_parser = commands.add_parser("inventory", help="scanned vs incremental inventory index queries")
+    inventory_parser.add_argument("--sequences", type=int, default=200, help="random operation sequences to check")
+    inventory_parser.add_argument("--operations", type=int, default=300, help="operations per sequence")
+    inventory_parser.set_defaults(run=bench_inventory)
+
+    catch_memory_parser = commands.add_parser("catch-memory", help="bytes per catch: dicts vs records vs columns")
+    catch_memory_parser.add_argument("--catches", type=int, default=200000)
+    catch_memory_parser.set_defaults(run=bench_catch_memory)
+
+    bulk_sell_parser = commands.add_parser("bulk-sell", help="one-at-a-time vs single-pass bulk selling")
+    bulk_sell_parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated inventory sizes")
+    bulk_sell_parser.set_defaults(run=bench_bulk_sell)
+
+    hit_test_parser = commands.add_parser("hit-test", help="scanned vs arithmetic click hit testing")
+    hit_test_parser.add_argument("--clicks", type=int, default=20000)
+    hit_test_parser.set_defaults(run=bench_hit_test)
+
+    inventory_screen_parser = commands.add_parser("inventory-screen", help="maintained sorts and virtualized rows")
+    inventory_screen_parser.add_argument("--frames", type=int, default=300)
+    inventory_screen_parser.set_defaults(run=bench_inventory_screen)
+
+    child_parser = commands.add_parser("cold-start-child")
+    child_parser.add_argument("mode", choices=["decode", "bundle"])
+    child_parser.set_defaults(run=cold_start_child)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
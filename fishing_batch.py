@@ -0,0 +1,155 @@
+"""
+Vectorized spawning, pricing and stage physics for Monte Carlo runs
+
+NumPy versions of spawn_fish() and calculate_selling_price() that handle
+millions of catches per call. They sample from the same alias tables as
+spawn_fish(), so a batch follows exactly the same species distribution, and
+price with the same float64 arithmetic, so every price matches the scalar
+function. LineTensionBatch does the same for LineTensionStage physics, to
+evaluate thousands of hold/release policies at once. Requires NumPy; the
+game itself does not.
+
+Rarity codes index RARITY_NAMES and species indices index SPECIES, both in
+FISH_DATABASE order (the order of get_all_fish_list()), so a species index
+is also the catch's CatchRecord species id.
+"""
+
+import numpy as np
+
+from fishing_logic import BASE_PRICES, RARITY_NAMES, SIM_STEP, get_all_fish_list, get_spawn_sampler
+
+SPECIES = [(fish['name'], fish['rarity']) for fish in get_all_fish_list()]
+SPECIES_RARITY = np.array([RARITY_NAMES.index(rarity) for _, rarity in SPECIES], dtype=np.int8)
+RARITY_BASE_PRICES = np.array([BASE_PRICES[rarity] for rarity in RARITY_NAMES], dtype=np.int64)
+
+# Catches sampled per chunk, bounding the float64 temporaries to ~8 MB each
+BATCH_CHUNK = 1 << 20
+
+# NumPy copies of the alias tables, keyed like SPAWN_SAMPLERS
+BATCH_TABLES = {}
+
+def get_batch_tables(rod_luck, cheat_mode):
+    """Return (probability, alias, species index, rarity code) arrays for a sampler"""
+    key = (rod_luck, bool(cheat_mode))
+    tables = BATCH_TABLES.get(key)
+    sampler = get_spawn_sampler(rod_luck, cheat_mode)
+    if tables is None or tables[0] is not sampler:
+        species_index = {species: index for index, species in enumerate(SPECIES)}
+        outcome_species = np.array([species_index.get(outcome, -1) for outcome in sampler.outcomes], dtype=np.int16)
+        outcome_rarity = np.array([RARITY_NAMES.index(rarity) for _, rarity in sampler.outcomes], dtype=np.int8)
+        tables = BATCH_TABLES[key] = (sampler, np.array(sampler.probability), np.array(sampler.alias),
+                                      outcome_species, outcome_rarity)
+    return tables[1:]
+
+def spawn_fish_batch(n, rod_luck, cheat_mode, rng=None):
+    """Spawn n fish at once, returning (rarity codes, species indices) arrays
+
+    A species index of -1 is the "Common Fish" fallback for a rarity without
+    species, as in spawn_fish().
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    probability, alias, outcome_species, outcome_rarity = get_batch_tables(rod_luck, cheat_mode)
+    size = len(probability)
+    rarity_codes = np.empty(n, dtype=np.int8)
+    species = np.empty(n, dtype=np.int16)
+    for start in range(0, n, BATCH_CHUNK):
+        stop = min(n, start + BATCH_CHUNK)
+        value = rng.random(stop - start) * size
+        column = value.astype(np.intp)
+        outcome = np.where(value - column < probability[column], column, alias[column])
+        rarity_codes[start:stop] = outcome_rarity[outcome]
+        species[start:stop] = outcome_species[outcome]
+    return rarity_codes, species
+
+def calculate_selling_prices(rarity_codes, quality_percentages, price_cheat=False):
+    """Vectorized calculate_selling_price over arrays of rarity codes and quality scores"""
+    base_prices = RARITY_BASE_PRICES[rarity_codes]
+    if price_cheat:
+        base_prices = base_prices * 10
+    quality_multiplier = np.asarray(quality_percentages, dtype=np.float64) / 100
+    return (base_prices * quality_multiplier ** 1.5).astype(np.int64)
+
+class LineTensionBatch:
+    """N independent LineTensionStage simulations advanced together with NumPy
+
+    Follows LineTensionStage.update() operation for operation (including its
+    velocity clamp), so every instance ends with the same time_in_target and
+    score as the scalar class fed the same hold/release input. Knobs are
+    copied from a template stage; keyword overrides may be per-instance arrays.
+    """
+    KNOBS = ("bobber_y", "total_time", "gravity", "lift_force", "max_up_speed", "max_down_speed",
+             "target_square_size", "target_square_x", "target_square_y", "target_square_speed")
+
+    # Bounds hard-coded in LineTensionStage.update()
+    BOBBER_TOP = 150
+    BOBBER_BOTTOM = 550
+    TARGET_TOP = 150
+    TARGET_BOTTOM = 450
+
+    def __init__(self, n, template, window_size=(800, 600), **overrides):
+        self.n = n
+        self.window_width, self.window_height = window_size
+        for knob in self.KNOBS:
+            value = overrides.get(knob, getattr(template, knob))
+            setattr(self, knob, np.broadcast_to(np.asarray(value, dtype=np.float64), (n,)).copy())
+        self.bobber_velocity = np.zeros(n)
+        self.target_square_direction = np.ones(n)
+        self.space_held = np.zeros(n, dtype=bool)
+        self.time_in_target = np.zeros(n)
+        self.time_out_target = np.zeros(n)
+        self.elapsed_time = np.zeros(n)
+        self.score = np.zeros(n)
+        self.completed = np.zeros(n, dtype=bool)
+
+    def set_held(self, held):
+        """Apply the hold/release input the way handle_input() does"""
+        # KEYDOWN only takes effect before completion; KEYUP always does
+        self.space_held = np.where(held, self.space_held | ~self.completed, False)
+
+    def update(self, dt):
+        active = ~self.completed
+        velocity = self.bobber_velocity + np.where(self.space_held, self.lift_force * dt, self.gravity * dt)
+        velocity = np.maximum(self.max_up_speed, np.minimum(self.max_down_speed, velocity))
+        bobber_y = np.maximum(self.BOBBER_TOP, np.minimum(self.BOBBER_BOTTOM, self.bobber_y + velocity * dt))
+
+        target_y = self.target_square_y + self.target_square_direction * self.target_square_speed * dt
+        direction = self.target_square_direction
+        hit_top = target_y <= self.TARGET_TOP
+        hit_bottom = ~hit_top & (target_y >= self.TARGET_BOTTOM)
+        direction = np.where(hit_top, 1.0, np.where(hit_bottom, -1.0, direction))
+        target_y = np.where(hit_top, self.TARGET_TOP, np.where(hit_bottom, self.TARGET_BOTTOM, target_y))
+
+        bobber_x = self.window_width // 2
+        target_left = np.maximum(0, self.target_square_x)
+        target_right = np.minimum(self.window_width, self.target_square_x + self.target_square_size)
+        target_top = np.maximum(0, target_y)
+        target_bottom = np.minimum(self.window_height, target_y + self.target_square_size)
+        in_target = ((target_left <= bobber_x) & (bobber_x <= target_right) &
+                     (target_top <= bobber_y) & (bobber_y <= target_bottom))
+
+        self.bobber_velocity = np.where(active, velocity, self.bobber_velocity)
+        self.bobber_y = np.where(active, bobber_y, self.bobber_y)
+        self.target_square_direction = np.where(active, direction, self.target_square_direction)
+        self.target_square_y = np.where(active, target_y, self.target_square_y)
+        self.time_in_target = np.where(active & in_target, self.time_in_target + dt, self.time_in_target)
+        self.time_out_target = np.where(active & ~in_target, self.time_out_target + dt, self.time_out_target)
+        self.elapsed_time = np.where(active, self.elapsed_time + dt, self.elapsed_time)
+
+        finished = active & (self.elapsed_time >= self.total_time)
+        self.score = np.where(finished, self.time_in_target / self.total_time * 100, self.score)
+        self.completed = self.completed | finished
+
+    def run(self, policy, dt=SIM_STEP):
+        """Step every instance to completion, asking policy(self) for the held mask after each step"""
+        while not self.completed.all():
+            self.update(dt)
+            self.set_held(policy(self))
+        return self.time_in_target, self.score
+
+class TensionThresholdPolicy:
+    """Hold SPACE while the bobber is below the target square's centre plus an offset"""
+    def __init__(self, offsets):
+        self.offsets = np.asarray(offsets, dtype=np.float64)
+
+    def __call__(self, stages):
+        return stages.bobber_y > stages.target_square_y + stages.target_square_size / 2 + self.offsets
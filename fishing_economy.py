@@ -0,0 +1,190 @@
+"""
+Economy model for Fishing Mastery: gold per catch, gold per hour and rod payback
+
+Usage:
+    python fishing_economy.py [--samples 100000] [--sessions 500] [--seed 1]
+
+Evaluates every rod x cheat mode x skill profile. A skill profile is a
+distribution of scores for each of the four fishing stages plus the time a
+catch takes. Spawning does not depend on the scores, so the price moments
+factor over rarity:
+
+    E[price]   = sum over rarities of P(rarity) * E[price(rarity, quality)]
+    E[price^2] = sum over rarities of P(rarity) * E[price(rarity, quality)^2]
+
+P(rarity) comes straight from rarity_probabilities(). For a profile with
+fixed scores the quality is fixed too and the result is exact (closed form);
+otherwise the quality term is averaged over NumPy samples of the profile.
+Time to earn the price of each rod in ROD_UPGRADES from 0 gold (selling every
+catch; the starting gold already covers the Novice Rod, which would hide its
+payback) is given both from the expected rate and as the median of sampled
+sessions, since rare high-value fish make the mean optimistic. Requires NumPy.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import fishing_batch as batch
+from fishing_logic import GameData, ROD_UPGRADES, calculate_quality, rarity_probabilities
+
+# ============================================================================
+# Skill Profiles
+# ============================================================================
+
+class SkillProfile:
+    """Per-stage score distributions (mean, stdev) and seconds per catch of a kind of player"""
+    def __init__(self, name, stage_scores, seconds_per_catch):
+        self.name = name
+        self.stage_scores = stage_scores  # [(mean, stdev)] for cast, depth, bite, reeling
+        self.seconds_per_catch = seconds_per_catch
+
+    @property
+    def deterministic(self):
+        return all(stdev == 0 for _, stdev in self.stage_scores)
+
+    def quality_score(self):
+        """Quality score of a profile with fixed stage scores"""
+        return sum(mean for mean, _ in self.stage_scores) / len(self.stage_scores)
+
+    def sample_quality(self, n, rng):
+        """Sample n quality scores: the mean of normal stage scores clipped to 0-100"""
+        means = np.array([mean for mean, _ in self.stage_scores])
+        stdevs = np.array([stdev for _, stdev in self.stage_scores])
+        scores = np.clip(rng.normal(means, stdevs, (n, len(means))), 0, 100)
+        return scores.mean(axis=1)
+
+# Stage score distributions measured with the fishing_sim.py policies of the
+# same names; seconds per catch adds the casting screen, fish display and
+# menu clicks to the ~2.5-3 s the stages take
+SKILL_PROFILES = [
+    SkillProfile("perfect", [(49.0, 0), (99.5, 0), (99.2, 0), (100.0, 0)], 5.0),
+    SkillProfile("expert", [(49.4, 2.1), (96.7, 2.4), (81.5, 3.0), (96.8, 6.1)], 6.0),
+    SkillProfile("average", [(49.0, 5.0), (92.1, 5.8), (74.8, 5.0), (90.7, 10.2)], 8.0),
+    SkillProfile("novice", [(49.3, 15.4), (76.3, 18.0), (51.9, 19.4), (70.4, 16.3)], 10.0),
+]
+
+CHEAT_MODES = [("none", False, False), ("rarity", True, False), ("price", False, True), ("both", True, True)]
+
+# ============================================================================
+# Economy Model
+# ============================================================================
+
+def quality_pool(profile, samples, rng):
+    """Quality scores to average over: the exact score, or samples of the profile"""
+    if profile.deterministic:
+        return np.array([profile.quality_score()])
+    return profile.sample_quality(samples, rng)
+
+def rarity_price_moments(qualities, price_cheat):
+    """Return {rarity: (E[price], E[price^2])} over the quality pool"""
+    moments = {}
+    for code, rarity in enumerate(batch.RARITY_NAMES):
+        codes = np.full(len(qualities), code, dtype=np.int8)
+        prices = batch.calculate_selling_prices(codes, qualities, price_cheat).astype(np.float64)
+        moments[rarity] = (prices.mean(), (prices ** 2).mean())
+    return moments
+
+def price_moments(rod_luck, cheat_mode, moments):
+    """Return (mean, variance) of the price of one catch"""
+    first = second = 0.0
+    for rarity, chance in rarity_probabilities(rod_luck, cheat_mode).items():
+        first += chance * moments[rarity][0]
+        second += chance * moments[rarity][1]
+    return first, second - first ** 2
+
+def sample_catches_to_afford(gold_needed, qualities, rod_luck, cheat_mode, price_cheat, sessions, rng,
+                             chunk=64, max_catches=100000):
+    """Median number of catches sampled sessions need to earn gold_needed (inf if not reached)"""
+    if gold_needed <= 0:
+        return 0
+    gold = np.zeros(sessions)
+    catches = np.full(sessions, np.inf)
+    done = 0
+    while np.isinf(catches).any() and done < max_catches:
+        rarity_codes, _ = batch.spawn_fish_batch(sessions * chunk, rod_luck, cheat_mode, rng)
+        sampled_qualities = qualities[rng.integers(0, len(qualities), sessions * chunk)]
+        prices = batch.calculate_selling_prices(rarity_codes, sampled_qualities, price_cheat)
+        running = gold[:, None] + np.cumsum(prices.reshape(sessions, chunk), axis=1)
+        reached = running >= gold_needed
+        first = reached.argmax(axis=1)
+        newly_done = np.isinf(catches) & reached.any(axis=1)
+        catches[newly_done] = done + first[newly_done] + 1
+        gold = running[:, -1]
+        done += chunk
+    return float(np.median(catches))
+
+def evaluate(profile, rod, cheat_mode, price_cheat, qualities, moments, sessions, rng):
+    """Economy figures for one profile fishing with one rod under one cheat mode"""
+    game_data = GameData()
+    rod_luck = game_data.rod_luck[rod]
+    mean, variance = price_moments(rod_luck, cheat_mode, moments)
+    catches_per_hour = 3600 / profile.seconds_per_catch
+
+    result = {
+        'profile': profile.name, 'rod': rod, 'cheat_mode': cheat_mode, 'price_cheat': price_cheat,
+        'closed_form': profile.deterministic, 'gold_per_catch': mean, 'stdev_per_catch': variance ** 0.5,
+        'gold_per_hour': mean * catches_per_hour, 'stdev_per_hour': (variance * catches_per_hour) ** 0.5,
+        'typical_quality': calculate_quality([float(np.median(qualities))]),
+    }
+    for target, upgrade in ROD_UPGRADES.items():
+        gold_needed = upgrade["price"]
+        mean_catches = gold_needed / mean if mean else float("inf")
+        median_catches = sample_catches_to_afford(gold_needed, qualities, rod_luck, cheat_mode, price_cheat,
+                                                  sessions, rng)
+        result[f'hours_to_{target}'] = mean_catches / catches_per_hour
+        result[f'median_hours_to_{target}'] = median_catches / catches_per_hour
+    return result
+
+def evaluate_grid(profiles=SKILL_PROFILES, samples=100000, sessions=500, seed=1):
+    """Evaluate every rod x cheat mode x skill profile"""
+    rng = np.random.default_rng(seed)
+    results = []
+    for profile in profiles:
+        # Quality does not depend on rod or cheat mode: sample it once per profile
+        qualities = quality_pool(profile, samples, rng)
+        moments = {price_cheat: rarity_price_moments(qualities, price_cheat) for price_cheat in (False, True)}
+        for rod in GameData().rod_luck:
+            for _, cheat_mode, price_cheat in CHEAT_MODES:
+                results.append(evaluate(profile, rod, cheat_mode, price_cheat, qualities,
+                                        moments[price_cheat], sessions, rng))
+    return results
+
+def format_hours(hours):
+    if hours == float("inf"):
+        return "never"
+    if hours < 1 / 60:
+        return f"{hours * 3600:.0f}s"
+    if hours < 1:
+        return f"{hours * 60:.1f}m"
+    return f"{hours:.1f}h"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fishing Mastery economy model")
+    parser.add_argument("--samples", type=int, default=100000, help="quality samples per sampled profile")
+    parser.add_argument("--sessions", type=int, default=500, help="sampled sessions per rod payback")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = evaluate_grid(samples=args.samples, sessions=args.sessions, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    cheat_names = {(cheat_mode, price_cheat): name for name, cheat_mode, price_cheat in CHEAT_MODES}
+    targets = list(ROD_UPGRADES)
+    print(f"{'profile':<9}{'rod':<12}{'cheat':<8}{'gold/catch':>12}{'stdev':>10}{'gold/hour':>13}"
+          + "".join(f"{target + ' (mean/median)':>26}" for target in targets))
+    for result in results:
+        cheat = cheat_names[result['cheat_mode'], result['price_cheat']]
+        marker = "*" if result['closed_form'] else " "
+        paybacks = "".join(f"{format_hours(result[f'hours_to_{target}']) + ' / ' + format_hours(result[f'median_hours_to_{target}']):>26}"
+                           for target in targets)
+        print(f"{result['profile']:<9}{result['rod']:<12}{cheat:<8}{result['gold_per_catch']:>11,.0f}{marker}"
+              f"{result['stdev_per_catch']:>10,.0f}{result['gold_per_hour']:>13,.0f}{paybacks}")
+    print(f"\n* closed form   {len(results)} combinations in {elapsed * 1000:.0f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
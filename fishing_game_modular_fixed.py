@@ -7,18 +7,34 @@ Based on structured implementation plan with 5-stage fishing process,
 rod upgrades, and rarity system
 """
 
+import argparse
 import pygame
 import random
 import math
 import time
+import os
+import io
+import json
+import mmap
+import struct
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Game rules live in fishing_logic so they import without pygame/SDL
+from fishing_logic import (
+    GameData, FISH_DATABASE, RARITY_CHANCES_NORMAL, RARITY_CHANCES_CHEAT, BASE_PRICES,
+    ROD_UPGRADES, calculate_quality, spawn_fish, get_all_fish_list, get_missing_fish_counts,
+    get_caught_species, calculate_selling_price, purchase_rod, create_caught_fish, store_caught_fish,
+    RARITY_NAMES, sell_catches, sale_value, rarity_filter, below_quality_filter, all_but_best_filter,
+    SIM_STEP, SimulationClock, FixedTimestep, stage_parameters, load_stage_parameters,
+    apply_stage_parameters, STAGE_PARAMETERS_PATH
+)
+from fishing_replay import InputRecorder, InputReplayer, FrameTimings
 
 # ============================================================================
 # PHASE 1: PROJECT FOUNDATION - Constants and Game States
 # ============================================================================
 
-# Initialize Pygame
-pygame.init()
-
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -41,6 +57,9 @@ WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 FPS = 60
 
+# Debug output (cache statistics etc.) - enable with FISHING_DEBUG=1
+DEBUG = os.environ.get("FISHING_DEBUG") == "1"
+
 class GameState:
     MAIN_MENU = "main_menu"
     GUIDE = "guide"
@@ -53,23 +72,199 @@ class GameState:
     FISH_INDEX = "fish_index"
 
 # ============================================================================
-# PHASE 1: PROJECT FOUNDATION - Game Data and Button Class
+# PHASE 1: PROJECT FOUNDATION - Fonts and Text Rendering
 # ============================================================================
 
-class GameData:
-    def __init__(self):
-        self.gold = 5000  # Starting gold (updated for new economy)
-        self.current_rod = "Basic Rod"
-        self.rod_luck = {"Basic Rod": 0, "Novice Rod": 20, "Master Rod": 45}
-        self.cheat_mode = False
-        self.price_cheat = False  # New cheat for increased prices
-        self.caught_fish = None
-        self.cheat_buffer = ""
-        self.fullscreen = False  # Fullscreen mode flag
-        self.background = None  # Background image path
-        # Inventory system
-        self.inventory = []  # List to store caught fish
-        self.inventory_capacity = 20  # Maximum inventory capacity
+# Fonts are created once per size and shared by every screen
+FONTS = {}
+
+def get_font(size):
+    """Return the shared default font of the given size"""
+    if size not in FONTS:
+        FONTS[size] = pygame.font.Font(None, size)
+    return FONTS[size]
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, antialias, color).
+
+    Static UI text renders once and is blitted from the cache afterwards;
+    dynamic strings (gold, timers) only render again when their text changes.
+    The least recently used surfaces are evicted beyond max_entries.
+    """
+
+    def __init__(self, max_entries=512):
+        self.surfaces = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        key = (font, text, antialias, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def hit_ratio(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Return cache counters for debug output"""
+        return {"entries": len(self.surfaces), "hits": self.hits, "misses": self.misses,
+                "hit_ratio": round(self.hit_ratio(), 3)}
+
+TEXT_CACHE = TextCache()
+
+def render_text(font, text, antialias, color):
+    """Render text through the shared text cache (same arguments as Font.render)"""
+    return TEXT_CACHE.render(font, text, antialias, color)
+
+def get_debug_lines():
+    """Cache statistics shown by the F3 debug overlay"""
+    return [
+        f"Text cache: {len(TEXT_CACHE.surfaces)} surfaces, {TEXT_CACHE.hit_ratio():.1%} hits",
+        f"Background cache: {BACKGROUND_CACHE.stats()}",
+        f"Fish variants: {FISH_VARIANTS.stats()}",
+        f"Static layers: {STATIC_LAYERS.stats()}",
+        f"Renderer: {RENDERER.stats()}",
+    ]
+
+def draw_debug_overlay(screen, font):
+    """Draw cache statistics in the bottom left corner"""
+    lines = get_debug_lines()
+    y_offset = WINDOW_HEIGHT - 25 * len(lines) - 5
+    area = pygame.Rect(0, y_offset, WINDOW_WIDTH, WINDOW_HEIGHT - y_offset)
+    for line in lines:
+        # Rendered directly so the ever-changing counters do not churn the text cache
+        screen.blit(font.render(line, True, RED), (10, y_offset))
+        y_offset += 25
+    RENDERER.track("debug_overlay", area, tuple(lines))
+
+# ============================================================================
+# PHASE 1: PROJECT FOUNDATION - Dirty Rectangle Rendering
+# ============================================================================
+
+class DirtyRectRenderer:
+    """Presents frames by pushing only the screen regions that changed.
+
+    Screens are still drawn in full into the display surface each frame, but
+    only changed regions are sent to the display. Draw code reports its moving
+    or changing elements with track(name, rect, value) (or blit() for text);
+    an element is dirty when its rect or value differs from the last frame,
+    and both its old and new rects are pushed. A change of scene key (state,
+    stage, background, ...) or invalidate() pushes the whole frame once, so
+    static screens push zero pixels afterwards. Mode "full" flips every frame.
+    """
+
+    MODES = ("dirty", "full")
+
+    def __init__(self, mode="dirty"):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown renderer mode: {mode}")
+        self.mode = mode
+        self.previous = {}  # element name -> (rect, value) of the last frame
+        self.current = {}
+        self.dirty = []
+        self.scene_key = None
+        self.full_redraw = True
+        self.frame_pixels = 0
+        self.frames = 0
+        self.total_pixels = 0
+
+    def begin_frame(self, scene_key):
+        if scene_key != self.scene_key:
+            self.scene_key = scene_key
+            self.full_redraw = True
+        self.current = {}
+        self.dirty = []
+
+    def invalidate(self):
+        """Push the whole frame next time"""
+        self.full_redraw = True
+
+    def track(self, name, rect, value=None):
+        """Report a dynamic element drawn this frame"""
+        rect = pygame.Rect(rect)
+        self.current[name] = (rect, value)
+        previous = self.previous.get(name)
+        if previous is None:
+            self.dirty.append(rect)
+        elif previous[0] != rect or previous[1] != value:
+            self.dirty.append(rect)
+            self.dirty.append(previous[0])
+
+    def blit(self, screen, name, surface, position):
+        """Blit a dynamic surface (e.g. cached text) and track it by identity"""
+        rect = screen.blit(surface, position)
+        self.track(name, rect, surface)
+        return rect
+
+    def end_frame(self):
+        """Push this frame to the display"""
+        # Elements drawn last frame but not this one must be erased
+        for name, (rect, value) in self.previous.items():
+            if name not in self.current:
+                self.dirty.append(rect)
+        self.previous = self.current
+
+        screen = pygame.display.get_surface()
+        if self.mode == "full" or self.full_redraw:
+            pygame.display.flip()
+            self.frame_pixels = screen.get_width() * screen.get_height()
+            self.full_redraw = False
+        else:
+            screen_rect = screen.get_rect()
+            rects = [rect.clip(screen_rect) for rect in self.dirty]
+            rects = [rect for rect in rects if rect.width and rect.height]
+            if rects:
+                pygame.display.update(rects)
+            self.frame_pixels = sum(rect.width * rect.height for rect in rects)
+        self.frames += 1
+        self.total_pixels += self.frame_pixels
+
+    def stats(self):
+        """Return renderer counters for debug output"""
+        return {"mode": self.mode, "frame_pixels": self.frame_pixels,
+                "avg_pixels": self.total_pixels // max(1, self.frames)}
+
+# Set FISHING_RENDERER=full to flip the whole screen every frame
+RENDERER = DirtyRectRenderer(os.environ.get("FISHING_RENDERER", "dirty"))
+
+# Events after which the window contents must be pushed again in full
+WINDOW_EXPOSE_EVENTS = (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE)
+
+def handle_window_exposure(events):
+    """Push the whole screen next frame if the window was uncovered or restored"""
+    for event in events:
+        if event.type in WINDOW_EXPOSE_EVENTS:
+            RENDERER.invalidate()
+
+# ============================================================================
+# PHASE 1: PROJECT FOUNDATION - Button Class
+# ============================================================================
+
+MENU_BUTTON_SIZE = (150, 40)
+
+def fit_image_size(image_size, box_size):
+    """Scale image_size to fit box_size while maintaining the aspect ratio"""
+    original_width, original_height = image_size
+    width, height = box_size
+    aspect_ratio = original_width / original_height
+
+    # Calculate scaled dimensions to fit within button size
+    if aspect_ratio > 1:  # Landscape orientation
+        return width, int(width / aspect_ratio)
+    # Portrait orientation
+    return int(height * aspect_ratio), height
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color, font, image_path=None):
@@ -90,21 +285,12 @@ class Button:
         # Load image if provided
         if image_path:
             try:
-                self.image = pygame.image.load(image_path)
-                # Scale image to fit button size while maintaining aspect ratio
-                original_width, original_height = self.image.get_size()
-                aspect_ratio = original_width / original_height
-
-                # Calculate scaled dimensions to fit within button size
-                if aspect_ratio > 1:  # Landscape orientation
-                    scaled_width = width
-                    scaled_height = int(width / aspect_ratio)
-                else:  # Portrait orientation
-                    scaled_height = height
-                    scaled_width = int(height * aspect_ratio)
-
-                # Scale the image
-                self.image = pygame.transform.scale(self.image, (scaled_width, scaled_height))
+                # Prescaled icons come straight from the asset bundle
+                self.image = get_bundled_image(image_path, (width, height))
+                if self.image is None:
+                    self.image = load_image(image_path)
+                    # Scale image to fit button size while maintaining aspect ratio
+                    self.image = pygame.transform.scale(self.image, fit_image_size(self.image.get_size(), (width, height)))
                 self.image_rect = self.image.get_rect(center=self.rect.center)
             except:
                 # If image loading fails, fall back to text
@@ -121,12 +307,13 @@ class Button:
 
     def draw(self, screen):
         # Draw button background only if no image
+        RENDERER.track(f"button:{self.text}", self.rect, self.is_hovered)
         if not self.image:
             color = self.hover_color if self.is_hovered else self.color
             pygame.draw.rect(screen, color, self.rect)
             pygame.draw.rect(screen, BLACK, self.rect, 2)
             # Fall back to text if no image
-            text_surface = self.font.render(self.text, True, BLACK)
+            text_surface = render_text(self.font, self.text, True, BLACK)
             text_rect = text_surface.get_rect(center=self.rect.center)
             screen.blit(text_surface, text_rect)
         else:
@@ -137,153 +324,143 @@ class Button:
                 pygame.draw.rect(screen, BLACK, self.rect, 2)
 
 # ============================================================================
-# PHASE 6: Quality and Rarity Systems - Fish Database and Spawning
+# PHASE 1: PROJECT FOUNDATION - Screen Layout and Hit Testing
 # ============================================================================
 
-# Fish Database - FIXED: Separated fish names properly
-FISH_DATABASE = {
-    "Common": ["Cod", "Carp", "Minnow", "Perch", "Sunfish", "Tilapia", "Catfish", 
-               "Goldfish", "Bluegill", "Troutlet"],
-    "Uncommon": ["Rainbow Trout", "Bass", "Pike", "Mackerel", "Flounder", 
-                "Walleye", "Rockfish", "Perch King", "Small Snapper", "Eel"],
-    "Rare": ["Salmon", "Swordfish", "Barracuda", "Marlin", "Bluefin Tuna",
-             "Sturgeon", "Grouper", "Lionfish", "Golden Trout", "Red Snapper"],
-    "Epic": ["Anglerfish", "Giant Catfish", "Ocean Sunfish", "Tarpon",
-             "King Mackerel", "Giant Salmon", "Peacock Bass", "Rainbow Marlin",
-             "Electric Eel", "Swordfin"],
-    "Legendary": ["Kraken Carp", "Mythical Koi", "Leviathan Cod", "Golden Barracuda",
-                  "Celestial Tuna", "Phantom Marlin", "Titan Sturgeon", "Dragonfish",
-                  "Aurora Salmon", "Poseidon's Pike"],
-    "Mythic": ["Abyssal Leviathan", "Celestial Megalodon", "Void Kraken"]
-}
-
-# Rarity Chances - Enhanced to include accessible mythic fish
-RARITY_CHANCES_NORMAL = {"Common": 0.60, "Uncommon": 0.20, "Rare": 0.12, "Epic": 0.05, "Legendary": 0.025, "Mythic": 0.005}
-RARITY_CHANCES_CHEAT = {"Legendary": 0.50, "Epic": 0.25, "Uncommon": 0.15, "Common": 0.05, "Rare": 0.04, "Mythic": 0.01}
-
-# Base Prices - SIGNIFICANTLY INCREASED
-BASE_PRICES = {"Common": 100, "Uncommon": 500, "Rare": 2000, "Epic": 10000, "Legendary": 50000, "Mythic": 500000}
-
-def calculate_quality(stage_scores):
-    """Calculate fish quality based on stage scores"""
-    quality = sum(stage_scores) / len(stage_scores)
-    
-    if quality >= 95:
-        return "Perfect"
-    elif quality >= 80:
-        return "Great"
-    elif quality >= 60:
-        return "Good"
-    elif quality >= 40:
-        return "Fair"
-    else:
-        return "Poor"
-
-def spawn_fish(rod_luck, cheat_mode):
-    """Spawn a fish based on rarity probabilities"""
-    base_chances = RARITY_CHANCES_CHEAT if cheat_mode else RARITY_CHANCES_NORMAL
-    
-    # Adjust probabilities based on rod luck (excluding Mythic which is fixed at 0.5%)
-    luck_bonus = rod_luck / 1000
-    adjusted_chances = {}
-    
-    for rarity, chance in base_chances.items():
-        if rarity == "Mythic":
-            adjusted_chances[rarity] = max(0.002, chance + luck_bonus * 0.5)  # Enhanced mythic chances
-        elif rarity in ["Rare", "Epic", "Legendary"]:
-            adjusted_chances[rarity] = min(0.8, chance + luck_bonus)
-        else:
-            adjusted_chances[rarity] = max(0.01, chance - luck_bonus * 0.5)
-    
-    # Normalize probabilities
-    total = sum(adjusted_chances.values())
-    for rarity in adjusted_chances:
-        adjusted_chances[rarity] /= total
-    
-    # Select rarity
-    random_value = random.random()
-    cumulative = 0
-    selected_rarity = "Common"
-    for rarity, chance in adjusted_chances.items():
-        cumulative += chance
-        if random_value <= cumulative:
-            selected_rarity = rarity
-            break
-    
-    # Select specific fish from rarity - ADDED BOUNDS CHECKING
-    if selected_rarity in FISH_DATABASE and FISH_DATABASE[selected_rarity]:
-        fish_name = random.choice(FISH_DATABASE[selected_rarity])
-    else:
-        fish_name = "Common Fish"  # Fallback
-    
-    return {"name": fish_name, "rarity": selected_rarity}
-
-def get_all_fish_list():
-    """Get a list of all fish in the database"""
-    all_fish = []
-    for rarity in FISH_DATABASE:
-        for fish_name in FISH_DATABASE[rarity]:
-            all_fish.append({
-                'name': fish_name,
-                'rarity': rarity
-            })
-    return all_fish
-
-def get_missing_fish_counts(inventory):
-    """Count missing fish by rarity class"""
-    caught_fish_names = {fish['info']['name'] for fish in inventory}
-    missing_counts = {}
-
-    for rarity in FISH_DATABASE:
-        total_in_rarity = len(FISH_DATABASE[rarity])
-        caught_in_rarity = sum(1 for fish in inventory if fish['info']['rarity'] == rarity and fish['info']['name'] in FISH_DATABASE[rarity])
-        missing_counts[rarity] = total_in_rarity - caught_in_rarity
-
-    return missing_counts
-
-
-def calculate_selling_price(fish_rarity, quality_percentage, game_data=None):
-    """Calculate selling price based on fish rarity and quality"""
-    if fish_rarity not in BASE_PRICES:
-        fish_rarity = "Common"  # Fallback for unknown rarities
-
-    base_price = BASE_PRICES[fish_rarity]
-    quality_multiplier = quality_percentage / 100
+class RowLayout:
+    """Geometry of a list of fixed-pitch rows, shared by the draw and hit-test code
+
+    Row i is drawn at top + i * pitch. A point hits row i when it lies between
+    left and right and within hit_top..hit_bottom pixels of the row's y, so
+    finding the row under a click is one division at any list size. The hit
+    band must be shorter than the pitch.
+    """
+    def __init__(self, top, pitch, left, right, hit_top, hit_bottom):
+        self.top = top
+        self.pitch = pitch
+        self.left = left
+        self.right = right
+        self.hit_top = hit_top
+        self.hit_bottom = hit_bottom
+
+    def row_y(self, index, scroll=0):
+        """Screen y of row index"""
+        return self.top + index * self.pitch - scroll
+
+    def visible_rows(self, count, top, bottom, scroll=0):
+        """Range of rows whose hit band reaches into screen y top..bottom (exclusive)"""
+        first = max(0, -((self.top + self.hit_bottom - top - scroll) // self.pitch))
+        last = min(count, -((self.top + self.hit_top - bottom - scroll) // self.pitch))
+        return range(first, max(first, last))
+
+    def row_at(self, pos, count, scroll=0):
+        """Index of the row of a count-row list under pos, or None"""
+        x, y = pos
+        if not self.left <= x <= self.right:
+            return None
+        index, offset = divmod(y + scroll - self.top - self.hit_top, self.pitch)
+        if 0 <= index < count and offset <= self.hit_bottom - self.hit_top:
+            return index
+        return None
 
-    # Apply 10x multiplier if price cheat is active
-    if game_data and game_data.price_cheat:
-        base_price *= 10
+class GridLayout:
+    """Geometry of a grid of fixed-size cells, shared by the draw and hit-test code
+
+    Cell i sits in row i // columns and column i % columns. Each cell is
+    cell_width x cell_height, and cells repeat every column_pitch and row_pitch
+    pixels, so the gaps between cells hit nothing.
+    """
+    def __init__(self, left, top, columns, cell_width, cell_height, column_pitch, row_pitch):
+        self.left = left
+        self.top = top
+        self.columns = columns
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.column_pitch = column_pitch
+        self.row_pitch = row_pitch
+
+    def row_count(self, count):
+        return (count + self.columns - 1) // self.columns
+
+    def bottom(self, count, scroll=0):
+        """Screen y just below the last row of cells"""
+        rows = self.row_count(count)
+        height = (rows - 1) * self.row_pitch + self.cell_height if rows else 0
+        return self.top + height - scroll
+
+    def visible_rows(self, count, top, bottom, scroll=0):
+        """Range of rows whose cells reach into screen y top..bottom"""
+        first = max(0, (top + scroll - self.top - self.cell_height) // self.row_pitch + 1)
+        last = min(self.row_count(count), -((self.top - bottom - scroll) // self.row_pitch))
+        return range(first, max(first, last))
+
+    def cell_position(self, index, scroll=0):
+        """Screen position of the top-left corner of cell index"""
+        row, column = divmod(index, self.columns)
+        return self.left + column * self.column_pitch, self.top + row * self.row_pitch - scroll
+
+    def cell_at(self, pos, count, scroll=0):
+        """Index of the cell of a count-cell grid under pos, or None"""
+        x, y = pos
+        column, cell_x = divmod(x - self.left, self.column_pitch)
+        row, cell_y = divmod(y + scroll - self.top, self.row_pitch)
+        if 0 <= column < self.columns and row >= 0 and cell_x < self.cell_width and cell_y < self.cell_height:
+            index = row * self.columns + column
+            if index < count:
+                return index
+        return None
 
-    return int(base_price * (quality_multiplier ** 1.5))
+# Inventory rows: text at y 140, 180, ...; a click selects a row from 5 px
+# above its text to 25 px below, between x 50 and 600
+INVENTORY_ROWS = RowLayout(top=140, pitch=40, left=50, right=600, hit_top=-5, hit_bottom=25)
+INVENTORY_HEADER_Y = 100
+INVENTORY_COLUMNS = (50, 250, 400, 550)  # Name, rarity, quality, price
 
 # ============================================================================
 # PHASE 4: Shop System - Rod Upgrades
 # ============================================================================
 
-# Rod Upgrades - UPDATED PRICES FOR NEW ECONOMY
-ROD_UPGRADES = {
-    "Novice Rod": {"price": 5000, "luck": 20},
-    "Master Rod": {"price": 50000, "luck": 45}
-}
-
 def handle_shop_purchase(events, current_rod, gold):
     """Handle rod purchases in shop"""
     for event in events:
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_1 and current_rod != "Novice Rod":
-                if gold >= ROD_UPGRADES["Novice Rod"]["price"]:
-                    return "Novice Rod", gold - ROD_UPGRADES["Novice Rod"]["price"]
-            elif event.key == pygame.K_2 and current_rod != "Master Rod":
-                if gold >= ROD_UPGRADES["Master Rod"]["price"]:
-                    return "Master Rod", gold - ROD_UPGRADES["Master Rod"]["price"]
+            if event.key == pygame.K_1:
+                new_rod, new_gold = purchase_rod("Novice Rod", current_rod, gold)
+            elif event.key == pygame.K_2:
+                new_rod, new_gold = purchase_rod("Master Rod", current_rod, gold)
+            else:
+                continue
+            if new_rod != current_rod:
+                return new_rod, new_gold
     return current_rod, gold
 
 # ============================================================================
 # PHASE 5: Core Fishing Mechanics - Enhanced All 5 Fishing Stages
 # ============================================================================
 
-class CastTimingStage:
-    def __init__(self):
+# Game time shared by every stage and timer. main() advances it in fixed
+# SIM_STEP increments; headless runs can pass each stage their own clock.
+SIM_CLOCK = SimulationClock()
+
+class StageInterpolation:
+    """Draw positions between the last two simulation steps for smooth motion"""
+    render_alpha = 1.0
+
+    def remember(self, *names):
+        """Record attribute values before a step so draw() can interpolate them"""
+        self.previous_values = {name: getattr(self, name) for name in names}
+
+    def interpolated(self, name):
+        current = getattr(self, name)
+        previous = getattr(self, "previous_values", {}).get(name)
+        if previous is None:
+            return current
+        return previous + (current - previous) * self.render_alpha
+
+class CastTimingStage(StageInterpolation):
+    def __init__(self, clock=None, parameters=None):
+        self.clock = clock or SIM_CLOCK
+        knobs = stage_parameters("CastTimingStage", parameters)
         self.marker_x = 0
         self.marker_direction = 1
         self.bar_width = 600
@@ -294,10 +471,11 @@ class CastTimingStage:
         self.stage_time = 0
         
         # ENHANCED DIFFICULTY: Tighter timing windows, faster indicators
-        self.marker_speed = 300  # Increased from 250 to 300 px/s
-        self.target_zone_size = 0.10  # Reduced from 0.15 to 0.10 (tighter timing)
+        self.marker_speed = knobs["marker_speed"]
+        self.target_zone_size = knobs["target_zone_size"]
         
     def update(self, dt):
+        self.remember("marker_x")
         if not self.completed:
             self.marker_x += self.marker_direction * self.marker_speed * dt
             if self.marker_x >= self.bar_width or self.marker_x <= 0:
@@ -323,32 +501,36 @@ class CastTimingStage:
         pygame.draw.rect(screen, GREEN, (self.bar_x + target_start, self.bar_y, target_end - target_start, 20))
         
         # Draw moving marker
-        marker_x = self.bar_x + self.marker_x
+        marker_x = self.bar_x + self.interpolated("marker_x")
         pygame.draw.rect(screen, RED, (marker_x - 5, self.bar_y - 5, 10, 30))
+        RENDERER.track("cast_marker", (marker_x - 5, self.bar_y - 5, 10, 30), int(marker_x))
         
         # Instructions
-        instruction = font.render("Stage 1: CAST TIMING - Press SPACE when marker is in green zone!", True, BLACK)
+        instruction = render_text(font, "Stage 1: CAST TIMING - Press SPACE when marker is in green zone!", True, BLACK)
         screen.blit(instruction, (50, 350))
         
         if self.completed:
-            score_text = font.render(f"Cast Score: {self.score}", True, BLACK)
-            screen.blit(score_text, (50, 430))
+            score_text = render_text(font, f"Cast Score: {self.score}", True, BLACK)
+            RENDERER.blit(screen, "stage_score", score_text, (50, 430))
 
-class DepthControlStage:
-    def __init__(self):
+class DepthControlStage(StageInterpolation):
+    def __init__(self, clock=None, parameters=None):
+        self.clock = clock or SIM_CLOCK
+        knobs = stage_parameters("DepthControlStage", parameters)
         self.marker_y = 0
         self.marker_direction = 1
         # ENHANCED DIFFICULTY: Smaller sweet spot, more sensitive
-        self.ideal_zone_start = 235  # Tightened from 220-260 to 235-265
-        self.ideal_zone_end = 265
+        self.ideal_zone_start = knobs["ideal_zone_start"]
+        self.ideal_zone_end = knobs["ideal_zone_end"]
         self.score = 0
         self.completed = False
         self.bar_height = 400
         self.bar_x = 150
         self.bar_y = 150
-        self.marker_speed = 180  # Increased from 150
+        self.marker_speed = knobs["marker_speed"]
         
     def update(self, dt):
+        self.remember("marker_y")
         if not self.completed:
             self.marker_y += self.marker_direction * self.marker_speed * dt
             if self.marker_y >= self.bar_height or self.marker_y <= 0:
@@ -375,33 +557,36 @@ class DepthControlStage:
         pygame.draw.rect(screen, GREEN, (self.bar_x - 5, ideal_y, 30, self.ideal_zone_end - self.ideal_zone_start))
         
         # Draw moving marker
-        marker_y = self.bar_y + self.marker_y
+        marker_y = self.bar_y + self.interpolated("marker_y")
         pygame.draw.circle(screen, RED, (self.bar_x + 10, marker_y), 8)
+        RENDERER.track("depth_marker", (self.bar_x + 2, marker_y - 8, 17, 17), int(marker_y))
         
         # Instructions
-        instruction = font.render("Stage 2: DEPTH CONTROL - Press SPACE when marker is in green zone!", True, BLACK)
+        instruction = render_text(font, "Stage 2: DEPTH CONTROL - Press SPACE when marker is in green zone!", True, BLACK)
         screen.blit(instruction, (50, 100))
         
         if self.completed:
-            score_text = font.render(f"Depth Score: {int(self.score)}", True, BLACK)
-            screen.blit(score_text, (50, 450))
+            score_text = render_text(font, f"Depth Score: {int(self.score)}", True, BLACK)
+            RENDERER.blit(screen, "stage_score", score_text, (50, 450))
 
-class BiteReactionStage:
-    def __init__(self):
+class BiteReactionStage(StageInterpolation):
+    def __init__(self, clock=None, parameters=None):
+        self.clock = clock or SIM_CLOCK
+        knobs = stage_parameters("BiteReactionStage", parameters)
         # ENHANCED DIFFICULTY: Faster bites, shorter reaction window
-        self.bite_time = time.time() + random.uniform(1.0, 2.5)  # Reduced from 1.5-3.5 to 1.0-2.5
+        self.bite_time = self.clock.now + random.uniform(1.0, 2.5)  # Reduced from 1.5-3.5 to 1.0-2.5
         self.bite_triggered = False
         self.reaction_start = 0
         self.score = 0
         self.completed = False
         self.show_waiting = True
-        self.reaction_window = 0.6  # Reduced from 0.8 to 0.6
+        self.reaction_window = knobs["reaction_window"]
         
     def update(self, dt):
         if not self.completed and not self.bite_triggered:
-            if time.time() >= self.bite_time:
+            if self.clock.now >= self.bite_time:
                 self.bite_triggered = True
-                self.reaction_start = time.time()
+                self.reaction_start = self.clock.now
                 self.show_waiting = False
     
     def handle_input(self, events):
@@ -409,7 +594,7 @@ class BiteReactionStage:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                 if not self.completed:
                     if self.bite_triggered:
-                        reaction_time = time.time() - self.reaction_start
+                        reaction_time = self.clock.now - self.reaction_start
                         if reaction_time <= self.reaction_window:
                             self.score = max(0, 100 - (reaction_time * 100))  # More punishing
                         else:
@@ -421,28 +606,30 @@ class BiteReactionStage:
         return False
     
     def draw(self, screen, font):
-        instruction = font.render("Stage 3: BITE REACTION - Wait for fish bite, then press SPACE!", True, BLACK)
+        instruction = render_text(font, "Stage 3: BITE REACTION - Wait for fish bite, then press SPACE!", True, BLACK)
         screen.blit(instruction, (50, 200))
         
         if self.show_waiting:
-            waiting_text = font.render("Waiting for fish bite...", True, ORANGE)
-            screen.blit(waiting_text, (50, 250))
+            waiting_text = render_text(font, "Waiting for fish bite...", True, ORANGE)
+            RENDERER.blit(screen, "bite_waiting", waiting_text, (50, 250))
         
         if self.bite_triggered and not self.completed:
-            bite_text = font.render("FISH BITES! Press SPACE NOW!", True, RED)
-            screen.blit(bite_text, (50, 300))
+            bite_text = render_text(font, "FISH BITES! Press SPACE NOW!", True, RED)
+            RENDERER.blit(screen, "bite_alert", bite_text, (50, 300))
         
         if self.completed:
-            score_text = font.render(f"Reaction Score: {int(self.score)}", True, BLACK)
-            screen.blit(score_text, (50, 350))
+            score_text = render_text(font, f"Reaction Score: {int(self.score)}", True, BLACK)
+            RENDERER.blit(screen, "stage_score", score_text, (50, 350))
 
-class ReelingRhythmStage:
-    def __init__(self):
+class ReelingRhythmStage(StageInterpolation):
+    def __init__(self, clock=None, parameters=None):
+        self.clock = clock or SIM_CLOCK
+        knobs = stage_parameters("ReelingRhythmStage", parameters)
         self.arrow_sequence = []
         self.current_index = 0
         self.correct_presses = 0
         # ENHANCED DIFFICULTY: Longer sequence, less forgiveness
-        self.total_presses = 8  # Increased from 7 to 8
+        self.total_presses = knobs["total_presses"]
         self.score = 0
         self.completed = False
         self.generate_sequence()
@@ -479,7 +666,7 @@ class ReelingRhythmStage:
         return False
     
     def draw(self, screen, font):
-        instruction = font.render("Stage 4: REELING RHYTHM - Follow the arrow sequence!", True, BLACK)
+        instruction = render_text(font, "Stage 4: REELING RHYTHM - Follow the arrow sequence!", True, BLACK)
         screen.blit(instruction, (50, 150))
         
         # Show sequence progress
@@ -492,17 +679,19 @@ class ReelingRhythmStage:
                     sequence_text += f"({self.get_arrow_text(key)}) "
             else:
                 sequence_text += f"{self.get_arrow_text(key)} "
-        screen.blit(font.render(sequence_text, True, BLACK), (50, 200))
+        RENDERER.blit(screen, "rhythm_sequence", render_text(font, sequence_text, True, BLACK), (50, 200))
         
         progress_text = f"Progress: {self.current_index}/{self.total_presses} | Correct: {self.correct_presses}"
-        screen.blit(font.render(progress_text, True, BLACK), (50, 250))
+        RENDERER.blit(screen, "rhythm_progress", render_text(font, progress_text, True, BLACK), (50, 250))
         
         if self.completed:
-            score_text = font.render(f"Rhythm Score: {int(self.score)}", True, BLACK)
-            screen.blit(score_text, (50, 300))
+            score_text = render_text(font, f"Rhythm Score: {int(self.score)}", True, BLACK)
+            RENDERER.blit(screen, "stage_score", score_text, (50, 300))
 
-class LineTensionStage:
-    def __init__(self):
+class LineTensionStage(StageInterpolation):
+    def __init__(self, clock=None, parameters=None):
+        self.clock = clock or SIM_CLOCK
+        knobs = stage_parameters("LineTensionStage", parameters)
         # Enhanced LineTensionStage with spacebar controls and moving target system
         self.bobber_y = 250  # Start bobber higher for natural falling motion
         self.safe_zone_start = 350  # Y position for safe zone
@@ -516,8 +705,8 @@ class LineTensionStage:
         # FIXED SPACEBAR CONTROL SYSTEM
         self.space_held = False
         self.bobber_velocity = 0
-        self.gravity = 200  # Natural downward pull (positive = down)
-        self.lift_force = -300  # Upward force when holding space (negative = up)
+        self.gravity = knobs["gravity"]  # Natural downward pull (positive = down)
+        self.lift_force = knobs["lift_force"]  # Upward force when holding space (negative = up)
         self.max_up_speed = -200  # Maximum upward speed (negative = up)
         self.max_down_speed = 300  # Maximum downward speed (positive = down)
         
@@ -526,13 +715,14 @@ class LineTensionStage:
         self.target_square_x = WINDOW_WIDTH // 2 - self.target_square_size // 2  # Center horizontally
         self.target_square_y = 300  # Start at middle height
         self.target_square_direction = 1  # Vertical movement only (1 = down, -1 = up)
-        self.target_square_speed = 80  # Slower speed for better playability
+        self.target_square_speed = knobs["target_square_speed"]
         
         # Time tracking for target square
         self.time_in_target = 0
         self.time_out_target = 0
         
     def update(self, dt):
+        self.remember("bobber_y", "target_square_y")
         if not self.completed:
             # FIXED SPACEBAR PHYSICS: HOLD SPACE TO GO UP, RELEASE TO GO DOWN
             if self.space_held:
@@ -543,7 +733,7 @@ class LineTensionStage:
                 self.bobber_velocity += self.gravity * dt
 
             # Limit velocity to reasonable bounds
-            self.bobber_velocity = max(self.max_down_speed, min(self.max_up_speed, self.bobber_velocity))
+            self.bobber_velocity = max(self.max_up_speed, min(self.max_down_speed, self.bobber_velocity))
 
             # Update bobber position (positive Y = down, negative Y = up)
             self.bobber_y += self.bobber_velocity * dt
@@ -602,7 +792,7 @@ class LineTensionStage:
             self.completed = True
     
     def draw(self, screen, font):
-        instruction = font.render("Stage 5: LINE TENSION - Hold SPACE to lift bobber, release to let it fall!", True, BLACK)
+        instruction = render_text(font, "Stage 5: LINE TENSION - Hold SPACE to lift bobber, release to let it fall!", True, BLACK)
         screen.blit(instruction, (50, 80))
         
         # Draw tension bar
@@ -614,10 +804,11 @@ class LineTensionStage:
         
         # Draw tension marker (bobber)
         bobber_x = 80  # Move further left as requested
-        bobber_y = self.bobber_y
+        bobber_y = self.interpolated("bobber_y")
+        target_square_y = self.interpolated("target_square_y")
         
         # Visual feedback for speed and power level
-        speed_intensity = abs(self.bobber_velocity) / self.max_up_speed
+        speed_intensity = abs(self.bobber_velocity) / abs(self.max_up_speed)
         if self.space_held:
             # Bright colors when holding spacebar
             if speed_intensity > 0.8:
@@ -633,16 +824,19 @@ class LineTensionStage:
             bobber_color = GRAY
             
         pygame.draw.circle(screen, bobber_color, (bobber_x, bobber_y), 15)
+        RENDERER.track("bobber", (bobber_x - 17, bobber_y - 17, 34, 34), (int(bobber_y), bobber_color))
         # Add yellow outline for better visibility
         pygame.draw.circle(screen, YELLOW, (bobber_x, bobber_y), 16, 2)
         
         # Draw moving target square (SIMPLIFIED: vertical movement only)
-        pygame.draw.rect(screen, DARK_GREEN, (self.target_square_x, self.target_square_y,
+        pygame.draw.rect(screen, DARK_GREEN, (self.target_square_x, target_square_y,
                                              self.target_square_size, self.target_square_size), 2)
+        RENDERER.track("target_square", (self.target_square_x, target_square_y,
+                                         self.target_square_size, self.target_square_size), int(target_square_y))
 
         # Check if bobber is in target square
         in_target = (self.target_square_x <= bobber_x <= self.target_square_x + self.target_square_size and
-                    self.target_square_y <= bobber_y <= self.target_square_y + self.target_square_size)
+                    target_square_y <= bobber_y <= target_square_y + self.target_square_size)
 
         if in_target:
             pygame.draw.circle(screen, GOLD, (bobber_x, bobber_y), 10)
@@ -650,75 +844,122 @@ class LineTensionStage:
             pygame.draw.circle(screen, GREEN, (bobber_x, bobber_y), 15, 2)
         
         # Draw time tracking info
-        time_info = font.render(f"In Target: {self.time_in_target:.1f}s | Out: {self.time_out_target:.1f}s", True, BLACK)
-        screen.blit(time_info, (300, 100))
+        time_info = render_text(font, f"In Target: {self.time_in_target:.1f}s | Out: {self.time_out_target:.1f}s", True, BLACK)
+        RENDERER.blit(screen, "tension_time_info", time_info, (300, 100))
         
         # Draw enhanced speed/power indicator
         power_level = int(speed_intensity * 100)
-        speed_text = font.render(f"Power: {power_level}% | Speed: {abs(int(self.bobber_velocity))}", True, BLACK)
-        screen.blit(speed_text, (300, 130))
+        speed_text = render_text(font, f"Power: {power_level}% | Speed: {abs(int(self.bobber_velocity))}", True, BLACK)
+        RENDERER.blit(screen, "tension_speed", speed_text, (300, 130))
         
         # Draw spacebar status
         if self.space_held:
-            space_text = font.render("SPACE: HOLDING (Lifting!)", True, GREEN)
+            space_text = render_text(font, "SPACE: HOLDING (Lifting!)", True, GREEN)
         else:
-            space_text = font.render("SPACE: Released (Falling)", True, RED)
-        screen.blit(space_text, (300, 160))
+            space_text = render_text(font, "SPACE: Released (Falling)", True, RED)
+        RENDERER.blit(screen, "tension_space", space_text, (300, 160))
         
         # Draw time remaining
         remaining_time = max(0, self.total_time - self.elapsed_time)
-        time_text = font.render(f"Time Remaining: {remaining_time:.1f}s", True, BLACK)
-        screen.blit(time_text, (300, 500))
+        time_text = render_text(font, f"Time Remaining: {remaining_time:.1f}s", True, BLACK)
+        RENDERER.blit(screen, "tension_time_left", time_text, (300, 500))
         
         if self.completed:
-            score_text = font.render(f"Tension Score: {int(self.score)}", True, BLACK)
-            screen.blit(score_text, (300, 530))
+            score_text = render_text(font, f"Tension Score: {int(self.score)}", True, BLACK)
+            RENDERER.blit(screen, "stage_score", score_text, (300, 530))
+
+def make_fishing_stages(clock=None, parameters=None):
+    """The four stages of one catch; parameters maps stage class names to knob overrides"""
+    parameters = parameters or {}
+    return [stage_class(clock, parameters.get(stage_class.__name__))
+            for stage_class in (CastTimingStage, DepthControlStage, BiteReactionStage, ReelingRhythmStage)]
 
 # ============================================================================
 # PHASE 2,3,4,7,8: UI Screens Implementation
 # ============================================================================
 
-def draw_main_menu(screen, font, buttons, cheat_mode, price_cheat, gold, game_data):
-    """Draw the main menu screen"""
-    # Load and draw background if available, otherwise use light blue
-    background = load_background(game_data.background)
+class StaticLayerCache:
+    """One pre-composed surface of static content per screen.
+
+    A screen passes the inputs its static content depends on (background,
+    rod, inventory version, ...) and a function that draws that content.
+    The layer is rebuilt only when those inputs, the window size or the
+    display format change; every other frame the screen blits the layer and
+    draws just its dynamic overlay on top.
+    """
+
+    def __init__(self):
+        self.layers = {}  # screen name -> (inputs, surface)
+        self.builds = 0
+
+    def get(self, name, inputs, draw_static):
+        inputs = (inputs, get_window_size(), get_display_format())
+        entry = self.layers.get(name)
+        if entry is None or entry[0] != inputs:
+            layer = pygame.Surface(get_window_size())
+            if inputs[2] is not None:
+                layer = layer.convert()
+            draw_static(layer)
+            entry = self.layers[name] = (inputs, layer)
+            self.builds += 1
+        return entry[1]
+
+    def invalidate(self):
+        """Drop every layer so each screen is composed again"""
+        self.layers.clear()
+
+    def stats(self):
+        """Return cache counters for debug output"""
+        return {"layers": len(self.layers), "builds": self.builds}
+
+STATIC_LAYERS = StaticLayerCache()
+
+def draw_background(surface, background_path):
+    """Draw the background image if available, otherwise use light blue"""
+    background = load_background(background_path)
     if background:
-        screen.blit(background, (0, 0))
+        surface.blit(background, (0, 0))
     else:
-        screen.fill(LIGHT_BLUE)
+        surface.fill(LIGHT_BLUE)
 
-    # Title
-    title = font.render("FISHING MASTERY", True, DARK_BLUE)
-    title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
-    screen.blit(title, title_rect)
+def draw_main_menu(screen, font, buttons, cheat_mode, price_cheat, gold, game_data):
+    """Draw the main menu screen"""
+    def draw_static(layer):
+        draw_background(layer, game_data.background)
+
+        # Title
+        title = render_text(font, "FISHING MASTERY", True, DARK_BLUE)
+        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
+        layer.blit(title, title_rect)
+
+        # Display fullscreen status
+        fullscreen_text = render_text(font, "F11: TOGGLE FULLSCREEN", True, BLACK)
+        layer.blit(fullscreen_text, (10, 100))
+
+    screen.blit(STATIC_LAYERS.get(GameState.MAIN_MENU, (font, game_data.background), draw_static), (0, 0))
 
     # Draw buttons
     for button in buttons:
         button.draw(screen)
 
     # Display gold
-    gold_text = font.render(f"Gold: {gold}", True, BLACK)
-    screen.blit(gold_text, (10, 10))
+    gold_text = render_text(font, f"Gold: {gold}", True, BLACK)
+    RENDERER.blit(screen, "gold", gold_text, (10, 10))
 
     # Display cheat mode status
     if cheat_mode:
-        cheat_text = font.render("CHEAT MODE ACTIVE", True, RED)
-        screen.blit(cheat_text, (10, 40))
+        cheat_text = render_text(font, "CHEAT MODE ACTIVE", True, RED)
+        RENDERER.blit(screen, "cheat_status", cheat_text, (10, 40))
 
     # Display price cheat status
     if price_cheat:
-        price_cheat_text = font.render("PRICE CHEAT ACTIVE (10x)", True, RED)
-        screen.blit(price_cheat_text, (10, 70))
+        price_cheat_text = render_text(font, "PRICE CHEAT ACTIVE (10x)", True, RED)
+        RENDERER.blit(screen, "cheat_line", price_cheat_text, (10, 70))
     else:
         # Display cheat code typing feedback
         if game_data.cheat_buffer:
-            typing_text = font.render(f"Typing: {game_data.cheat_buffer}", True, BLACK)
-            screen.blit(typing_text, (10, 70))
-
-    # Display fullscreen status
-    fullscreen_text = font.render("F11: TOGGLE FULLSCREEN", True, BLACK)
-    screen.blit(fullscreen_text, (10, 100))
-
+            typing_text = render_text(font, f"Typing: {game_data.cheat_buffer}", True, BLACK)
+            RENDERER.blit(screen, "cheat_line", typing_text, (10, 70))
 
 def handle_cheat_code(events, game_data):
     """Handle cheat code detection"""
@@ -751,117 +992,118 @@ def handle_cheat_code(events, game_data):
                 return True
     return False
 
+GUIDE_TEXTS = [
+    "Stage 1 - CAST TIMING: Press SPACE when the moving marker is in the green zone",
+    "Stage 2 - DEPTH CONTROL: Press SPACE when the marker is in the ideal depth range", 
+    "Stage 3 - BITE REACTION: Wait for the fish to bite, then press SPACE quickly",
+    "Stage 4 - REELING RHYTHM: Follow the arrow sequence using arrow keys",
+    "Stage 5 - LINE TENSION: Hold SPACE to lift bobber, release to let it fall",
+    "",
+    "ENHANCED FEATURES:",
+    "• Stage 5 includes a moving target square - stay in it for better quality!",
+    "• Spacebar controls with acceleration - hold longer for more power!",
+    "• Quality scoring: (Stage Scores × 0.7) + (Target Square Time × 0.3)",
+    "• Enhanced difficulty across all stages for more challenging gameplay",
+    "• Quality tiers: Perfect (95+) > Great (80+) > Good (60+) > Fair (40+) > Poor (<40)",
+    "",
+    "FISH QUALITY affects selling price based on performance",
+    "Upgrade your rod for better chances at rare fish!",
+    "Type 'lucknow' in the main menu for enhanced fish rarity!",
+    "SPECIAL: Mythic fish (Abyssal Leviathan, Celestial Megalodon, Void Kraken) have enhanced chances!"
+]
+
 def draw_guide_screen(screen, font, game_data):
     """Draw the guide screen explaining fishing stages"""
-    # Load and draw background if available, otherwise use light blue
-    background = load_background(game_data.background)
-    if background:
-        screen.blit(background, (0, 0))
-    else:
-        screen.fill(LIGHT_BLUE)
+    def draw_static(layer):
+        draw_background(layer, game_data.background)
 
-    title = font.render("FISHING GUIDE", True, DARK_BLUE)
-    title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
-    screen.blit(title, title_rect)
-    
-    guide_texts = [
-        "Stage 1 - CAST TIMING: Press SPACE when the moving marker is in the green zone",
-        "Stage 2 - DEPTH CONTROL: Press SPACE when the marker is in the ideal depth range", 
-        "Stage 3 - BITE REACTION: Wait for the fish to bite, then press SPACE quickly",
-        "Stage 4 - REELING RHYTHM: Follow the arrow sequence using arrow keys",
-        "Stage 5 - LINE TENSION: Hold SPACE to lift bobber, release to let it fall",
-        "",
-        "ENHANCED FEATURES:",
-        "• Stage 5 includes a moving target square - stay in it for better quality!",
-        "• Spacebar controls with acceleration - hold longer for more power!",
-        "• Quality scoring: (Stage Scores × 0.7) + (Target Square Time × 0.3)",
-        "• Enhanced difficulty across all stages for more challenging gameplay",
-        "• Quality tiers: Perfect (95+) > Great (80+) > Good (60+) > Fair (40+) > Poor (<40)",
-        "",
-        "FISH QUALITY affects selling price based on performance",
-        "Upgrade your rod for better chances at rare fish!",
-        "Type 'lucknow' in the main menu for enhanced fish rarity!",
-        "SPECIAL: Mythic fish (Abyssal Leviathan, Celestial Megalodon, Void Kraken) have enhanced chances!"
-    ]
-    
-    y_offset = 120
-    for text in guide_texts:
-        if text:
-            text_surface = font.render(text, True, BLACK)
-            screen.blit(text_surface, (50, y_offset))
-        y_offset += 30
-    
-    back_text = font.render("Press ESC to return to menu", True, BLACK)
-    screen.blit(back_text, (WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT - 50))
+        title = render_text(font, "FISHING GUIDE", True, DARK_BLUE)
+        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
+        layer.blit(title, title_rect)
+
+        y_offset = 120
+        for text in GUIDE_TEXTS:
+            if text:
+                text_surface = render_text(font, text, True, BLACK)
+                layer.blit(text_surface, (50, y_offset))
+            y_offset += 30
+
+        back_text = render_text(font, "Press ESC to return to menu", True, BLACK)
+        layer.blit(back_text, (WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT - 50))
+
+    # The guide is entirely static
+    screen.blit(STATIC_LAYERS.get(GameState.GUIDE, (font, game_data.background), draw_static), (0, 0))
 
 def draw_shop_screen(screen, font, current_rod, gold, game_data):
     """Draw the shop screen for rod upgrades"""
-    # Load and draw background if available, otherwise use light blue
-    background = load_background(game_data.background)
-    if background:
-        screen.blit(background, (0, 0))
-    else:
-        screen.fill(LIGHT_BLUE)
+    def draw_static(layer):
+        draw_background(layer, game_data.background)
+
+        title = render_text(font, "FISHING SHOP", True, DARK_BLUE)
+        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
+        layer.blit(title, title_rect)
+
+        # Current rod info
+        current_text = render_text(font, f"Current Rod: {current_rod}", True, BLACK)
+        layer.blit(current_text, (50, 120))
+
+        # Available rods
+        y_offset = 220
+        for rod_name, rod_info in ROD_UPGRADES.items():
+            if rod_name != current_rod:
+                rod_text = render_text(font, f"{rod_name}: {rod_info['price']} gold (Luck +{rod_info['luck']})", True, BLACK)
+                layer.blit(rod_text, (50, y_offset))
+                y_offset += 40
+
+        # Purchase instructions
+        purchase_text = render_text(font, "Press 1 for Novice Rod, 2 for Master Rod", True, BLACK)
+        layer.blit(purchase_text, (50, y_offset + 20))
+
+        back_text = render_text(font, "Press ESC to return to menu", True, BLACK)
+        layer.blit(back_text, (WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT - 50))
+
+    # Buying a rod changes the listing and rebuilds the layer
+    screen.blit(STATIC_LAYERS.get(GameState.SHOP, (font, game_data.background, current_rod), draw_static), (0, 0))
 
-    title = font.render("FISHING SHOP", True, DARK_BLUE)
-    title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
-    screen.blit(title, title_rect)
-    
-    # Current rod info
-    current_text = font.render(f"Current Rod: {current_rod}", True, BLACK)
-    screen.blit(current_text, (50, 120))
-    
     # Gold display
-    gold_text = font.render(f"Gold: {gold}", True, BLACK)
-    screen.blit(gold_text, (50, 160))
-    
-    # Available rods
-    y_offset = 220
-    for rod_name, rod_info in ROD_UPGRADES.items():
-        if rod_name != current_rod:
-            rod_text = font.render(f"{rod_name}: {rod_info['price']} gold (Luck +{rod_info['luck']})", True, BLACK)
-            screen.blit(rod_text, (50, y_offset))
-            y_offset += 40
-    
-    # Purchase instructions
-    purchase_text = font.render("Press 1 for Novice Rod, 2 for Master Rod", True, BLACK)
-    screen.blit(purchase_text, (50, y_offset + 20))
-    
-    back_text = font.render("Press ESC to return to menu", True, BLACK)
-    screen.blit(back_text, (WINDOW_WIDTH // 2 - 100, WINDOW_HEIGHT - 50))
+    gold_text = render_text(font, f"Gold: {gold}", True, BLACK)
+    RENDERER.blit(screen, "gold", gold_text, (50, 160))
 
 def draw_fishing_interface(screen, font, small_font, current_stage, stages, gold, current_rod):
     """Draw the fishing interface with player, water, and stage UI"""
-    screen.fill(LIGHT_BLUE)
-    
-    # Draw player at top
-    pygame.draw.circle(screen, GREEN, (WINDOW_WIDTH // 2, 50), 20)
-    player_text = font.render("FISHER", True, BLACK)
-    player_rect = player_text.get_rect(center=(WINDOW_WIDTH // 2, 90))
-    screen.blit(player_text, player_rect)
-    
-    # Draw water area
-    pygame.draw.rect(screen, BLUE, (0, 120, WINDOW_WIDTH, WINDOW_HEIGHT - 120))
-    water_text = font.render("WATER", True, WHITE)
-    screen.blit(water_text, (10, 130))
-    
-    # Draw hook line
-    hook_x = WINDOW_WIDTH // 2
-    hook_y = 200  # Default hook position
-    pygame.draw.line(screen, BLACK, (WINDOW_WIDTH // 2, 70), (hook_x, hook_y), 2)
-    pygame.draw.circle(screen, RED, (hook_x, hook_y), 5)
-    
-    # UI Elements
-    gold_text = font.render(f"Gold: {gold}", True, BLACK)
-    screen.blit(gold_text, (10, 10))
+    def draw_static(layer):
+        layer.fill(LIGHT_BLUE)
 
-    rod_text = font.render(f"Rod: {current_rod}", True, BLACK)
-    screen.blit(rod_text, (WINDOW_WIDTH - 150, 10))
+        # Draw player at top
+        pygame.draw.circle(layer, GREEN, (WINDOW_WIDTH // 2, 50), 20)
+        player_text = render_text(font, "FISHER", True, BLACK)
+        player_rect = player_text.get_rect(center=(WINDOW_WIDTH // 2, 90))
+        layer.blit(player_text, player_rect)
+
+        # Draw water area
+        pygame.draw.rect(layer, BLUE, (0, 120, WINDOW_WIDTH, WINDOW_HEIGHT - 120))
+        water_text = render_text(font, "WATER", True, WHITE)
+        layer.blit(water_text, (10, 130))
+
+        # Draw hook line
+        hook_x = WINDOW_WIDTH // 2
+        hook_y = 200  # Default hook position
+        pygame.draw.line(layer, BLACK, (WINDOW_WIDTH // 2, 70), (hook_x, hook_y), 2)
+        pygame.draw.circle(layer, RED, (hook_x, hook_y), 5)
+
+        rod_text = render_text(font, f"Rod: {current_rod}", True, BLACK)
+        layer.blit(rod_text, (WINDOW_WIDTH - 150, 10))
+
+        # Stage progress
+        stage_text = render_text(font, f"Stage {current_stage}/5", True, BLACK)
+        layer.blit(stage_text, (10, 40))
+
+    screen.blit(STATIC_LAYERS.get(GameState.FISHING, (font, current_rod, current_stage), draw_static), (0, 0))
+
+    # UI Elements
+    gold_text = render_text(font, f"Gold: {gold}", True, BLACK)
+    RENDERER.blit(screen, "gold", gold_text, (10, 10))
 
-    # Stage progress
-    stage_text = font.render(f"Stage {current_stage}/5", True, BLACK)
-    screen.blit(stage_text, (10, 40))
-    
     # Draw current stage interface
     if current_stage == 1:
         stages[0].draw(screen, font)
@@ -874,204 +1116,358 @@ def draw_fishing_interface(screen, font, small_font, current_stage, stages, gold
     elif current_stage == 5:
         stages[4].draw(screen, font)
 
-def draw_selling_screen(screen, font, fish_info, quality, quality_score, selling_price):
-    """Draw the selling screen showing caught fish"""
-    screen.fill(LIGHT_BLUE)
+def draw_caught_fish_details(surface, font, fish_info, quality, quality_score, selling_price, instruction_text):
+    """Draw the caught fish summary shared by the selling and fish display screens"""
+    surface.fill(LIGHT_BLUE)
 
-    title = font.render("FISH CAUGHT!", True, DARK_BLUE)
+    title = render_text(font, "FISH CAUGHT!", True, DARK_BLUE)
     title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
-    screen.blit(title, title_rect)
+    surface.blit(title, title_rect)
 
     # Fish info
-    fish_name = font.render(f"Fish: {fish_info['name']}", True, BLACK)
-    fish_rarity = font.render(f"Rarity: {fish_info['rarity']}", True, BLACK)
-    quality_text = font.render(f"Quality: {quality} ({int(quality_score)}%)", True, BLACK)
-    price_text = font.render(f"Selling Price: {selling_price} gold", True, BLACK)
+    fish_name = render_text(font, f"Fish: {fish_info['name']}", True, BLACK)
+    fish_rarity = render_text(font, f"Rarity: {fish_info['rarity']}", True, BLACK)
+    quality_text = render_text(font, f"Quality: {quality} ({int(quality_score)}%)", True, BLACK)
+    price_text = render_text(font, f"Selling Price: {selling_price} gold", True, BLACK)
 
-    screen.blit(fish_name, (100, 150))
-    screen.blit(fish_rarity, (100, 200))
-    screen.blit(quality_text, (100, 250))
-    screen.blit(price_text, (100, 300))
+    surface.blit(fish_name, (100, 150))
+    surface.blit(fish_rarity, (100, 200))
+    surface.blit(quality_text, (100, 250))
+    surface.blit(price_text, (100, 300))
 
     # Rarity color indicator
-    rarity_colors = {
-        "Common": GRAY,
-        "Uncommon": GREEN,
-        "Rare": BLUE,
-        "Epic": PURPLE,
-        "Legendary": GOLD,
-        "Mythic": (255, 0, 255)  # Bright magenta for mythic
-    }
-    color = rarity_colors.get(fish_info['rarity'], BLACK)
-    pygame.draw.rect(screen, color, (500, 195, 30, 30))
-    pygame.draw.rect(screen, BLACK, (500, 195, 30, 30), 2)
+    color = RARITY_COLORS.get(fish_info['rarity'], BLACK)
+    pygame.draw.rect(surface, color, (500, 195, 30, 30))
+    pygame.draw.rect(surface, BLACK, (500, 195, 30, 30), 2)
 
     # Load and display fish texture
-    fish_texture = load_fish_texture(fish_info['name'])
+    fish_texture = get_fish_surface(fish_info['name'])
     if fish_texture:
         # Display fish texture on the right side
-        screen.blit(fish_texture, (450, 100))
+        surface.blit(fish_texture, (450, 100))
+
+    instruction = render_text(font, instruction_text, True, BLACK)
+    surface.blit(instruction, (100, 400))
+
+def draw_selling_screen(screen, font, fish_info, quality, quality_score, selling_price):
+    """Draw the selling screen showing caught fish"""
+    def draw_static(layer):
+        draw_caught_fish_details(layer, font, fish_info, quality, quality_score, selling_price,
+                                 "Press SPACE to sell fish and return to menu")
 
-    instruction = font.render("Press SPACE to sell fish and return to menu", True, BLACK)
-    screen.blit(instruction, (100, 400))
+    inputs = (font, fish_info['name'], fish_info['rarity'], quality, quality_score, selling_price)
+    screen.blit(STATIC_LAYERS.get(GameState.SELLING, inputs, draw_static), (0, 0))
 
 def draw_inventory_screen(screen, font, inventory, gold, game_data):
     """Draw the inventory screen showing all caught fish"""
-    # Load and draw background if available, otherwise use light blue
-    background = load_background(game_data.background)
-    if background:
-        screen.blit(background, (0, 0))
-    else:
-        screen.fill(LIGHT_BLUE)
-
-    # Title
-    title = font.render("INVENTORY", True, DARK_BLUE)
-    title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
-    screen.blit(title, title_rect)
+    def draw_static(layer):
+        draw_background(layer, game_data.background)
+
+        # Title
+        title = render_text(font, "INVENTORY", True, DARK_BLUE)
+        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
+        layer.blit(title, title_rect)
+
+        # Inventory capacity display
+        capacity_text = render_text(font, f"Inventory: {len(inventory)}/{game_data.inventory_capacity}", True, BLACK)
+        layer.blit(capacity_text, capacity_text.get_rect(topright=(WINDOW_WIDTH - 10, 10)))
+
+        # Inventory list header
+        header_font = get_font(30)
+        name_header = render_text(header_font, "Name", True, BLACK)
+        rarity_header = render_text(header_font, "Rarity", True, BLACK)
+        quality_header = render_text(header_font, "Quality", True, BLACK)
+        price_header = render_text(header_font, "Price", True, BLACK)
+
+        name_x, rarity_x, quality_x, price_x = INVENTORY_COLUMNS
+        layer.blit(name_header, (name_x, INVENTORY_HEADER_Y))
+        layer.blit(rarity_header, (rarity_x, INVENTORY_HEADER_Y))
+        layer.blit(quality_header, (quality_x, INVENTORY_HEADER_Y))
+        layer.blit(price_header, (price_x, INVENTORY_HEADER_Y))
+
+        # Bulk sell and view shortcuts
+        hint_text = render_text(get_font(24), f"1-6: sell a rarity   Q: sell below {INVENTORY_KEEP_QUALITY}   "
+                                "B: keep best of each   S: sort   ESC: menu", True, BLACK)
+        layer.blit(hint_text, hint_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 25)))
+
+    inputs = (font, game_data.background, game_data.inventory_version, game_data.inventory_capacity)
+    screen.blit(STATIC_LAYERS.get(GameState.INVENTORY, inputs, draw_static), (0, 0))
+
+    # Only the rows in view are drawn, so the frame cost does not grow with the inventory
+    INVENTORY_VIEW.draw(screen, font, inventory, game_data.inventory_version)
 
     # Gold display
-    gold_text = font.render(f"Gold: {gold}", True, BLACK)
-    screen.blit(gold_text, (10, 10))
-
-    # Inventory capacity display
-    capacity_text = font.render(f"Inventory: {len(inventory)}/{20}", True, BLACK)
-    screen.blit(capacity_text, (WINDOW_WIDTH - 150, 10))
-
-    # Inventory list header
-    header_font = pygame.font.Font(None, 30)
-    name_header = header_font.render("Name", True, BLACK)
-    rarity_header = header_font.render("Rarity", True, BLACK)
-    quality_header = header_font.render("Quality", True, BLACK)
-    price_header = header_font.render("Price", True, BLACK)
-
-    screen.blit(name_header, (50, 100))
-    screen.blit(rarity_header, (250, 100))
-    screen.blit(quality_header, (400, 100))
-    screen.blit(price_header, (550, 100))
-
-    # Draw inventory items
-    y_offset = 140
-    for i, fish in enumerate(inventory):
-        # Fish name
-        name_text = font.render(fish['info']['name'], True, BLACK)
-        screen.blit(name_text, (50, y_offset))
-
-        # Fish rarity
-        rarity_text = font.render(fish['info']['rarity'], True, BLACK)
-        screen.blit(rarity_text, (250, y_offset))
-
-        # Fish quality
-        quality_text = font.render(f"{fish['quality']} ({int(fish['quality_score'])}%)", True, BLACK)
-        screen.blit(quality_text, (400, y_offset))
-
-        # Fish price
-        price_text = font.render(f"{fish['price']} gold", True, BLACK)
-        screen.blit(price_text, (550, y_offset))
+    gold_text = render_text(font, f"Gold: {gold}", True, BLACK)
+    RENDERER.blit(screen, "gold", gold_text, (10, 10))
+
+    # A bulk sell shortcut waiting for confirmation
+    INVENTORY_SALE.draw(screen)
+
+class InventoryView:
+    """Scrollable, sortable inventory list that only draws the rows in view
+
+    Rows follow INVENTORY_ROWS, offset by the scroll position and clipped to
+    the viewport. A sort order reads the Inventory's maintained sorted index,
+    so neither drawing a frame nor finding the clicked catch sorts or scans
+    the inventory. Selling a catch from a sorted view still searches the
+    list for it (Inventory.remove_catch), a C-level identity scan.
+    """
+
+    SORT_ORDERS = [None, "price", "rarity", "quality"]
+    SORT_LABELS = {None: "catch order", "price": "price", "rarity": "rarity", "quality": "quality"}
+
+    def __init__(self, layout=INVENTORY_ROWS, viewport=(0, 135, WINDOW_WIDTH, WINDOW_HEIGHT - 185)):
+        self.layout = layout
+        self.viewport = pygame.Rect(viewport)
+        self.scroll = 0
+        self.order = None
+
+    def max_scroll(self, count):
+        if not count:
+            return 0
+        return max(0, self.layout.row_y(count - 1) + self.layout.hit_bottom - self.viewport.bottom)
+
+    def scroll_by(self, delta, count):
+        self.scroll = max(0, min(self.max_scroll(count), self.scroll + delta))
+
+    def handle_event(self, event, count):
+        """Scroll with the mouse wheel, arrow keys or page keys; S cycles the sort order"""
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll_by(-event.y * self.layout.pitch, count)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_DOWN:
+                self.scroll_by(self.layout.pitch, count)
+            elif event.key == pygame.K_UP:
+                self.scroll_by(-self.layout.pitch, count)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.scroll_by(self.viewport.height, count)
+            elif event.key == pygame.K_PAGEUP:
+                self.scroll_by(-self.viewport.height, count)
+            elif event.key == pygame.K_s:
+                self.order = self.SORT_ORDERS[(self.SORT_ORDERS.index(self.order) + 1) % len(self.SORT_ORDERS)]
+                self.scroll = 0
+
+    def visible_rows(self, count):
+        return self.layout.visible_rows(count, self.viewport.top, self.viewport.bottom, self.scroll)
+
+    def catches(self, inventory, rows):
+        """The catches shown in a range of rows"""
+        if self.order is None:
+            return inventory[rows.start:rows.stop]
+        return inventory.sorted_catches(self.order, rows.start, rows.stop)
+
+    def catch_at(self, inventory, pos):
+        """(catch, inventory position or None if sorted) of the row under pos, or None"""
+        if not self.viewport.collidepoint(pos):
+            return None
+        row = self.layout.row_at(pos, len(inventory), self.scroll)
+        if row is None:
+            return None
+        fish = self.catches(inventory, range(row, row + 1))[0]
+        return fish, row if self.order is None else None
+
+    def draw(self, screen, font, inventory, inventory_version):
+        self.scroll_by(0, len(inventory))  # Selling may have shortened the list
+        name_x, rarity_x, quality_x, price_x = INVENTORY_COLUMNS
+        rows = self.visible_rows(len(inventory))
+        batch = []
+        for row, fish in zip(rows, self.catches(inventory, rows)):
+            y = self.layout.row_y(row, self.scroll)
+            batch.append((render_text(font, fish.name, True, BLACK), (name_x, y)))
+            batch.append((render_text(font, fish.rarity, True, BLACK), (rarity_x, y)))
+            batch.append((render_text(font, f"{fish.quality} ({int(fish.quality_score)}%)", True, BLACK), (quality_x, y)))
+            batch.append((render_text(font, f"{fish.price} gold", True, BLACK), (price_x, y)))
+
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.viewport)
+        screen.blits(batch, doreturn=False)
+        screen.set_clip(previous_clip)
+        RENDERER.track("inventory_rows", self.viewport, (self.scroll, self.order, inventory_version))
+
+        sort_text = render_text(get_font(24), f"Sort: {self.SORT_LABELS[self.order]}", True, BLACK)
+        RENDERER.blit(screen, "inventory_sort", sort_text, (10, 50))
+
+INVENTORY_VIEW = InventoryView()
+
+class FishIndexView:
+    """Scrollable fish index grid that only draws the cells in view.
+
+    The visible row range is computed from the scroll offset, and those cells
+    are drawn with a single Surface.blits call, so a frame costs the same for
+    53 species or 5,000. Cells are placed and clicked through one GridLayout;
+    clicking a cell selects it.
+    """
+
+    COLUMNS = 4
+    CELL_SIZE = 100
+    SPACING = 20
+    LABEL_HEIGHT = 40  # Extra space for the name below each cell
+    START_X = 50
+    COLUMN_PITCH = CELL_SIZE + SPACING
+    ROW_PITCH = CELL_SIZE + SPACING + LABEL_HEIGHT
+    SCROLL_STEP = 40
+
+    def __init__(self, fish_list=None, viewport=(0, 150, WINDOW_WIDTH, WINDOW_HEIGHT - 210)):
+        self.fish = get_all_fish_list() if fish_list is None else fish_list
+        self.viewport = pygame.Rect(viewport)
+        self.scroll = 0
+        self.selected = None
+        self.layout = GridLayout(self.START_X, self.viewport.top, self.COLUMNS, self.CELL_SIZE,
+                                 self.CELL_SIZE + self.LABEL_HEIGHT, self.COLUMN_PITCH, self.ROW_PITCH)
+        self.cell_frames = {}
+        self.selection_frame = None
+        self.caught_fish_names = set()
+        self.caught_version = None
+
+    def update_caught(self, inventory, inventory_version):
+        """Refresh the caught species set when the inventory changed"""
+        if inventory_version != self.caught_version:
+            self.caught_fish_names = get_caught_species(inventory)
+            self.caught_version = inventory_version
+
+    def row_count(self):
+        return self.layout.row_count(len(self.fish))
+
+    def max_scroll(self):
+        return max(0, self.layout.bottom(len(self.fish)) - self.viewport.bottom)
+
+    def scroll_by(self, delta):
+        self.scroll = max(0, min(self.max_scroll(), self.scroll + delta))
+
+    def handle_event(self, event):
+        """Scroll with the mouse wheel, arrow keys or page keys; select a cell by clicking it"""
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            index = self.cell_at(event.pos)
+            if index is not None:
+                self.selected = index
+        elif event.type == pygame.MOUSEWHEEL:
+            self.scroll_by(-event.y * self.SCROLL_STEP)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_DOWN:
+                self.scroll_by(self.SCROLL_STEP)
+            elif event.key == pygame.K_UP:
+                self.scroll_by(-self.SCROLL_STEP)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.scroll_by(self.viewport.height)
+            elif event.key == pygame.K_PAGEUP:
+                self.scroll_by(-self.viewport.height)
+
+    def visible_rows(self):
+        """Range of grid rows that intersect the viewport"""
+        return self.layout.visible_rows(len(self.fish), self.viewport.top, self.viewport.bottom, self.scroll)
+
+    def cell_position(self, index):
+        """Screen position of the top-left corner of cell index"""
+        return self.layout.cell_position(index, self.scroll)
+
+    def cell_at(self, pos):
+        """Index of the fish whose cell (or name) is under pos, or None"""
+        if not self.viewport.collidepoint(pos):
+            return None
+        return self.layout.cell_at(pos, len(self.fish), self.scroll)
+
+    def get_cell_frame(self, rarity):
+        """Slot outline plus rarity colour indicator, drawn once per rarity"""
+        if rarity not in self.cell_frames:
+            size = self.CELL_SIZE
+            frame = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.rect(frame, WHITE, (0, 0, size, size), 2)
+            color = RARITY_COLORS.get(rarity, BLACK)
+            pygame.draw.rect(frame, color, (size - 25, size - 25, 20, 20))
+            pygame.draw.rect(frame, BLACK, (size - 25, size - 25, 20, 20), 1)
+            self.cell_frames[rarity] = frame
+        return self.cell_frames[rarity]
+
+    def get_selection_frame(self):
+        if self.selection_frame is None:
+            size = self.CELL_SIZE + 8
+            self.selection_frame = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.rect(self.selection_frame, GOLD, (0, 0, size, size), 4)
+        return self.selection_frame
+
+    def draw_selection(self, screen, font):
+        """Name, rarity and caught status of the selected fish, above the grid on the right"""
+        if self.selected is None:
+            return
+        fish = self.fish[self.selected]
+        status = "caught" if fish['name'] in self.caught_fish_names else "not caught yet"
+        text = render_text(get_font(28), f"{fish['name']} ({fish['rarity']}) - {status}", True, DARK_BLUE)
+        RENDERER.blit(screen, "fish_index_selection", text,
+                      text.get_rect(topright=(WINDOW_WIDTH - 20, self.viewport.top - 40)))
+
+    def draw(self, screen, font):
+        size = self.CELL_SIZE
+        batch = []
+        for row in self.visible_rows():
+            for index in range(row * self.COLUMNS, min(len(self.fish), (row + 1) * self.COLUMNS)):
+                fish = self.fish[index]
+                x, y = self.cell_position(index)
+
+                # Caught fish show the thumbnail, uncaught ones the cached greyed out variant
+                caught = fish['name'] in self.caught_fish_names
+                fish_texture = FISH_VARIANTS.get(fish['name'], FISH_THUMBNAIL_SIZE, "normal" if caught else "greyed")
+                if fish_texture:
+                    batch.append((fish_texture, (x + 5, y + 5)))
+                elif caught:
+                    # Display fish name if texture not found
+                    batch.append((render_text(font, fish['name'], True, BLACK), (x + 10, y + 40)))
+                else:
+                    # Display question mark if texture not found
+                    question_text = render_text(font, "?", True, BLACK)
+                    batch.append((question_text, question_text.get_rect(center=(x + size // 2, y + size // 2))))
+
+                batch.append((self.get_cell_frame(fish['rarity']), (x, y)))
+                if index == self.selected:
+                    batch.append((self.get_selection_frame(), (x - 4, y - 4)))
+
+                # Display fish name below
+                name_text = render_text(font, fish['name'], True, BLACK)
+                batch.append((name_text, name_text.get_rect(center=(x + size // 2, y + size + 20))))
+
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.viewport)
+        screen.blits(batch, doreturn=False)
+        screen.set_clip(previous_clip)
+        RENDERER.track("fish_index_grid", self.viewport, (self.scroll, self.selected))
+        self.draw_selection(screen, font)
+
+FISH_INDEX_VIEW = FishIndexView()
 
 def draw_fish_index_screen(screen, font, inventory, game_data):
     """Draw the fish index screen showing all fish with caught/uncaught status"""
-    # Load and draw background if available, otherwise use light blue
-    background = load_background(game_data.background)
-    if background:
-        screen.blit(background, (0, 0))
-    else:
-        screen.fill(LIGHT_BLUE)
+    def draw_static(layer):
+        draw_background(layer, game_data.background)
 
-    # Title
-    title = font.render("FISH INDEX", True, DARK_BLUE)
-    title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
-    screen.blit(title, title_rect)
+        # Title
+        title = render_text(font, "FISH INDEX", True, DARK_BLUE)
+        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
+        layer.blit(title, title_rect)
 
-    # Get missing fish counts
-    missing_counts = get_missing_fish_counts(inventory)
-
-    # Display missing fish counts in top left
-    missing_texts = []
-    for rarity in ["Common", "Uncommon", "Rare", "Epic", "Legendary", "Mythic"]:
-        if missing_counts[rarity] > 0:
-            missing_texts.append(f"Missing {missing_counts[rarity]} {rarity}")
-
-    y_offset = 20
-    for text in missing_texts:
-        missing_text = font.render(text, True, BLACK)
-        screen.blit(missing_text, (20, y_offset))
-        y_offset += 30
-
-    # Get all fish and display them in a grid
-    all_fish = get_all_fish_list()
-    caught_fish_names = {fish['info']['name'] for fish in inventory}
-
-    # Display fish in a grid layout
-    fish_per_row = 4
-    fish_size = 100
-    spacing = 20
-    start_x = 50
-    start_y = 150
-
-    for i, fish in enumerate(all_fish):
-        row = i // fish_per_row
-        col = i % fish_per_row
-
-        x = start_x + col * (fish_size + spacing)
-        y = start_y + row * (fish_size + spacing + 40)  # Extra space for text
-
-        # Draw fish slot
-        pygame.draw.rect(screen, WHITE, (x, y, fish_size, fish_size), 2)
-
-        # Check if fish is caught
-        if fish['name'] in caught_fish_names:
-            # Load and display fish texture
-            fish_texture = load_fish_texture(fish['name'])
-            if fish_texture:
-                # Scale down the texture to fit
-                scaled_texture = pygame.transform.scale(fish_texture, (fish_size - 10, fish_size - 10))
-                screen.blit(scaled_texture, (x + 5, y + 5))
-            else:
-                # Display fish name if texture not found
-                name_text = font.render(fish['name'], True, BLACK)
-                screen.blit(name_text, (x + 10, y + 40))
-        else:
-            # Load fish texture for uncaught fish and apply greyed out effect
-            fish_texture = load_fish_texture(fish['name'])
-            if fish_texture:
-                # Scale down the texture to fit
-                scaled_texture = pygame.transform.scale(fish_texture, (fish_size - 10, fish_size - 10))
+        # Get missing fish counts (O(1) from an Inventory's running counts)
+        missing_counts = get_missing_fish_counts(inventory)
 
-                # Create a copy of the texture to modify
-                greyed_texture = scaled_texture.copy()
+        # Display missing fish counts in top left
+        missing_texts = []
+        for rarity in ["Common", "Uncommon", "Rare", "Epic", "Legendary", "Mythic"]:
+            if missing_counts[rarity] > 0:
+                missing_texts.append(f"Missing {missing_counts[rarity]} {rarity}")
 
-                # Apply greyed out effect with 70% transparency
-                greyed_texture.fill((128, 128, 128, 178), special_flags=pygame.BLEND_RGBA_MULT)
+        y_offset = 20
+        for text in missing_texts:
+            missing_text = render_text(font, text, True, BLACK)
+            layer.blit(missing_text, (20, y_offset))
+            y_offset += 30
 
-                # Draw the greyed out texture
-                screen.blit(greyed_texture, (x + 5, y + 5))
-            else:
-                # Display question mark if texture not found
-                question_text = font.render("?", True, BLACK)
-                question_rect = question_text.get_rect(center=(x + fish_size // 2, y + fish_size // 2))
-                screen.blit(question_text, question_rect)
-
-        # Display fish name below
-        name_text = font.render(fish['name'], True, BLACK)
-        name_rect = name_text.get_rect(center=(x + fish_size // 2, y + fish_size + 20))
-        screen.blit(name_text, name_rect)
-
-        # Display rarity color indicator
-        rarity_colors = {
-            "Common": GRAY,
-            "Uncommon": GREEN,
-            "Rare": BLUE,
-            "Epic": PURPLE,
-            "Legendary": GOLD,
-            "Mythic": (255, 0, 255)  # Bright magenta for mythic
-        }
-        color = rarity_colors.get(fish['rarity'], BLACK)
-        pygame.draw.rect(screen, color, (x + fish_size - 25, y + fish_size - 25, 20, 20))
-        pygame.draw.rect(screen, BLACK, (x + fish_size - 25, y + fish_size - 25, 20, 20), 1)
+        # Back to menu instruction
+        back_text = render_text(font, "Press ESC to return to menu", True, BLACK)
+        layer.blit(back_text, (WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT - 50))
 
-    # Back to menu instruction
-    back_text = font.render("Press ESC to return to menu", True, BLACK)
-    screen.blit(back_text, (WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT - 50))
+    # Catching or selling a fish bumps the inventory version and rebuilds the header
+    inputs = (font, game_data.background, game_data.inventory_version)
+    screen.blit(STATIC_LAYERS.get(GameState.FISH_INDEX, inputs, draw_static), (0, 0))
+
+    FISH_INDEX_VIEW.update_caught(inventory, game_data.inventory_version)
+    FISH_INDEX_VIEW.draw(screen, font)
 
 
 
@@ -1081,42 +1477,40 @@ def draw_fish_index_screen(screen, font, inventory, game_data):
 
 def draw_casting_screen(screen, font, game_data):
     """Draw the casting screen with instructions"""
-    # Load and draw background if available, otherwise use light blue
-    background = load_background(game_data.background)
-    if background:
-        screen.blit(background, (0, 0))
-    else:
-        screen.fill(LIGHT_BLUE)
+    def draw_static(layer):
+        draw_background(layer, game_data.background)
 
-    # Title
-    title = font.render("CAST YOUR ROD", True, DARK_BLUE)
-    title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
-    screen.blit(title, title_rect)
+        # Title
+        title = render_text(font, "CAST YOUR ROD", True, DARK_BLUE)
+        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
+        layer.blit(title, title_rect)
+
+        # Instructions
+        instruction = render_text(font, "Click anywhere to cast your rod!", True, BLACK)
+        instruction_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, 250))
+        layer.blit(instruction, instruction_rect)
 
-    # Instructions
-    instruction = font.render("Click anywhere to cast your rod!", True, BLACK)
-    instruction_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, 250))
-    screen.blit(instruction, instruction_rect)
+        # Visual representation of fisher casting
+        pygame.draw.circle(layer, GREEN, (WINDOW_WIDTH // 2, 150), 20)
+        player_text = render_text(font, "FISHER", True, BLACK)
+        player_rect = player_text.get_rect(center=(WINDOW_WIDTH // 2, 190))
+        layer.blit(player_text, player_rect)
 
-    # Visual representation of fisher casting
-    pygame.draw.circle(screen, GREEN, (WINDOW_WIDTH // 2, 150), 20)
-    player_text = font.render("FISHER", True, BLACK)
-    player_rect = player_text.get_rect(center=(WINDOW_WIDTH // 2, 190))
-    screen.blit(player_text, player_rect)
+        # Draw water area
+        pygame.draw.rect(layer, BLUE, (0, 220, WINDOW_WIDTH, WINDOW_HEIGHT - 220))
+        water_text = render_text(font, "WATER", True, WHITE)
+        layer.blit(water_text, (10, 230))
 
-    # Draw water area
-    pygame.draw.rect(screen, BLUE, (0, 220, WINDOW_WIDTH, WINDOW_HEIGHT - 220))
-    water_text = font.render("WATER", True, WHITE)
-    screen.blit(water_text, (10, 230))
+        # Draw fishing rod casting animation
+        pygame.draw.line(layer, BROWN, (WINDOW_WIDTH // 2, 170), (WINDOW_WIDTH // 2 + 100, 300), 3)
+        pygame.draw.circle(layer, RED, (WINDOW_WIDTH // 2 + 100, 300), 5)
 
-    # Draw fishing rod casting animation
-    pygame.draw.line(screen, BROWN, (WINDOW_WIDTH // 2, 170), (WINDOW_WIDTH // 2 + 100, 300), 3)
-    pygame.draw.circle(screen, RED, (WINDOW_WIDTH // 2 + 100, 300), 5)
+        # Additional hint
+        hint = render_text(font, "Click to start fishing!", True, DARK_BLUE)
+        hint_rect = hint.get_rect(center=(WINDOW_WIDTH // 2, 400))
+        layer.blit(hint, hint_rect)
 
-    # Additional hint
-    hint = font.render("Click to start fishing!", True, DARK_BLUE)
-    hint_rect = hint.get_rect(center=(WINDOW_WIDTH // 2, 400))
-    screen.blit(hint, hint_rect)
+    screen.blit(STATIC_LAYERS.get(GameState.CASTING, (font, game_data.background), draw_static), (0, 0))
 
     return True
 
@@ -1128,145 +1522,853 @@ def handle_casting_input(events):
                 return True
     return False
 
-def handle_inventory_selling(events, inventory, gold):
-    """Handle selling fish from inventory"""
+def handle_inventory_selling(events, inventory, gold, view=None):
+    """Handle selling fish from inventory
+
+    With an InventoryView the click goes through its scroll position and
+    sort order; without one, rows are in catch order and unscrolled.
+    """
     for event in events:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mouse_x, mouse_y = event.pos
-
-            # Check if click is within inventory item area
-            for i, fish in enumerate(inventory):
-                item_y = 135 + (i * 40)  # Starting y position + offset per item
-                if (50 <= mouse_x <= 600 and item_y <= mouse_y <= item_y + 30):
-                    # Sell the fish
-                    gold += fish['price']
-                    inventory.pop(i)  # Remove the fish from inventory
-                    return gold, True  # Return updated gold and success flag
+            # Find the clicked row by arithmetic on the row layout
+            if view is None:
+                i = INVENTORY_ROWS.row_at(event.pos, len(inventory))
+                clicked = None if i is None else (inventory[i], i)
+            else:
+                clicked = view.catch_at(inventory, event.pos)
+            if clicked is not None:
+                # Sell the fish
+                fish, position = clicked
+                gold += fish.price
+                if hasattr(inventory, "remove_catch"):
+                    inventory.remove_catch(fish, position)  # Remove the fish from inventory
+                else:
+                    inventory.pop(position)  # A plain list is only ever shown in catch order
+                return gold, True  # Return updated gold and success flag
 
     return gold, False
 
+# INVENTORY bulk sell shortcuts: 1-6 sell a rarity, Q sells everything below
+# INVENTORY_KEEP_QUALITY, B keeps only the best catch of each species
+INVENTORY_RARITY_KEYS = dict(zip([pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5, pygame.K_6],
+                                 RARITY_NAMES))
+INVENTORY_KEEP_QUALITY = "Good"
+
+def inventory_shortcut_filter(key, inventory):
+    """The catches a bulk sell key selects, as a sell_catches predicate, or None for other keys"""
+    if key in INVENTORY_RARITY_KEYS:
+        return rarity_filter(INVENTORY_RARITY_KEYS[key])
+    if key == pygame.K_q:
+        return below_quality_filter(INVENTORY_KEEP_QUALITY)
+    if key == pygame.K_b:
+        return all_but_best_filter(inventory)
+    return None
+
+class PendingSale:
+    """A bulk sell shortcut waiting for its key to be pressed a second time"""
+    def __init__(self):
+        self.key = None
+        self.count = 0
+        self.gold = 0
+
+    def cancel(self):
+        self.key = None
+
+    def draw(self, screen):
+        """Show what confirming would sell, over the shortcut hint line"""
+        if self.key is None:
+            return
+        prompt = render_text(get_font(24), f"Sell {self.count} fish for {self.gold} gold? "
+                             f"Press {pygame.key.name(self.key).upper()} again to confirm", True, BLACK)
+        rect = pygame.Rect(0, WINDOW_HEIGHT - 45, WINDOW_WIDTH, 40)
+        screen.fill(YELLOW, rect)
+        screen.blit(prompt, prompt.get_rect(center=rect.center))
+        RENDERER.track("sell_prompt", rect, prompt)
+
+INVENTORY_SALE = PendingSale()
+
+def handle_inventory_shortcuts(events, game_data, pending=INVENTORY_SALE):
+    """Handle the bulk sell keys on the inventory screen, returning the gold earned
+
+    The first press of a key only previews the sale; pressing the same key
+    again sells. Any other key or a click cancels the preview.
+    """
+    earned = 0
+    for event in events:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            pending.cancel()
+        elif event.type == pygame.KEYDOWN:
+            sold = inventory_shortcut_filter(event.key, game_data.inventory)
+            if sold is None:
+                pending.cancel()
+            elif event.key == pending.key:
+                earned += sell_catches(game_data, sold)
+                pending.cancel()
+            else:
+                pending.key = event.key
+                pending.count, pending.gold = sale_value(game_data.inventory, sold)
+    return earned
+
+# ============================================================================
+# PHASE 8: Asset Preloading
+# ============================================================================
+
+ASSET_DIRS = ["assets/Background", "assets/Fish Textures", "assets/Main Menu Icons"]
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# Decoded, display-converted images by asset path (filled by AssetPreloader)
+PRELOADED_IMAGES = {}
+
+def list_image_assets(asset_dirs=ASSET_DIRS):
+    """List the image files of the asset directories, using the game's path style"""
+    paths = []
+    for asset_dir in asset_dirs:
+        try:
+            file_names = sorted(os.listdir(asset_dir))
+        except OSError:
+            continue
+        for file_name in file_names:
+            if file_name.lower().endswith(IMAGE_EXTENSIONS):
+                paths.append(f"{asset_dir}/{file_name}")
+    return paths
+
+def decode_image(path):
+    """Read and decode an image file (safe to call from worker threads)"""
+    with open(path, "rb") as image_file:
+        data = image_file.read()
+    # The file name is passed as a type hint; SDL_image sniffs the real format
+    return pygame.image.load(io.BytesIO(data), path)
+
+def load_image(path):
+    """Return the preloaded image for path, decoding it now if it was not preloaded"""
+    image = PRELOADED_IMAGES.get(path)
+    if image is None:
+        image = pygame.image.load(path)
+    return image
+
+class AssetPreloader:
+    """Decode image assets on a thread pool while the main thread keeps the window responsive.
+
+    Workers only read and decode bytes; poll() runs on the main thread and
+    converts finished images to the display format into PRELOADED_IMAGES.
+    Files that fail to decode are skipped and load lazily (and fail) as before.
+    """
+
+    def __init__(self, paths=None, workers=None):
+        self.paths = list_image_assets() if paths is None else list(paths)
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self.executor = None
+        self.pending = []
+        self.loaded = 0
+        self.failed = []
+
+    def start(self):
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-decode")
+        self.pending = [(path, self.executor.submit(decode_image, path)) for path in self.paths]
+        return self
+
+    def poll(self):
+        """Convert every finished decode; return True once all assets are done"""
+        still_pending = []
+        for path, future in self.pending:
+            if not future.done():
+                still_pending.append((path, future))
+                continue
+            try:
+                image = future.result()
+            except (pygame.error, OSError):
+                self.failed.append(path)
+            else:
+                if get_display_format() is not None:
+                    image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+                PRELOADED_IMAGES[path] = image
+            self.loaded += 1
+        self.pending = still_pending
+        if not self.pending and self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        return not self.pending
+
+    def finish(self):
+        """Block until every asset is loaded"""
+        for path, future in self.pending:
+            future.exception()
+        self.poll()
+
+    @property
+    def progress(self):
+        return self.loaded / len(self.paths) if self.paths else 1.0
+
+def draw_loading_screen(screen, font, progress):
+    """Draw the startup loading screen with a progress bar"""
+    screen.fill(LIGHT_BLUE)
+
+    title = render_text(font, "LOADING...", True, DARK_BLUE)
+    title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
+    screen.blit(title, title_rect)
+
+    bar_rect = pygame.Rect(WINDOW_WIDTH // 2 - 200, WINDOW_HEIGHT // 2, 400, 30)
+    pygame.draw.rect(screen, WHITE, bar_rect)
+    pygame.draw.rect(screen, GREEN, (bar_rect.x, bar_rect.y, int(bar_rect.width * progress), bar_rect.height))
+    pygame.draw.rect(screen, BLACK, bar_rect, 2)
+
+def preload_assets(screen, font, clock):
+    """Preload all image assets while showing the loading screen; False if the window was closed"""
+    preloader = AssetPreloader().start()
+    while not preloader.poll():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                preloader.finish()
+                return False
+        draw_loading_screen(screen, font, preloader.progress)
+        pygame.display.flip()
+        clock.tick(FPS)
+    return True
+
+# ============================================================================
+# PHASE 8: Prescaled Asset Bundle
+# ============================================================================
+
+ASSET_BUNDLE_PATH = "assets/assets.bundle"
+
+class AssetBundle:
+    """Prescaled raw-pixel assets memory-mapped from a single bundle file.
+
+    Layout: a header (magic, version, index length), a JSON index, then the
+    raw pixel data. Each index entry records the source path, the target size
+    it was scaled for, its stored pixel size and format, and its offset into
+    the pixel data. Surfaces wrap the mapped bytes with pygame.image.frombuffer,
+    so nothing is decoded at runtime. Build the bundle with asset_tools.py.
+    """
+
+    MAGIC = b"FMAB"
+    VERSION = 1
+    HEADER = struct.Struct("<4sII")
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as bundle_file:
+            self.data = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_length = self.HEADER.unpack_from(self.data, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.data.close()
+            raise ValueError(f"{path} is not a version {self.VERSION} asset bundle")
+        index_end = self.HEADER.size + index_length
+        self.entries = {(entry["path"], tuple(entry["target"])): entry
+                        for entry in json.loads(self.data[self.HEADER.size:index_end])}
+        self.pixels_start = index_end
+        self.surfaces = {}
+
+    @classmethod
+    def write(cls, path, images):
+        """Write (source path, target size, surface) triples to a bundle file"""
+        entries = []
+        pixels = []
+        offset = 0
+        for source_path, target, surface in images:
+            pixel_format = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+            data = pygame.image.tobytes(surface, pixel_format)
+            entries.append({"path": source_path, "target": list(target), "size": list(surface.get_size()),
+                            "format": pixel_format, "offset": offset})
+            pixels.append(data)
+            offset += len(data)
+        index = json.dumps(entries).encode("utf-8")
+        with open(path, "wb") as bundle_file:
+            bundle_file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(index)))
+            bundle_file.write(index)
+            for data in pixels:
+                bundle_file.write(data)
+
+    def is_stale(self):
+        """True if any source asset changed after the bundle was written"""
+        built_at = os.path.getmtime(self.path)
+        for source_path, target in self.entries:
+            if not os.path.exists(source_path) or os.path.getmtime(source_path) > built_at:
+                return True
+        return False
+
+    def get(self, path, target):
+        """Return the surface bundled for (path, target size) or None"""
+        key = (path, tuple(target))
+        if key in self.surfaces:
+            return self.surfaces[key]
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        size = tuple(entry["size"])
+        start = self.pixels_start + entry["offset"]
+        length = size[0] * size[1] * len(entry["format"])
+        surface = pygame.image.frombuffer(memoryview(self.data)[start:start + length], size, entry["format"])
+        if get_display_format() is not None:
+            surface = surface.convert_alpha() if entry["format"] == "RGBA" else surface.convert()
+        self.surfaces[key] = surface
+        return surface
+
+# Opened by open_asset_bundle() at startup; None means load from the source files
+ASSET_BUNDLE = None
+
+def open_asset_bundle(path=ASSET_BUNDLE_PATH):
+    """Open the prescaled asset bundle if present and up to date; return True on success"""
+    global ASSET_BUNDLE
+    try:
+        bundle = AssetBundle(path)
+    except (OSError, ValueError, struct.error):
+        return False
+    if bundle.is_stale():
+        return False
+    ASSET_BUNDLE = bundle
+    return True
+
+def get_bundled_image(path, target):
+    """Return the bundled surface for path scaled to target, or None"""
+    if ASSET_BUNDLE is None:
+        return None
+    return ASSET_BUNDLE.get(path, target)
+
 # ============================================================================
 # PHASE 8: Background and Fish Texture System
 # ============================================================================
 
+def get_display_format():
+    """Return a hashable description of the display pixel format (None without a window)"""
+    display = pygame.display.get_surface() if pygame.display.get_init() else None
+    if display is None:
+        return None
+    return (display.get_bitsize(), display.get_masks())
+
+def get_window_size():
+    """Return the current window size, falling back to the default window size"""
+    display = pygame.display.get_surface() if pygame.display.get_init() else None
+    if display is None:
+        return (WINDOW_WIDTH, WINDOW_HEIGHT)
+    return display.get_size()
+
+class SurfaceCache:
+    """Cache of decoded, scaled and display-converted surfaces.
+
+    Entries are keyed by (path, target size, pixel format), so a change of
+    window size or display format simply misses. Failed loads are cached as
+    None so a missing file costs one failed open, not one per frame. With
+    max_entries set, the cache is cleared before it would grow past the limit.
+    """
+
+    def __init__(self, max_entries=None):
+        self.surfaces = {}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, size):
+        key = (path, tuple(size), get_display_format())
+        if key in self.surfaces:
+            self.hits += 1
+            return self.surfaces[key]
+
+        self.misses += 1
+        if self.max_entries is not None and len(self.surfaces) >= self.max_entries:
+            self.surfaces.clear()
+        try:
+            surface = get_bundled_image(path, key[1])
+            if surface is None:
+                surface = pygame.transform.scale(load_image(path), key[1])
+            if key[2] is not None:
+                surface = surface.convert()
+        except (pygame.error, OSError):
+            surface = None
+        self.surfaces[key] = surface
+        return surface
+
+    def invalidate(self):
+        """Drop every cached surface (hit/miss counters are kept)"""
+        self.surfaces.clear()
+
+    def stats(self):
+        """Return cache counters for debug output"""
+        return {"entries": len(self.surfaces), "hits": self.hits, "misses": self.misses}
+
+# Only the active background is kept: switching it with the background cheat
+# or resizing the window evicts the previous entry.
+BACKGROUND_CACHE = SurfaceCache(max_entries=1)
+
 def load_background(background_path):
     """Load background image or return None if not found"""
     if background_path:
-        try:
-            background = pygame.image.load(background_path)
-            # Scale the background to fit the screen
-            return pygame.transform.scale(background, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        except:
-            # Return None if background not found
-            return None
+        # Decoded and scaled once, then served from the cache every frame
+        return BACKGROUND_CACHE.get(background_path, get_window_size())
     return None
 
-def get_fish_texture_path(fish_name):
-    """Convert fish name to texture filename"""
+FISH_TEXTURE_DIR = "assets/Fish Textures"
+
+# Texture files whose names are misspelled relative to the fish name
+FISH_TEXTURE_ALIASES = {
+    "Minnow": "Minow.jpg",
+    "Titan Sturgeon": "TitainSturgeon.jpg",
+}
+
+# Manifest entry for a species without a texture; screens draw their text fallback
+MISSING_TEXTURE = None
+
+def get_default_texture_file(fish_name):
+    """Convert fish name to the conventional texture filename"""
     # Remove spaces and special characters from fish name
     texture_name = fish_name.replace(" ", "").replace("'", "").replace(".", "")
-    return f"assets/Fish Textures/{texture_name}.jpg"
+    return f"{texture_name}.jpg"
+
+def normalize_texture_key(name):
+    """Reduce a fish or file name to lowercase letters and digits, without extensions"""
+    return "".join(char for char in name.split(".")[0].lower() if char.isalnum())
 
-def load_fish_texture(fish_name):
+def build_asset_manifest(fish_names=None, texture_dir=FISH_TEXTURE_DIR):
+    """Map every species to its resolved texture path or MISSING_TEXTURE.
+
+    Resolution order: explicit alias, conventional file name, then a file whose
+    normalized name matches (handles curly apostrophes and double extensions).
+    """
+    if fish_names is None:
+        fish_names = [fish['name'] for fish in get_all_fish_list()]
+    try:
+        texture_files = sorted(os.listdir(texture_dir))
+    except OSError:
+        texture_files = []
+    available = set(texture_files)
+    by_key = {normalize_texture_key(file_name): file_name for file_name in texture_files}
+
+    manifest = {}
+    for fish_name in fish_names:
+        file_name = FISH_TEXTURE_ALIASES.get(fish_name)
+        if file_name not in available:
+            file_name = get_default_texture_file(fish_name)
+        if file_name not in available:
+            file_name = by_key.get(normalize_texture_key(fish_name))
+        manifest[fish_name] = f"{texture_dir}/{file_name}" if file_name else MISSING_TEXTURE
+    return manifest
+
+# Built on first use; every texture lookup afterwards is a dict lookup
+ASSET_MANIFEST = None
+
+def get_asset_manifest():
+    """Return the species -> texture path manifest, building it once"""
+    global ASSET_MANIFEST
+    if ASSET_MANIFEST is None:
+        ASSET_MANIFEST = build_asset_manifest()
+    return ASSET_MANIFEST
+
+def get_fish_texture_path(fish_name):
+    """Return the fish's texture path or MISSING_TEXTURE"""
+    return get_asset_manifest().get(fish_name, MISSING_TEXTURE)
+
+def load_fish_texture(fish_name, size=(200, 150)):
     """Load fish texture or return None if not found"""
     texture_path = get_fish_texture_path(fish_name)
+    if texture_path is MISSING_TEXTURE:
+        # Known to have no texture - skip the failed open
+        return None
+    texture = get_bundled_image(texture_path, size)
+    if texture is not None:
+        return texture
     try:
-        texture = pygame.image.load(texture_path)
+        texture = load_image(texture_path)
         # Scale the texture to a reasonable size
-        return pygame.transform.scale(texture, (200, 150))
+        return pygame.transform.scale(texture, size)
     except:
         # Return None if texture not found
         return None
 
-def draw_fish_display_screen(screen, font, fish_info, quality, quality_score, selling_price):
-    """Draw the fish display screen showing caught fish (3-second notification)"""
-    screen.fill(LIGHT_BLUE)
+# ============================================================================
+# PHASE 8: Fish Texture Atlas
+# ============================================================================
 
-    title = font.render("FISH CAUGHT!", True, DARK_BLUE)
-    title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
-    screen.blit(title, title_rect)
+FISH_TEXTURE_SIZE = (200, 150)  # Selling / fish display screens
+FISH_THUMBNAIL_SIZE = (90, 90)  # Fish index grid cells
+ATLAS_DIR = "assets/atlas"
+ATLAS_MAX_SHEET_SIZE = (2048, 2048)
+
+class FishTextureAtlas:
+    """Fish textures of one cell size packed into a few display-format sheets.
+
+    index maps a fish name to (sheet number, rect) so drawing a fish is a dict
+    lookup and a blit of a subsurface - no file I/O or scaling per frame.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = tuple(cell_size)
+        self.sheets = []
+        self.index = {}
+        self.subsurfaces = {}
+
+    @classmethod
+    def build(cls, fish_names, cell_size, max_sheet_size=ATLAS_MAX_SHEET_SIZE):
+        """Load, scale and pack the texture of every fish that has one"""
+        atlas = cls(cell_size)
+        textures = []
+        for fish_name in fish_names:
+            texture = load_fish_texture(fish_name, atlas.cell_size)
+            if texture:
+                textures.append((fish_name, texture))
+
+        cell_width, cell_height = atlas.cell_size
+        columns = max(1, max_sheet_size[0] // cell_width)
+        cells_per_sheet = columns * max(1, max_sheet_size[1] // cell_height)
+
+        for start in range(0, len(textures), cells_per_sheet):
+            chunk = textures[start:start + cells_per_sheet]
+            rows = (len(chunk) + columns - 1) // columns
+            sheet = pygame.Surface((min(len(chunk), columns) * cell_width, rows * cell_height))
+            for i, (fish_name, texture) in enumerate(chunk):
+                rect = pygame.Rect((i % columns) * cell_width, (i // columns) * cell_height,
+                                   cell_width, cell_height)
+                sheet.blit(texture, rect)
+                atlas.index[fish_name] = (len(atlas.sheets), rect)
+            atlas.sheets.append(sheet)
+
+        atlas._finalize()
+        return atlas
+
+    @classmethod
+    def load(cls, directory, cell_size):
+        """Load a prebuilt atlas, or return None if it is missing or stale"""
+        index_path = os.path.join(directory, f"fish_{cell_size[0]}x{cell_size[1]}.json")
+        try:
+            with open(index_path) as index_file:
+                data = json.load(index_file)
+            built_at = os.path.getmtime(index_path)
+            # Rebuild instead of showing outdated artwork
+            for fish_name, texture_path in get_asset_manifest().items():
+                if texture_path is MISSING_TEXTURE:
+                    if fish_name in data["index"]:
+                        return None
+                elif fish_name not in data["index"] or os.path.getmtime(texture_path) > built_at:
+                    return None
+            atlas = cls(data["cell_size"])
+            atlas.sheets = [pygame.image.load(os.path.join(directory, sheet_file))
+                            for sheet_file in data["sheets"]]
+        except (pygame.error, OSError, ValueError, KeyError):
+            return None
+        atlas.index = {fish_name: (sheet_number, pygame.Rect(rect))
+                       for fish_name, (sheet_number, rect) in data["index"].items()}
+        atlas._finalize()
+        return atlas
+
+    def save(self, directory):
+        """Write the sheets as PNG files plus a JSON name -> rect index"""
+        os.makedirs(directory, exist_ok=True)
+        prefix = f"fish_{self.cell_size[0]}x{self.cell_size[1]}"
+        sheet_files = []
+        for number, sheet in enumerate(self.sheets):
+            sheet_file = f"{prefix}_{number}.png"
+            pygame.image.save(sheet, os.path.join(directory, sheet_file))
+            sheet_files.append(sheet_file)
+        data = {
+            "cell_size": list(self.cell_size),
+            "sheets": sheet_files,
+            "index": {fish_name: [sheet_number, list(rect)]
+                      for fish_name, (sheet_number, rect) in self.index.items()},
+        }
+        with open(os.path.join(directory, f"{prefix}.json"), "w") as index_file:
+            json.dump(data, index_file, indent=2)
+
+    def _finalize(self):
+        """Convert sheets to the display format and cut the per-fish subsurfaces"""
+        if get_display_format() is not None:
+            self.sheets = [sheet.convert() for sheet in self.sheets]
+        self.subsurfaces = {fish_name: self.sheets[sheet_number].subsurface(rect)
+                            for fish_name, (sheet_number, rect) in self.index.items()}
+
+    def get(self, fish_name):
+        """Return the fish's subsurface or None if it has no texture"""
+        return self.subsurfaces.get(fish_name)
+
+# Built by init_fish_atlases() once the window exists; until then the
+# texture helpers below fall back to loading from disk.
+FISH_ATLAS = None
+FISH_THUMBNAIL_ATLAS = None
+
+def init_fish_atlases(directory=ATLAS_DIR):
+    """Load the prebuilt fish atlases (see asset_tools.py) or build them now"""
+    global FISH_ATLAS, FISH_THUMBNAIL_ATLAS
+    fish_names = [fish['name'] for fish in get_all_fish_list()]
+    atlases = []
+    for cell_size in (FISH_TEXTURE_SIZE, FISH_THUMBNAIL_SIZE):
+        atlas = FishTextureAtlas.load(directory, cell_size)
+        if atlas is None:
+            atlas = FishTextureAtlas.build(fish_names, cell_size)
+        atlases.append(atlas)
+    FISH_ATLAS, FISH_THUMBNAIL_ATLAS = atlases
+    # Variants were cut from the previous atlases (or loaded from disk)
+    FISH_VARIANTS.invalidate()
+    FISH_VARIANTS.warm(fish_names, FISH_THUMBNAIL_SIZE)
+
+# Rarity colour indicators shared by the fish screens
+RARITY_COLORS = {
+    "Common": GRAY,
+    "Uncommon": GREEN,
+    "Rare": BLUE,
+    "Epic": PURPLE,
+    "Legendary": GOLD,
+    "Mythic": (255, 0, 255)  # Bright magenta for mythic
+}
 
-    # Fish info
-    fish_name = font.render(f"Fish: {fish_info['name']}", True, BLACK)
-    fish_rarity = font.render(f"Rarity: {fish_info['rarity']}", True, BLACK)
-    quality_text = font.render(f"Quality: {quality} ({int(quality_score)}%)", True, BLACK)
-    price_text = font.render(f"Selling Price: {selling_price} gold", True, BLACK)
+class FishVariantCache:
+    """Cache of per-fish display variants keyed by (fish name, size, effect).
 
-    screen.blit(fish_name, (100, 150))
-    screen.blit(fish_rarity, (100, 200))
-    screen.blit(quality_text, (100, 250))
-    screen.blit(price_text, (100, 300))
+    Effects:
+        normal  - the texture scaled to size
+        greyed  - darkened, semi-transparent silhouette for uncaught fish
+        tinted  - texture washed with the fish's rarity colour
 
-    # Rarity color indicator
-    rarity_colors = {
-        "Common": GRAY,
-        "Uncommon": GREEN,
-        "Rare": BLUE,
-        "Epic": PURPLE,
-        "Legendary": GOLD,
-        "Mythic": (255, 0, 255)  # Bright magenta for mythic
-    }
-    color = rarity_colors.get(fish_info['rarity'], BLACK)
-    pygame.draw.rect(screen, color, (500, 195, 30, 30))
-    pygame.draw.rect(screen, BLACK, (500, 195, 30, 30), 2)
+    Every combination is produced once, so a screen only picks which cached
+    variant to blit (e.g. catching a fish swaps "greyed" for "normal").
+    Only the effects the FISH_INDEX screen draws are warmed; the others are
+    built on first use.
+    """
 
-    # Load and display fish texture
-    fish_texture = load_fish_texture(fish_info['name'])
-    if fish_texture:
-        # Display fish texture on the right side
-        screen.blit(fish_texture, (450, 100))
+    EFFECTS = ("normal", "greyed", "tinted")
+    WARM_EFFECTS = ("normal", "greyed")
 
-    instruction = font.render("Fish added to inventory!", True, BLACK)
-    screen.blit(instruction, (100, 400))
+    def __init__(self):
+        self.variants = {}
+        self.rarities = {fish['name']: fish['rarity'] for fish in get_all_fish_list()}
+
+    def get(self, fish_name, size, effect="normal"):
+        key = (fish_name, tuple(size), effect)
+        if key not in self.variants:
+            self.variants[key] = self._make_variant(*key)
+        return self.variants[key]
+
+    def warm(self, fish_names, size, effects=WARM_EFFECTS):
+        """Produce the variants up front so the first frame does no transforms either"""
+        for fish_name in fish_names:
+            for effect in effects:
+                self.get(fish_name, size, effect)
+
+    def _make_variant(self, fish_name, size, effect):
+        if effect == "normal":
+            if size == FISH_THUMBNAIL_SIZE:
+                return get_fish_thumbnail(fish_name)
+            if size == FISH_TEXTURE_SIZE:
+                return get_fish_surface(fish_name)
+            texture = get_fish_surface(fish_name)
+            return pygame.transform.scale(texture, size) if texture else None
+
+        texture = self.get(fish_name, size, "normal")
+        if not texture:
+            return None
+        variant = texture.copy()
+        if effect == "greyed":
+            # Greyed out effect with 70% transparency
+            variant.fill((128, 128, 128, 178), special_flags=pygame.BLEND_RGBA_MULT)
+        elif effect == "tinted":
+            tint = pygame.Surface(size)
+            tint.fill(RARITY_COLORS.get(self.rarities.get(fish_name), BLACK))
+            tint.set_alpha(90)
+            variant.blit(tint, (0, 0))
+        else:
+            raise ValueError(f"Unknown fish variant effect: {effect}")
+        return variant
+
+    def invalidate(self):
+        """Drop all variants (e.g. after the atlases were rebuilt)"""
+        self.variants.clear()
+
+    def memory_bytes(self):
+        """Pixel memory owned by the cache; normal variants share atlas sheets and are not counted"""
+        total = 0
+        for (fish_name, size, effect), variant in self.variants.items():
+            if variant and variant.get_parent() is None:
+                total += variant.get_width() * variant.get_height() * variant.get_bytesize()
+        return total
+
+    def stats(self):
+        """Return cache counters for debug output"""
+        return {"variants": len(self.variants), "memory_kb": self.memory_bytes() // 1024}
+
+FISH_VARIANTS = FishVariantCache()
+
+def get_fish_surface(fish_name):
+    """Return the 200x150 fish texture or None if not found"""
+    if FISH_ATLAS is not None:
+        return FISH_ATLAS.get(fish_name)
+    return load_fish_texture(fish_name, FISH_TEXTURE_SIZE)
+
+def get_fish_thumbnail(fish_name):
+    """Return the fish index thumbnail or None if not found"""
+    if FISH_THUMBNAIL_ATLAS is not None:
+        return FISH_THUMBNAIL_ATLAS.get(fish_name)
+    return load_fish_texture(fish_name, FISH_THUMBNAIL_SIZE)
+
+def draw_fish_display_screen(screen, font, fish_info, quality, quality_score, selling_price):
+    """Draw the fish display screen showing caught fish (3-second notification)"""
+    def draw_static(layer):
+        draw_caught_fish_details(layer, font, fish_info, quality, quality_score, selling_price,
+                                 "Fish added to inventory!")
+
+    inputs = (font, fish_info['name'], fish_info['rarity'], quality, quality_score, selling_price)
+    screen.blit(STATIC_LAYERS.get(GameState.FISH_DISPLAY, inputs, draw_static), (0, 0))
 
 # ============================================================================
 # PHASE 9: Main Game Loop
 # ============================================================================
 
-def main():
-    """Main game function"""
+def get_scene_key(current_state, current_stage, game_data, show_debug=False):
+    """Everything that changes the static parts of the screen; a new key redraws it all"""
+    return (current_state, current_stage if current_state == GameState.FISHING else None,
+            game_data.background, game_data.current_rod, game_data.inventory_version, show_debug)
+
+def draw_game_state(screen, font, small_font, current_state, current_stage, stages, buttons, game_data):
+    """Draw the screen of the current game state"""
+    # Every screen starts by blitting its full-window static layer, so no clear is needed
+    if current_state == GameState.MAIN_MENU:
+        draw_main_menu(screen, font, buttons, game_data.cheat_mode, game_data.price_cheat, game_data.gold, game_data)
+    elif current_state == GameState.GUIDE:
+        draw_guide_screen(screen, font, game_data)
+    elif current_state == GameState.SHOP:
+        draw_shop_screen(screen, font, game_data.current_rod, game_data.gold, game_data)
+    elif current_state == GameState.CASTING:
+        draw_casting_screen(screen, font, game_data)
+    elif current_state == GameState.FISHING:
+        draw_fishing_interface(screen, font, small_font, current_stage, stages, game_data.gold, game_data.current_rod)
+    elif current_state == GameState.SELLING:
+        draw_selling_screen(screen, font,
+                          game_data.caught_fish.info,
+                          game_data.caught_fish.quality,
+                          game_data.caught_fish.quality_score,
+                          game_data.caught_fish.price)
+
+    elif current_state == GameState.FISH_DISPLAY:
+        draw_fish_display_screen(screen, font,
+                              game_data.caught_fish.info,
+                              game_data.caught_fish.quality,
+                              game_data.caught_fish.quality_score,
+                              game_data.caught_fish.price)
+
+    elif current_state == GameState.FISH_INDEX:
+        draw_fish_index_screen(screen, font, game_data.inventory, game_data)
+
+    elif current_state == GameState.INVENTORY:
+        draw_inventory_screen(screen, font, game_data.inventory, game_data.gold, game_data)
+
+def main(record_path=None, replay_path=None, headless=False, seed=None,
+         timings_path=None, baseline_path=None, inventory_capacity=None):
+    """Main game function
+
+    record_path writes the session's seed, frame times and input to a file;
+    replay_path plays such a file back instead of reading the keyboard and
+    mouse, and reports per-frame update/draw times. headless replays on the
+    dummy video driver without the FPS cap. inventory_capacity replaces the
+    default of 20 fish. A replay uses the capacity and stage parameters
+    stored in the recording, never a stage_parameters.json in the working
+    directory.
+    """
+    startup_time = time.perf_counter()
+    replayer = InputReplayer(replay_path) if replay_path else None
+    if replayer:
+        if inventory_capacity and inventory_capacity != replayer.inventory_capacity:
+            raise ValueError(f"{replay_path} was recorded with an inventory capacity of "
+                             f"{replayer.inventory_capacity}, not {inventory_capacity}")
+        seed = replayer.seed
+        inventory_capacity = replayer.inventory_capacity
+    elif record_path and seed is None:
+        seed = int.from_bytes(os.urandom(4), "little")
+    if seed is not None:
+        random.seed(seed)
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+    # Only the subsystems the game uses - no audio, joystick, etc.
+    pygame.display.init()
+    pygame.font.init()
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("Fishing Mastery - Enhanced 2D Timing Game")
     clock = pygame.time.Clock()
-    
+
+    # Fonts
+    font = get_font(36)
+    small_font = get_font(24)
+
+    # Use the prescaled asset bundle when available, otherwise decode every
+    # image on worker threads behind a loading screen
+    if not open_asset_bundle() and not preload_assets(screen, font, clock):
+        pygame.quit()
+        return
+
+    # Difficulty knobs: a replay uses the ones it was recorded with, otherwise
+    # the ones tuned by fishing_tuner.py when a parameter file exists
+    if replayer:
+        apply_stage_parameters(replayer.stage_parameters, replay_path)
+    elif load_stage_parameters():
+        print(f"Loaded stage parameters from {STAGE_PARAMETERS_PATH}")
+
+    # Resolve every species to its texture file once, then pack the fish
+    # textures so no screen decodes or scales them per frame
+    get_asset_manifest()
+    init_fish_atlases()
+
     # Game data
     game_data = GameData()
-    
-    # Fonts
-    font = pygame.font.Font(None, 36)
-    small_font = pygame.font.Font(None, 24)
-    
+    if inventory_capacity:
+        game_data.inventory_capacity = inventory_capacity
+
     # Buttons for main menu - using icons instead of text
-    start_button = Button(WINDOW_WIDTH // 2 - 75, 200, 150, 40, "START FISHING", GREEN, DARK_GREEN, font, "assets/Main Menu Icons/STARTFISHING.png")
-    guide_button = Button(WINDOW_WIDTH // 2 - 75, 260, 150, 40, "GUIDE", BLUE, DARK_BLUE, font, "assets/Main Menu Icons/GUIDE.png")
-    shop_button = Button(WINDOW_WIDTH // 2 - 75, 320, 150, 40, "SHOP", ORANGE, BROWN, font, "assets/Main Menu Icons/SHOP.png")
-    fish_index_button = Button(WINDOW_WIDTH // 2 - 75, 380, 150, 40, "FISH INDEX", (0, 150, 150), (0, 100, 100), font, "assets/Main Menu Icons/FISHINDEX.png")
-    inventory_button = Button(WINDOW_WIDTH // 2 - 75, 440, 150, 40, "INVENTORY", PURPLE, (100, 0, 100), font, "assets/Main Menu Icons/INVENTORY.png")
-    quit_button = Button(WINDOW_WIDTH // 2 - 75, 500, 150, 40, "QUIT", RED, (150, 0, 0), font, "assets/Main Menu Icons/QUIT.png")
+    start_button = Button(WINDOW_WIDTH // 2 - 75, 200, *MENU_BUTTON_SIZE, "START FISHING", GREEN, DARK_GREEN, font, "assets/Main Menu Icons/STARTFISHING.png")
+    guide_button = Button(WINDOW_WIDTH // 2 - 75, 260, *MENU_BUTTON_SIZE, "GUIDE", BLUE, DARK_BLUE, font, "assets/Main Menu Icons/GUIDE.png")
+    shop_button = Button(WINDOW_WIDTH // 2 - 75, 320, *MENU_BUTTON_SIZE, "SHOP", ORANGE, BROWN, font, "assets/Main Menu Icons/SHOP.png")
+    fish_index_button = Button(WINDOW_WIDTH // 2 - 75, 380, *MENU_BUTTON_SIZE, "FISH INDEX", (0, 150, 150), (0, 100, 100), font, "assets/Main Menu Icons/FISHINDEX.png")
+    inventory_button = Button(WINDOW_WIDTH // 2 - 75, 440, *MENU_BUTTON_SIZE, "INVENTORY", PURPLE, (100, 0, 100), font, "assets/Main Menu Icons/INVENTORY.png")
+    quit_button = Button(WINDOW_WIDTH // 2 - 75, 500, *MENU_BUTTON_SIZE, "QUIT", RED, (150, 0, 0), font, "assets/Main Menu Icons/QUIT.png")
     buttons = [start_button, guide_button, shop_button, fish_index_button, inventory_button, quit_button]
     
     # Game stages
-    stages = [
-        CastTimingStage(),
-        DepthControlStage(),
-        BiteReactionStage(),
-        ReelingRhythmStage()
-    ]
+    stages = make_fishing_stages()
     
     current_state = GameState.MAIN_MENU
     current_stage = 1
     running = True
-    fish_display_start_time = 0  # Timer for fish display state
-    
+    fish_display_start_time = 0  # Timer for fish display state (simulation time)
+    timestep = FixedTimestep(SIM_STEP)
+    show_debug = DEBUG  # Cache statistics overlay
+    recorder = InputRecorder(record_path, seed, game_data.inventory_capacity) if record_path else None
+    timings = FrameTimings() if replayer else None
+
+    if DEBUG:
+        print(f"Startup to interactive: {(time.perf_counter() - startup_time) * 1000:.0f} ms")
+
     while running:
-        dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
-        events = pygame.event.get()
+        if replayer:
+            # Recorded dt and events drive the frame; headless runs uncapped
+            if not headless:
+                clock.tick(FPS)
+                pygame.event.pump()
+            frame = replayer.next_frame()
+            if frame is None:
+                break
+            dt, ticks, events = frame
+            update_start = time.perf_counter()
+        else:
+            dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
+            events = pygame.event.get()
+            ticks = pygame.time.get_ticks()
+        if recorder:
+            recorder.record_frame(dt, ticks, events)
+
+        # Advance game time in fixed steps; the fishing stages simulate
+        # inside the same steps so their physics never sees a long frame
+        for _ in range(timestep.advance(dt)):
+            SIM_CLOCK.advance(SIM_STEP)
+            if current_state == GameState.FISHING and current_stage <= 4:
+                stages[current_stage - 1].update(SIM_STEP)
         
         # Handle quit event
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
+        handle_window_exposure(events)
+
+        # Toggle the cache statistics overlay (F3 key)
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                show_debug = not show_debug
+
         # Handle fullscreen toggle (F11 key) - TEMPORARILY DISABLED
         # for event in events:
         #     if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
@@ -1289,12 +2391,7 @@ def main():
                             current_state = GameState.CASTING
                             current_stage = 1
                             # Reset stages
-                            stages = [
-                                CastTimingStage(),
-                                DepthControlStage(),
-                                BiteReactionStage(),
-                                ReelingRhythmStage()
-                            ]
+                            stages = make_fishing_stages()
                         elif button.text == "GUIDE":
                             current_state = GameState.GUIDE
                         elif button.text == "SHOP":
@@ -1331,22 +2428,27 @@ def main():
 
         elif current_state == GameState.FISH_INDEX:
             for event in events:
+                FISH_INDEX_VIEW.handle_event(event)
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     current_state = GameState.MAIN_MENU
 
         elif current_state == GameState.INVENTORY:
             # Handle inventory selling
-            game_data.gold, sold_fish = handle_inventory_selling(events, game_data.inventory, game_data.gold)
+            game_data.gold, sold_fish = handle_inventory_selling(events, game_data.inventory, game_data.gold,
+                                                                 INVENTORY_VIEW)
+            if sold_fish:
+                game_data.inventory_version += 1
+            handle_inventory_shortcuts(events, game_data)
 
             for event in events:
+                INVENTORY_VIEW.handle_event(event, len(game_data.inventory))
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     current_state = GameState.MAIN_MENU
         
         elif current_state == GameState.FISHING:
-            # Update current stage
+            # Stage updates run in the fixed-step loop above
             if current_stage <= 4:
                 stage_index = current_stage - 1
-                stages[stage_index].update(dt)
 
                 # Handle input for current stage
                 stages[stage_index].handle_input(events)
@@ -1356,32 +2458,15 @@ def main():
                     if current_stage < 4:
                         current_stage += 1
                     else:
-                        # Calculate final results with simplified quality system (4 stages only)
-                        stage_scores = [stage.score for stage in stages]
-                        quality_score = sum(stage_scores) / len(stage_scores)
-                        quality = calculate_quality([quality_score])
-
-                        # Spawn fish
-                        fish_info = spawn_fish(game_data.rod_luck[game_data.current_rod], game_data.cheat_mode)
-                        selling_price = calculate_selling_price(fish_info['rarity'], quality_score, game_data)
-
-                        # Create fish data
-                        caught_fish = {
-                            'info': fish_info,
-                            'quality': quality,
-                            'quality_score': quality_score,
-                            'price': selling_price
-                        }
+                        # Spawn and price the fish with simplified quality system (4 stages only)
+                        caught_fish = create_caught_fish([stage.score for stage in stages], game_data)
 
                         # Add to inventory if there's space
-                        if len(game_data.inventory) < game_data.inventory_capacity:
-                            game_data.inventory.append(caught_fish)
-                            game_data.caught_fish = caught_fish
+                        if store_caught_fish(game_data, caught_fish):
                             current_state = GameState.FISH_DISPLAY
-                            fish_display_start_time = time.time()  # Start timer for fish display
+                            fish_display_start_time = SIM_CLOCK.now  # Start timer for fish display
                         else:
                             # Inventory full, go directly to selling
-                            game_data.caught_fish = caught_fish
                             current_state = GameState.SELLING
 
             # Handle escape to return to menu
@@ -1391,7 +2476,7 @@ def main():
         
         elif current_state == GameState.FISH_DISPLAY:
             # Check if 3 seconds have passed
-            if time.time() - fish_display_start_time >= 3.0:
+            if SIM_CLOCK.now - fish_display_start_time >= 3.0:
                 current_state = GameState.MAIN_MENU
                 game_data.caught_fish = None
 
@@ -1405,46 +2490,52 @@ def main():
             for event in events:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                     # Sell fish and return to menu
-                    game_data.gold += game_data.caught_fish['price']
+                    game_data.gold += game_data.caught_fish.price
                     game_data.caught_fish = None
                     current_state = GameState.MAIN_MENU
         
         # Drawing
-        screen.fill(WHITE)
-
-        if current_state == GameState.MAIN_MENU:
-            draw_main_menu(screen, font, buttons, game_data.cheat_mode, game_data.price_cheat, game_data.gold, game_data)
-        elif current_state == GameState.GUIDE:
-            draw_guide_screen(screen, font, game_data)
-        elif current_state == GameState.SHOP:
-            draw_shop_screen(screen, font, game_data.current_rod, game_data.gold, game_data)
-        elif current_state == GameState.CASTING:
-            draw_casting_screen(screen, font, game_data)
-        elif current_state == GameState.FISHING:
-            draw_fishing_interface(screen, font, small_font, current_stage, stages, game_data.gold, game_data.current_rod)
-        elif current_state == GameState.SELLING:
-            draw_selling_screen(screen, font,
-                              game_data.caught_fish['info'],
-                              game_data.caught_fish['quality'],
-                              game_data.caught_fish['quality_score'],
-                              game_data.caught_fish['price'])
-
-        elif current_state == GameState.FISH_DISPLAY:
-            draw_fish_display_screen(screen, font,
-                                  game_data.caught_fish['info'],
-                                  game_data.caught_fish['quality'],
-                                  game_data.caught_fish['quality_score'],
-                                  game_data.caught_fish['price'])
-
-        elif current_state == GameState.FISH_INDEX:
-            draw_fish_index_screen(screen, font, game_data.inventory, game_data)
-
-        elif current_state == GameState.INVENTORY:
-            draw_inventory_screen(screen, font, game_data.inventory, game_data.gold, game_data)
-        
-        pygame.display.flip()
-    
+        if timings:
+            draw_start = time.perf_counter()
+        if current_state == GameState.FISHING and current_stage <= 4:
+            stages[current_stage - 1].render_alpha = timestep.alpha
+        RENDERER.begin_frame(get_scene_key(current_state, current_stage, game_data, show_debug))
+        draw_game_state(screen, font, small_font, current_state, current_stage, stages, buttons, game_data)
+
+        if show_debug:
+            draw_debug_overlay(screen, small_font)
+
+        RENDERER.end_frame()
+        if timings:
+            timings.add(draw_start - update_start, time.perf_counter() - draw_start)
+
+    if recorder:
+        recorder.close(game_data)
+    if replayer:
+        timings.report(baseline_path)
+        if timings_path:
+            timings.save(timings_path)
+        verified = replayer.verify(game_data)
+        if verified is None:
+            print("Recording has no end record; final state not verified")
+        else:
+            print(f"Final state {'matches' if verified else 'DIFFERS FROM'} the recording")
+    if DEBUG:
+        print(f"Background cache: {BACKGROUND_CACHE.stats()}")
+        print(f"Fish variant cache: {FISH_VARIANTS.stats()}")
+        print(f"Text cache: {TEXT_CACHE.stats()}")
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Fishing Mastery - Enhanced 2D Timing Game")
+    parser.add_argument("--record", metavar="FILE", help="record the session's input to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="replay a recorded session")
+    parser.add_argument("--headless", action="store_true", help="replay without a window or FPS cap")
+    parser.add_argument("--seed", type=int, help="seed the random number generator")
+    parser.add_argument("--save-timings", metavar="FILE", help="write the replay's frame timings as JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="compare replay timings against a saved JSON")
+    parser.add_argument("--capacity", type=int, help="inventory capacity (default 20)")
+    args = parser.parse_args()
+    if args.headless and not args.replay:
+        parser.error("--headless needs --replay")
+    main(args.record, args.replay, args.headless, args.seed, args.save_timings, args.baseline, args.capacity)
@@ -0,0 +1,658 @@
+"""
+Fishing game logic - fish database, spawning, quality, pricing and shop rules
+
+Pure game rules with no pygame dependency, so tools and simulations can import
+them in milliseconds without an SDL display or audio device. The pygame
+presentation layer lives in fishing_game_modular_fixed.py.
+"""
+
+import json
+import random
+from array import array
+from bisect import bisect_left, insort
+
+# ============================================================================
+# PHASE 1: PROJECT FOUNDATION - Game Data
+# ============================================================================
+
+class GameData:
+    def __init__(self):
+        self.gold = 5000  # Starting gold (updated for new economy)
+        self.current_rod = "Basic Rod"
+        self.rod_luck = {"Basic Rod": 0, "Novice Rod": 20, "Master Rod": 45}
+        self.cheat_mode = False
+        self.price_cheat = False  # New cheat for increased prices
+        self.caught_fish = None
+        self.cheat_buffer = ""
+        self.fullscreen = False  # Fullscreen mode flag
+        self.background = None  # Background image path
+        # Inventory system
+        self.inventory = Inventory()  # List to store caught fish, with FISH_INDEX counts
+        self.inventory_capacity = 20  # Maximum inventory capacity
+        self.inventory_version = 0  # Bumped on every inventory change (invalidates cached screens)
+
+# ============================================================================
+# PHASE 5: Simulation Clock - Fixed-Timestep Game Time
+# ============================================================================
+
+# Length of one simulation step in seconds. Every stage advances in steps of
+# exactly this size, so physics and timers do not depend on the frame rate.
+SIM_STEP = 1.0 / 120.0
+
+# Frame time above this is dropped instead of simulated, so a long stall
+# (window drag, breakpoint) does not trigger a burst of catch-up steps
+MAX_FRAME_TIME = 0.25
+
+class SimulationClock:
+    """Game time in seconds, advanced only by simulation steps"""
+    def __init__(self):
+        self.now = 0.0
+        self.steps = 0
+
+    def advance(self, dt):
+        """Move game time forward by one simulation step of dt seconds"""
+        self.now += dt
+        self.steps += 1
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed simulation steps"""
+    def __init__(self, step=SIM_STEP, max_frame_time=MAX_FRAME_TIME):
+        self.step = step
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """Add a frame's wall time and return how many steps to simulate"""
+        self.accumulator += min(frame_time, self.max_frame_time)
+        steps = int(self.accumulator / self.step)
+        self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of a step left over, used to interpolate drawing between steps"""
+        return self.accumulator / self.step
+
+# ============================================================================
+# PHASE 5: Stage Difficulty Parameters
+# ============================================================================
+
+# Difficulty knobs of the fishing stages, read by each stage's __init__.
+# A tuned set can replace these at startup (see load_stage_parameters).
+STAGE_PARAMETERS = {
+    "CastTimingStage": {
+        "marker_speed": 300,  # Increased from 250 to 300 px/s
+        "target_zone_size": 0.10,  # Reduced from 0.15 to 0.10 (tighter timing)
+    },
+    "DepthControlStage": {
+        "ideal_zone_start": 235,  # Tightened from 220-260 to 235-265
+        "ideal_zone_end": 265,
+        "marker_speed": 180,  # Increased from 150
+    },
+    "BiteReactionStage": {
+        "reaction_window": 0.6,  # Reduced from 0.8 to 0.6
+    },
+    "ReelingRhythmStage": {
+        "total_presses": 8,  # Increased from 7 to 8
+    },
+    "LineTensionStage": {
+        "gravity": 200,  # Natural downward pull (positive = down)
+        "lift_force": -300,  # Upward force when holding space (negative = up)
+        "target_square_speed": 80,  # Slower speed for better playability
+    },
+}
+
+STAGE_PARAMETERS_PATH = "stage_parameters.json"
+
+def stage_parameters(stage_name, overrides=None):
+    """Return a stage's difficulty knobs, with any per-instance overrides applied"""
+    parameters = dict(STAGE_PARAMETERS[stage_name])
+    if overrides:
+        parameters.update(overrides)
+    return parameters
+
+def load_stage_parameters(path=STAGE_PARAMETERS_PATH):
+    """Replace STAGE_PARAMETERS with a tuned set from a JSON file; returns False if there is none"""
+    try:
+        with open(path) as file:
+            loaded = json.load(file)
+    except FileNotFoundError:
+        return False
+    apply_stage_parameters(loaded, path)
+    return True
+
+def apply_stage_parameters(loaded, source):
+    """Update STAGE_PARAMETERS from a {stage: {knob: value}} dict, rejecting unknown names"""
+    for stage_name, parameters in loaded.items():
+        if stage_name not in STAGE_PARAMETERS:
+            raise ValueError(f"{source}: unknown stage {stage_name!r}")
+        unknown = set(parameters) - set(STAGE_PARAMETERS[stage_name])
+        if unknown:
+            raise ValueError(f"{source}: unknown {stage_name} parameter(s) {', '.join(sorted(unknown))}")
+    for stage_name, parameters in loaded.items():
+        STAGE_PARAMETERS[stage_name].update(parameters)
+
+# ============================================================================
+# PHASE 6: Quality and Rarity Systems - Fish Database and Spawning
+# ============================================================================
+
+# Fish Database - FIXED: Separated fish names properly
+FISH_DATABASE = {
+    "Common": ["Cod", "Carp", "Minnow", "Perch", "Sunfish", "Tilapia", "Catfish", 
+               "Goldfish", "Bluegill", "Troutlet"],
+    "Uncommon": ["Rainbow Trout", "Bass", "Pike", "Mackerel", "Flounder", 
+                "Walleye", "Rockfish", "Perch King", "Small Snapper", "Eel"],
+    "Rare": ["Salmon", "Swordfish", "Barracuda", "Marlin", "Bluefin Tuna",
+             "Sturgeon", "Grouper", "Lionfish", "Golden Trout", "Red Snapper"],
+    "Epic": ["Anglerfish", "Giant Catfish", "Ocean Sunfish", "Tarpon",
+             "King Mackerel", "Giant Salmon", "Peacock Bass", "Rainbow Marlin",
+             "Electric Eel", "Swordfin"],
+    "Legendary": ["Kraken Carp", "Mythical Koi", "Leviathan Cod", "Golden Barracuda",
+                  "Celestial Tuna", "Phantom Marlin", "Titan Sturgeon", "Dragonfish",
+                  "Aurora Salmon", "Poseidon's Pike"],
+    "Mythic": ["Abyssal Leviathan", "Celestial Megalodon", "Void Kraken"]
+}
+
+# Rarity Chances - Enhanced to include accessible mythic fish
+RARITY_CHANCES_NORMAL = {"Common": 0.60, "Uncommon": 0.20, "Rare": 0.12, "Epic": 0.05, "Legendary": 0.025, "Mythic": 0.005}
+RARITY_CHANCES_CHEAT = {"Legendary": 0.50, "Epic": 0.25, "Uncommon": 0.15, "Common": 0.05, "Rare": 0.04, "Mythic": 0.01}
+
+# Base Prices - SIGNIFICANTLY INCREASED
+BASE_PRICES = {"Common": 100, "Uncommon": 500, "Rare": 2000, "Epic": 10000, "Legendary": 50000, "Mythic": 500000}
+
+def calculate_quality(stage_scores):
+    """Calculate fish quality based on stage scores"""
+    quality = sum(stage_scores) / len(stage_scores)
+    
+    if quality >= 95:
+        return "Perfect"
+    elif quality >= 80:
+        return "Great"
+    elif quality >= 60:
+        return "Good"
+    elif quality >= 40:
+        return "Fair"
+    else:
+        return "Poor"
+
+# Quality tiers from best to worst, as calculate_quality() assigns them
+QUALITY_TIERS = ["Perfect", "Great", "Good", "Fair", "Poor"]
+
+def rarity_probabilities(rod_luck, cheat_mode):
+    """Rarity chances adjusted for rod luck and normalized, in rarity table order"""
+    base_chances = RARITY_CHANCES_CHEAT if cheat_mode else RARITY_CHANCES_NORMAL
+    
+    # Adjust probabilities based on rod luck (excluding Mythic which is fixed at 0.5%)
+    luck_bonus = rod_luck / 1000
+    adjusted_chances = {}
+    
+    for rarity, chance in base_chances.items():
+        if rarity == "Mythic":
+            adjusted_chances[rarity] = max(0.002, chance + luck_bonus * 0.5)  # Enhanced mythic chances
+        elif rarity in ["Rare", "Epic", "Legendary"]:
+            adjusted_chances[rarity] = min(0.8, chance + luck_bonus)
+        else:
+            adjusted_chances[rarity] = max(0.01, chance - luck_bonus * 0.5)
+    
+    # Normalize probabilities
+    total = sum(adjusted_chances.values())
+    for rarity in adjusted_chances:
+        adjusted_chances[rarity] /= total
+    return adjusted_chances
+
+class AliasSampler:
+    """Vose's alias method: O(1) draws from a fixed discrete distribution"""
+    def __init__(self, outcomes, weights):
+        self.outcomes = list(outcomes)
+        self.size = len(self.outcomes)
+        total = sum(weights)
+        scaled = [weight * self.size / total for weight in weights]
+        self.probability = [1.0] * self.size
+        self.alias = list(range(self.size))
+
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left holds (up to rounding) exactly one column's worth
+
+    def sample(self):
+        # One uniform draw picks the column and, from its fraction, the side
+        value = random.random() * self.size
+        column = int(value)
+        if value - column < self.probability[column]:
+            return self.outcomes[column]
+        return self.outcomes[self.alias[column]]
+
+    def distribution(self):
+        """Return the exact probability of each outcome encoded by the tables"""
+        chances = [0.0] * self.size
+        for column, probability in enumerate(self.probability):
+            chances[column] += probability / self.size
+            chances[self.alias[column]] += (1.0 - probability) / self.size
+        return chances
+
+def build_spawn_sampler(rod_luck, cheat_mode):
+    """Build one alias table over every species, weighted by rarity chance / species count"""
+    outcomes = []
+    weights = []
+    for rarity, chance in rarity_probabilities(rod_luck, cheat_mode).items():
+        # ADDED BOUNDS CHECKING: a rarity without species spawns the fallback fish
+        names = FISH_DATABASE.get(rarity) or ["Common Fish"]
+        for fish_name in names:
+            outcomes.append((fish_name, rarity))
+            weights.append(chance / len(names))
+    return AliasSampler(outcomes, weights)
+
+# Samplers keyed by (rod_luck, cheat_mode), built on first use. Every rod
+# gets its own table, so changing ROD_UPGRADES luck just builds a new one;
+# call clear_spawn_samplers() after editing the rarity tables or FISH_DATABASE.
+SPAWN_SAMPLERS = {}
+
+def get_spawn_sampler(rod_luck, cheat_mode):
+    key = (rod_luck, bool(cheat_mode))
+    sampler = SPAWN_SAMPLERS.get(key)
+    if sampler is None:
+        sampler = SPAWN_SAMPLERS[key] = build_spawn_sampler(rod_luck, cheat_mode)
+    return sampler
+
+def clear_spawn_samplers():
+    """Drop the memoized samplers so the next spawn rebuilds them from the tables"""
+    SPAWN_SAMPLERS.clear()
+
+def spawn_fish(rod_luck, cheat_mode):
+    """Spawn a fish based on rarity probabilities"""
+    fish_name, rarity = get_spawn_sampler(rod_luck, cheat_mode).sample()
+    return {"name": fish_name, "rarity": rarity}
+
+def get_all_fish_list():
+    """Get a list of all fish in the database"""
+    all_fish = []
+    for rarity in FISH_DATABASE:
+        for fish_name in FISH_DATABASE[rarity]:
+            all_fish.append({
+                'name': fish_name,
+                'rarity': rarity
+            })
+    return all_fish
+
+# ============================================================================
+# PHASE 6: Catch Records - Compact Storage for Caught Fish
+# ============================================================================
+
+# Species interned as small ints. Catalog species come first, in
+# get_all_fish_list() order (the same indices as fishing_batch.SPECIES);
+# any other (name, rarity), such as spawn_fish()'s "Common Fish" fallback,
+# is appended on first use.
+RARITY_NAMES = list(FISH_DATABASE)
+SPECIES_TABLE = []  # species id -> (name, rarity)
+SPECIES_INFO = []  # species id -> shared {"name", "rarity"} dict for the draw code
+SPECIES_IDS = {}  # (name, rarity) -> species id
+
+def species_id(name, rarity):
+    """Intern a species and return its id"""
+    index = SPECIES_IDS.get((name, rarity))
+    if index is None:
+        index = SPECIES_IDS[name, rarity] = len(SPECIES_TABLE)
+        SPECIES_TABLE.append((name, rarity))
+        SPECIES_INFO.append({"name": name, "rarity": rarity})
+    return index
+
+for _fish in get_all_fish_list():
+    species_id(_fish['name'], _fish['rarity'])
+del _fish
+
+class CatchRecord:
+    """One caught fish: species id, quality tier, quality score and selling price"""
+    __slots__ = ("species", "quality", "quality_score", "price")
+
+    def __init__(self, species, quality, quality_score, price):
+        self.species = species
+        self.quality = quality
+        self.quality_score = quality_score
+        self.price = price
+
+    @property
+    def name(self):
+        return SPECIES_TABLE[self.species][0]
+
+    @property
+    def rarity(self):
+        return SPECIES_TABLE[self.species][1]
+
+    @property
+    def info(self):
+        """The species as a {"name", "rarity"} dict (shared, do not modify)"""
+        return SPECIES_INFO[self.species]
+
+    def __repr__(self):
+        return f"CatchRecord({self.name!r}, {self.rarity!r}, {self.quality!r}, {self.quality_score:.1f}, {self.price})"
+
+class CatchHistory:
+    """Columnar store for large numbers of catches, one typed array per field
+
+    Costs 18 bytes per catch. The quality tier is not stored: it is
+    recomputed from the quality score, as create_caught_fish() does.
+    """
+    def __init__(self, catches=()):
+        self.species = array("H")
+        self.quality_scores = array("d")
+        self.prices = array("q")
+        self.extend(catches)
+
+    def append(self, catch):
+        self.species.append(catch.species)
+        self.quality_scores.append(catch.quality_score)
+        self.prices.append(catch.price)
+
+    def extend(self, catches):
+        for catch in catches:
+            self.append(catch)
+
+    def __len__(self):
+        return len(self.species)
+
+    def __getitem__(self, index):
+        quality_score = self.quality_scores[index]
+        return CatchRecord(self.species[index], calculate_quality([quality_score]), quality_score, self.prices[index])
+
+    def __iter__(self):
+        for index in range(len(self.species)):
+            yield self[index]
+
+    def nbytes(self):
+        """Bytes held by the column arrays"""
+        return sum(column.itemsize * len(column) for column in (self.species, self.quality_scores, self.prices))
+
+# Inventory sort orders: the key of a catch, lowest first. Later fields
+# break ties so equal keys still list in a stable order.
+RARITY_RANKS = {rarity: rank for rank, rarity in enumerate(RARITY_NAMES)}
+SORT_KEYS = {
+    "price": lambda fish: (fish.price, fish.quality_score, fish.species),
+    "rarity": lambda fish: (RARITY_RANKS.get(fish.rarity, -1), fish.price, fish.species),
+    "quality": lambda fish: (fish.quality_score, fish.price, fish.species),
+}
+
+class Inventory(list):
+    """A list of catches that keeps its FISH_INDEX queries up to date as it changes
+
+    Every mutating list method updates the per-rarity catalog counts, the
+    caught species and the total value, so missing_fish_counts(),
+    caught_species() and total_value cost O(1) instead of an inventory scan.
+    Once sorted_catches() has been asked for a SORT_KEYS order, a sorted
+    index for it is kept up to date with bisect as well, so a new catch
+    costs one insertion instead of a full re-sort.
+    Catches must not be edited in place once they are in the inventory.
+    """
+    def __init__(self, catches=()):
+        self.sorted_indexes = {}
+        super().__init__(catches)
+        self._rebuild()
+
+    def __reduce__(self):
+        # Pickle as a plain rebuild, so indexes never see half-restored state
+        return (type(self), (list(self),))
+
+    def _rebuild(self):
+        self.catalog_counts = dict.fromkeys(FISH_DATABASE, 0)
+        self.species_counts = {}
+        self.total_value = 0
+        for fish in self:
+            self._count_species(fish.species, 1)
+            self.total_value += fish.price
+        for order in self.sorted_indexes:
+            self.sorted_indexes[order] = sorted(self._sort_entry(order, fish) for fish in self)
+
+    def _sort_entry(self, order, fish):
+        # id() makes entries of different catches with equal keys distinct
+        return SORT_KEYS[order](fish) + (id(fish), fish)
+
+    def _count(self, fish, sign):
+        self._count_species(fish.species, sign)
+        self.total_value += fish.price * sign
+        for order, index in self.sorted_indexes.items():
+            entry = self._sort_entry(order, fish)
+            if sign > 0:
+                insort(index, entry)
+            else:
+                del index[bisect_left(index, entry)]
+
+    def _count_species(self, species, change):
+        name, rarity = SPECIES_TABLE[species]
+        count = self.species_counts.get(name, 0) + change
+        if count:
+            self.species_counts[name] = count
+        else:
+            del self.species_counts[name]
+        # Same rule as the get_missing_fish_counts() scan: duplicates count
+        if rarity in FISH_DATABASE and name in FISH_DATABASE[rarity]:
+            self.catalog_counts[rarity] += change
+
+    def append(self, fish):
+        super().append(fish)
+        self._count(fish, 1)
+
+    def insert(self, index, fish):
+        super().insert(index, fish)
+        self._count(fish, 1)
+
+    def extend(self, catches):
+        catches = list(catches)
+        super().extend(catches)
+        for fish in catches:
+            self._count(fish, 1)
+
+    def __iadd__(self, catches):
+        self.extend(catches)
+        return self
+
+    def pop(self, index=-1):
+        fish = super().pop(index)
+        self._count(fish, -1)
+        return fish
+
+    def remove(self, fish):
+        super().remove(fish)
+        self._count(fish, -1)
+
+    def remove_catch(self, fish, position=None):
+        """Remove this exact catch, matched by identity
+
+        position, when it still holds the catch, skips the search of the
+        list; the sorted indexes drop the catch by bisect either way.
+        """
+        if position is None or not 0 <= position < len(self) or self[position] is not fish:
+            position = super().index(fish)  # CatchRecords compare by identity
+        del self[position]
+
+    def clear(self):
+        super().clear()
+        self._rebuild()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            self._rebuild()
+        else:
+            old = self[index]
+            super().__setitem__(index, value)
+            self._count(old, -1)
+            self._count(value, 1)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            super().__delitem__(index)
+            self._rebuild()
+        else:
+            fish = self[index]
+            super().__delitem__(index)
+            self._count(fish, -1)
+
+    def __imul__(self, times):
+        super().__imul__(times)
+        self._rebuild()
+        return self
+
+    def sell_where(self, sold):
+        """Remove every catch for which sold(fish) is true in one compaction pass; return their total price"""
+        write = 0
+        earned = 0
+        sold_species = {}
+        sold_ids = set()
+        for fish in self:
+            if sold(fish):
+                earned += fish.price
+                sold_species[fish.species] = sold_species.get(fish.species, 0) + 1
+                sold_ids.add(id(fish))
+            else:
+                super().__setitem__(write, fish)
+                write += 1
+        super().__delitem__(slice(write, None))
+        for species, count in sold_species.items():
+            self._count_species(species, -count)
+        self.total_value -= earned
+        if sold_ids:
+            for order, index in self.sorted_indexes.items():
+                self.sorted_indexes[order] = [entry for entry in index if entry[-2] not in sold_ids]
+        return earned
+
+    def sorted_catches(self, order, start=0, stop=None):
+        """Catches start:stop with the highest SORT_KEYS[order] first, or in catch order for None"""
+        if order is None:
+            return self[start:stop]
+        index = self.sorted_indexes.get(order)
+        if index is None:
+            index = self.sorted_indexes[order] = sorted(self._sort_entry(order, fish) for fish in self)
+        count = len(index)
+        stop = count if stop is None else min(stop, count)
+        return [index[count - 1 - position][-1] for position in range(start, stop)]
+
+    def missing_fish_counts(self):
+        """get_missing_fish_counts() for this inventory, from the running counts"""
+        return {rarity: len(FISH_DATABASE[rarity]) - self.catalog_counts.get(rarity, 0) for rarity in FISH_DATABASE}
+
+    def caught_species(self):
+        """Names of every species in the inventory (a set-like view)"""
+        return self.species_counts.keys()
+
+def get_missing_fish_counts(inventory):
+    """Count missing fish by rarity class"""
+    if isinstance(inventory, Inventory):
+        return inventory.missing_fish_counts()
+    caught_fish_names = {fish.name for fish in inventory}
+    missing_counts = {}
+
+    for rarity in FISH_DATABASE:
+        total_in_rarity = len(FISH_DATABASE[rarity])
+        caught_in_rarity = sum(1 for fish in inventory if fish.rarity == rarity and fish.name in FISH_DATABASE[rarity])
+        missing_counts[rarity] = total_in_rarity - caught_in_rarity
+
+    return missing_counts
+
+def get_caught_species(inventory):
+    """Names of every species in the inventory"""
+    if isinstance(inventory, Inventory):
+        return inventory.caught_species()
+    return {fish.name for fish in inventory}
+
+
+def calculate_selling_price(fish_rarity, quality_percentage, game_data=None):
+    """Calculate selling price based on fish rarity and quality"""
+    if fish_rarity not in BASE_PRICES:
+        fish_rarity = "Common"  # Fallback for unknown rarities
+
+    base_price = BASE_PRICES[fish_rarity]
+    quality_multiplier = quality_percentage / 100
+
+    # Apply 10x multiplier if price cheat is active
+    if game_data and game_data.price_cheat:
+        base_price *= 10
+
+    return int(base_price * (quality_multiplier ** 1.5))
+
+def create_caught_fish(stage_scores, game_data):
+    """Spawn and price the fish earned by a set of fishing stage scores"""
+    quality_score = sum(stage_scores) / len(stage_scores)
+    quality = calculate_quality([quality_score])
+    fish_info = spawn_fish(game_data.rod_luck[game_data.current_rod], game_data.cheat_mode)
+    return CatchRecord(species_id(fish_info['name'], fish_info['rarity']), quality, quality_score,
+                       calculate_selling_price(fish_info['rarity'], quality_score, game_data))
+
+def store_caught_fish(game_data, caught_fish):
+    """Add a catch to the inventory, returning False if the inventory is full"""
+    game_data.caught_fish = caught_fish
+    if len(game_data.inventory) >= game_data.inventory_capacity:
+        return False
+    game_data.inventory.append(caught_fish)
+    game_data.inventory_version += 1
+    return True
+
+# ============================================================================
+# PHASE 7: Inventory System - Bulk Selling
+# ============================================================================
+
+def sell_catches(game_data, sold):
+    """Sell every inventory catch for which sold(fish) is true; return the gold earned"""
+    count = len(game_data.inventory)
+    earned = game_data.inventory.sell_where(sold)
+    if len(game_data.inventory) != count:
+        game_data.gold += earned
+        game_data.inventory_version += 1
+    return earned
+
+def sale_value(inventory, sold):
+    """(count, gold) of the catches sell_catches(game_data, sold) would sell"""
+    prices = [fish.price for fish in inventory if sold(fish)]
+    return len(prices), sum(prices)
+
+def rarity_filter(rarity):
+    """Selects every catch of one rarity"""
+    species = {index for index, (_, species_rarity) in enumerate(SPECIES_TABLE) if species_rarity == rarity}
+    return lambda fish: fish.species in species
+
+def below_quality_filter(tier):
+    """Selects every catch of a worse quality tier than tier"""
+    worse = set(QUALITY_TIERS[QUALITY_TIERS.index(tier) + 1:])
+    return lambda fish: fish.quality in worse
+
+def all_but_best_filter(inventory):
+    """Selects all but the highest quality catch of each species (the first on ties)"""
+    best = {}
+    for fish in inventory:
+        kept = best.get(fish.species)
+        if kept is None or fish.quality_score > kept.quality_score:
+            best[fish.species] = fish
+    return lambda fish: best[fish.species] is not fish
+
+def sell_rarity(game_data, rarity):
+    """Sell every catch of one rarity"""
+    return sell_catches(game_data, rarity_filter(rarity))
+
+def sell_below_quality(game_data, tier):
+    """Sell every catch of a worse quality tier than tier"""
+    return sell_catches(game_data, below_quality_filter(tier))
+
+def sell_all_but_best(game_data):
+    """Keep the highest quality catch of each species (the first on ties) and sell the rest"""
+    return sell_catches(game_data, all_but_best_filter(game_data.inventory))
+
+# ============================================================================
+# PHASE 4: Shop System - Rod Upgrades
+# ============================================================================
+
+# Rod Upgrades - UPDATED PRICES FOR NEW ECONOMY
+ROD_UPGRADES = {
+    "Novice Rod": {"price": 5000, "luck": 20},
+    "Master Rod": {"price": 50000, "luck": 45}
+}
+
+def purchase_rod(rod_name, current_rod, gold):
+    """Buy rod_name if it is not already equipped and affordable; return (rod, gold)"""
+    if rod_name in ROD_UPGRADES and current_rod != rod_name:
+        if gold >= ROD_UPGRADES[rod_name]["price"]:
+            return rod_name, gold - ROD_UPGRADES[rod_name]["price"]
+    return current_rod, gold
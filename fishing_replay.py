@@ -0,0 +1,187 @@
+"""
+Input recording and replay for Fishing Mastery sessions
+
+A recording is the RNG seed, inventory capacity and stage parameters plus, for every frame of main(), the frame's dt
+and the input events pygame.event.get() returned. Replaying feeds the same
+dt and events back into the state machine, so every random draw (spawns,
+bite times, reeling sequences) and every simulation step happens again in
+the same order and the session ends in the same state.
+
+File layout (little-endian):
+    header   "FMRP", version u16, seed u64, SIM_STEP f64, inventory capacity u32,
+             stage parameters length u32, then the STAGE_PARAMETERS in effect as JSON
+    frame    b"F", dt f64, ticks u32 (ms since pygame.init), event count u16
+    event    type code u8, key/button/wheel y i32, unicode/wheel x i32, pos x i16, pos y i16
+    end      b"E", CRC32 of the final gold, rod and inventory
+
+A recording cut short (crash, killed process) has no end record; it still
+replays, but the final state cannot be verified.
+"""
+
+import json
+import statistics
+import struct
+import zlib
+
+import pygame
+
+from fishing_logic import SIM_STEP, STAGE_PARAMETERS
+
+MAGIC = b"FMRP"
+VERSION = 3
+HEADER = struct.Struct("<4sHQdII")
+FRAME = struct.Struct("<cdIH")
+EVENT = struct.Struct("<Biihh")
+END = struct.Struct("<cI")
+
+# Event types the game reacts to; everything else is dropped when recording
+EVENT_CODES = {
+    pygame.QUIT: 0,
+    pygame.KEYDOWN: 1,
+    pygame.KEYUP: 2,
+    pygame.MOUSEMOTION: 3,
+    pygame.MOUSEBUTTONDOWN: 4,
+    pygame.MOUSEBUTTONUP: 5,
+    pygame.MOUSEWHEEL: 6,
+}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+def encode_event(event):
+    """Pack one pygame event, or return None if the game ignores its type"""
+    code = EVENT_CODES.get(event.type)
+    if code is None:
+        return None
+    if event.type == pygame.KEYDOWN:
+        return EVENT.pack(code, event.key, ord(event.unicode[:1] or "\0"), 0, 0)
+    if event.type == pygame.KEYUP:
+        return EVENT.pack(code, event.key, 0, 0, 0)
+    if event.type == pygame.MOUSEMOTION:
+        return EVENT.pack(code, 0, 0, *event.pos)
+    if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return EVENT.pack(code, event.button, 0, *event.pos)
+    if event.type == pygame.MOUSEWHEEL:
+        return EVENT.pack(code, event.y, event.x, 0, 0)
+    return EVENT.pack(code, 0, 0, 0, 0)
+
+def decode_event(code, a, b, x, y):
+    """Rebuild the pygame event packed by encode_event"""
+    event_type = EVENT_TYPES[code]
+    if event_type == pygame.KEYDOWN:
+        return pygame.event.Event(event_type, key=a, unicode=chr(b) if b else "", mod=0)
+    if event_type == pygame.KEYUP:
+        return pygame.event.Event(event_type, key=a, mod=0)
+    if event_type == pygame.MOUSEMOTION:
+        return pygame.event.Event(event_type, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+    if event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return pygame.event.Event(event_type, button=a, pos=(x, y))
+    if event_type == pygame.MOUSEWHEEL:
+        return pygame.event.Event(event_type, x=b, y=a, flipped=False)
+    return pygame.event.Event(event_type)
+
+def session_digest(game_data):
+    """CRC32 of the session's end state, used to check a replay matches its recording"""
+    inventory = [(fish.name, fish.quality_score, fish.price) for fish in game_data.inventory]
+    state = json.dumps([game_data.gold, game_data.current_rod, inventory])
+    return zlib.crc32(state.encode("utf-8"))
+
+class InputRecorder:
+    """Writes the session settings and each frame's dt and events to a recording file"""
+    def __init__(self, path, seed, inventory_capacity):
+        parameters = json.dumps(STAGE_PARAMETERS, sort_keys=True).encode("utf-8")
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, SIM_STEP, inventory_capacity, len(parameters)))
+        self.file.write(parameters)
+        self.frames = 0
+
+    def record_frame(self, dt, ticks, events):
+        packed = [data for data in map(encode_event, events) if data is not None]
+        self.file.write(FRAME.pack(b"F", dt, ticks, len(packed)))
+        self.file.write(b"".join(packed))
+        self.frames += 1
+
+    def close(self, game_data):
+        """Write the end record with the final state digest and close the file"""
+        self.file.write(END.pack(b"E", session_digest(game_data)))
+        self.file.close()
+
+class InputReplayer:
+    """Reads a recording back one frame at a time"""
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.data = file.read()
+        magic, version, self.seed, step, self.inventory_capacity, length = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} fishing session recording")
+        if step != SIM_STEP:
+            raise ValueError(f"{path} was recorded with a {step}s simulation step, the game uses {SIM_STEP}s")
+        self.stage_parameters = json.loads(self.data[HEADER.size:HEADER.size + length])
+        self.offset = HEADER.size + length
+        self.frames = 0
+        self.digest = None
+
+    def next_frame(self):
+        """Return (dt, ticks, events) for the next frame, or None at the end"""
+        if self.offset >= len(self.data) or self.data[self.offset:self.offset + 1] == b"E":
+            if self.offset < len(self.data):
+                self.digest = END.unpack_from(self.data, self.offset)[1]
+            return None
+        _, dt, ticks, count = FRAME.unpack_from(self.data, self.offset)
+        self.offset += FRAME.size
+        events = []
+        for _ in range(count):
+            events.append(decode_event(*EVENT.unpack_from(self.data, self.offset)))
+            self.offset += EVENT.size
+        self.frames += 1
+        return dt, ticks, events
+
+    def verify(self, game_data):
+        """Return True/False if the replay ended in the recorded state, None if unknown"""
+        while self.next_frame() is not None:
+            pass  # A replay that quit early still reads up to the end record
+        if self.digest is None:
+            return None
+        return session_digest(game_data) == self.digest
+
+class FrameTimings:
+    """Per-frame update and draw times of a (replayed) session"""
+    def __init__(self):
+        self.update_ms = []
+        self.draw_ms = []
+
+    def add(self, update_seconds, draw_seconds):
+        self.update_ms.append(update_seconds * 1000)
+        self.draw_ms.append(draw_seconds * 1000)
+
+    def summary(self):
+        summary = {"frames": len(self.update_ms)}
+        for name, values in (("update", self.update_ms), ("draw", self.draw_ms)):
+            if values:
+                ordered = sorted(values)
+                summary[name] = {
+                    "mean_ms": statistics.fmean(values),
+                    "p95_ms": ordered[int(len(ordered) * 0.95)],
+                    "max_ms": ordered[-1],
+                }
+        return summary
+
+    def save(self, path):
+        with open(path, "w") as file:
+            json.dump(self.summary(), file, indent=2)
+
+    def report(self, baseline_path=None):
+        """Print the timing summary, with the change against a saved baseline"""
+        summary = self.summary()
+        baseline = None
+        if baseline_path:
+            with open(baseline_path) as file:
+                baseline = json.load(file)
+        print(f"Replayed {summary['frames']} frames")
+        for name in ("update", "draw"):
+            if name not in summary:
+                continue
+            line = f"{name:<7}" + "  ".join(f"{key[:-3]} {value:.3f} ms" for key, value in summary[name].items())
+            if baseline and name in baseline:
+                line += "  |  vs baseline " + "  ".join(
+                    f"{key[:-3]} {(value / baseline[name][key] - 1) * 100:+.1f}%"
+                    for key, value in summary[name].items() if baseline[name][key])
+            print(line)
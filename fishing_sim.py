@@ -0,0 +1,262 @@
+"""
+Headless simulation of the Fishing Mastery fishing pipeline
+
+Usage:
+    python fishing_sim.py [--catches 1000] [--policy average] [--seed 1]
+                          [--rod "Basic Rod"] [--cheat] [--price-cheat] [--capacity 20]
+
+Plays cast -> depth -> bite -> reeling -> spawn -> price -> inventory with
+no window and no FPS cap. A player policy generates the synthetic key events
+the stages would otherwise get from pygame.event.get(), and every stage runs
+on its own SimulationClock in fixed SIM_STEP steps, so a session simulates as
+fast as the CPU allows and is reproducible from its seed. Reports catches per
+second plus the stage, quality, rarity and price distributions.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import fishing_game_modular_fixed as game
+from fishing_logic import (
+    GameData, FISH_DATABASE, SIM_STEP, SimulationClock, CatchHistory, create_caught_fish, store_caught_fish
+)
+
+# A stage that is still running after this much game time means the policy
+# never sends the input needed to finish it
+MAX_STAGE_TIME = 120.0
+
+STAGE_NAMES = ["cast", "depth", "bite", "reeling"]
+
+# ============================================================================
+# Player Policies
+# ============================================================================
+
+def policy_seed(seed):
+    """Seed for a policy's own RNG, kept independent of the game's global random stream"""
+    return None if seed is None else f"policy-{seed}"
+
+def key_event(event_type, key):
+    """Build a synthetic keyboard event like the ones pygame.event.get() returns"""
+    return pygame.event.Event(event_type, key=key)
+
+class PlayerPolicy:
+    """Decides which key events a simulated player sends each simulation step"""
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def begin_stage(self, stage):
+        """Called once when a stage starts, before its first step"""
+
+    def events(self, stage, clock):
+        """Return the events for this step"""
+        return []
+
+class SkillPolicy(PlayerPolicy):
+    """Aims for the middle of each target zone with gaussian timing error
+
+    With aim_in_zone the aim point is anywhere inside the green zone instead
+    of its middle, and press_jitter adds a random delay (stdev in seconds)
+    between the marker reaching the aim point and SPACE, during which the
+    marker keeps moving - so zone sizes and marker speeds change the scores.
+    """
+    def __init__(self, timing_error=0.05, reaction_time=0.25, reaction_jitter=0.05,
+                 rhythm_accuracy=0.9, press_jitter=0.0, aim_in_zone=False, seed=None):
+        super().__init__(seed)
+        self.timing_error = timing_error  # Stdev of the aim point, as a fraction of the bar
+        self.reaction_time = reaction_time  # Mean seconds from bite to SPACE
+        self.reaction_jitter = reaction_jitter
+        self.rhythm_accuracy = rhythm_accuracy  # Chance of pressing the right arrow
+        self.press_jitter = press_jitter
+        self.aim_in_zone = aim_in_zone
+        self.target = 0.0
+        self.press_at = None
+
+    def begin_stage(self, stage):
+        if isinstance(stage, game.CastTimingStage):
+            zone_offset = self.rng.uniform(-0.5, 0.5) * stage.target_zone_size if self.aim_in_zone else 0
+            aim = stage.bar_width * (0.5 + zone_offset + self.rng.gauss(0, self.timing_error))
+            self.target = max(0, min(stage.bar_width, aim))
+        elif isinstance(stage, game.DepthControlStage):
+            if self.aim_in_zone:
+                zone_aim = self.rng.uniform(stage.ideal_zone_start, stage.ideal_zone_end)
+            else:
+                zone_aim = (stage.ideal_zone_start + stage.ideal_zone_end) / 2
+            aim = zone_aim + self.rng.gauss(0, self.timing_error) * stage.bar_height
+            self.target = max(0, min(stage.bar_height, aim))
+        self.press_at = None
+
+    def press_when_reached(self, position, speed, clock):
+        """SPACE once the marker reaches the aim point, after the press jitter"""
+        if self.press_at is None and abs(position - self.target) <= speed * SIM_STEP:
+            self.press_at = clock.now + abs(self.rng.gauss(0, self.press_jitter)) if self.press_jitter else clock.now
+        if self.press_at is not None and clock.now >= self.press_at:
+            return [key_event(pygame.KEYDOWN, pygame.K_SPACE)]
+        return []
+
+    def events(self, stage, clock):
+        if isinstance(stage, game.CastTimingStage):
+            return self.press_when_reached(stage.marker_x, stage.marker_speed, clock)
+        elif isinstance(stage, game.DepthControlStage):
+            return self.press_when_reached(stage.marker_y, stage.marker_speed, clock)
+        elif isinstance(stage, game.BiteReactionStage):
+            if stage.bite_triggered:
+                if self.press_at is None:
+                    delay = max(0.0, self.rng.gauss(self.reaction_time, self.reaction_jitter))
+                    self.press_at = stage.reaction_start + delay
+                if clock.now >= self.press_at:
+                    return [key_event(pygame.KEYDOWN, pygame.K_SPACE)]
+        elif isinstance(stage, game.ReelingRhythmStage):
+            key = stage.arrow_sequence[stage.current_index]
+            if self.rng.random() >= self.rhythm_accuracy:
+                key = self.rng.choice([k for k in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN) if k != key])
+            return [key_event(pygame.KEYDOWN, key)]
+        return []
+
+class RandomPolicy(PlayerPolicy):
+    """Mashes SPACE and arrow keys at random, as a lower bound for scores"""
+    def __init__(self, press_chance=0.02, seed=None):
+        super().__init__(seed)
+        self.press_chance = press_chance
+
+    def events(self, stage, clock):
+        if self.rng.random() >= self.press_chance:
+            return []
+        if isinstance(stage, game.ReelingRhythmStage):
+            return [key_event(pygame.KEYDOWN, self.rng.choice(
+                [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN]))]
+        return [key_event(pygame.KEYDOWN, pygame.K_SPACE)]
+
+POLICIES = {
+    "perfect": lambda seed: SkillPolicy(timing_error=0.0, reaction_time=SIM_STEP, reaction_jitter=0.0,
+                                        rhythm_accuracy=1.0, seed=seed),
+    "expert": lambda seed: SkillPolicy(timing_error=0.02, reaction_time=0.18, reaction_jitter=0.03,
+                                       rhythm_accuracy=0.97, seed=seed),
+    "average": lambda seed: SkillPolicy(seed=seed),
+    "novice": lambda seed: SkillPolicy(timing_error=0.15, reaction_time=0.45, reaction_jitter=0.15,
+                                       rhythm_accuracy=0.7, seed=seed),
+    "random": lambda seed: RandomPolicy(seed=seed),
+}
+
+# ============================================================================
+# Simulation
+# ============================================================================
+
+def play_stage(stage, policy, clock):
+    """Step one stage until it completes, feeding it the policy's events"""
+    policy.begin_stage(stage)
+    deadline = clock.now + MAX_STAGE_TIME
+    while not stage.completed:
+        if clock.now >= deadline:
+            raise RuntimeError(f"{type(stage).__name__} did not complete within {MAX_STAGE_TIME}s of game time")
+        clock.advance(SIM_STEP)
+        stage.update(SIM_STEP)
+        stage.handle_input(policy.events(stage, clock))
+    return stage.score
+
+def simulate_catch(game_data, policy, clock, parameters=None):
+    """Play all four stages, then spawn, price and store the fish
+
+    A full inventory sells the catch straight away, as the SELLING screen does.
+    parameters overrides stage difficulty knobs, as in make_fishing_stages().
+    Returns (stage_scores, caught_fish).
+    """
+    stages = game.make_fishing_stages(clock, parameters)
+    stage_scores = [play_stage(stage, policy, clock) for stage in stages]
+    caught_fish = create_caught_fish(stage_scores, game_data)
+    if not store_caught_fish(game_data, caught_fish):
+        game_data.gold += caught_fish.price
+    game_data.caught_fish = None
+    return stage_scores, caught_fish
+
+class SimulationStats:
+    """Collects per-catch results and summarizes them"""
+    def __init__(self):
+        self.stage_scores = [[] for _ in STAGE_NAMES]
+        self.history = CatchHistory()
+        self.qualities = Counter()
+        self.rarities = Counter()
+        self.catches = 0
+
+    def add(self, stage_scores, caught_fish):
+        for scores, score in zip(self.stage_scores, stage_scores):
+            scores.append(score)
+        self.history.append(caught_fish)
+        self.qualities[caught_fish.quality] += 1
+        self.rarities[caught_fish.rarity] += 1
+        self.catches += 1
+
+    @property
+    def quality_scores(self):
+        return self.history.quality_scores
+
+    @property
+    def prices(self):
+        return self.history.prices
+
+def summarize(values):
+    """Return mean, stdev, min, median and max of a list of numbers"""
+    return (statistics.fmean(values), statistics.pstdev(values), min(values),
+            statistics.median(values), max(values))
+
+def run_simulation(catches, policy, game_data=None, seed=None):
+    """Simulate a number of catches headless and return (stats, game_data, clock)"""
+    if seed is not None:
+        random.seed(seed)
+    game_data = game_data or GameData()
+    clock = SimulationClock()
+    stats = SimulationStats()
+    for _ in range(catches):
+        stats.add(*simulate_catch(game_data, policy, clock))
+    return stats, game_data, clock
+
+def print_report(stats, game_data, clock, elapsed):
+    print(f"{stats.catches} catches in {elapsed:.2f}s wall time: {stats.catches / elapsed:,.0f} catches/s, "
+          f"{clock.now / stats.catches:.2f}s of game time per catch ({clock.now / elapsed:,.0f}x real time)")
+    print(f"\n{'score':<10}{'mean':>8}{'stdev':>8}{'min':>8}{'median':>8}{'max':>8}")
+    rows = list(zip(STAGE_NAMES, stats.stage_scores)) + [("quality", stats.quality_scores)]
+    for name, values in rows:
+        print(f"{name:<10}" + "".join(f"{value:>8.1f}" for value in summarize(values)))
+
+    print("\nquality   " + "  ".join(f"{quality} {count / stats.catches:.1%}"
+                                     for quality, count in stats.qualities.most_common()))
+    print("rarity    " + "  ".join(f"{rarity} {stats.rarities[rarity] / stats.catches:.1%}"
+                                     for rarity in FISH_DATABASE))
+    mean_price, stdev_price, _, median_price, max_price = summarize(stats.prices)
+    print(f"price     mean {mean_price:,.0f}  stdev {stdev_price:,.0f}  median {median_price:,.0f}  max {max_price:,}")
+    print(f"gold      {game_data.gold:,} with {len(game_data.inventory)}/{game_data.inventory_capacity} fish in inventory")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Fishing Mastery simulation")
+    parser.add_argument("--catches", type=int, default=1000, help="number of fish to catch")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="average", help="simulated player")
+    parser.add_argument("--seed", type=int, default=1, help="seed for spawning and the policy")
+    parser.add_argument("--rod", choices=list(GameData().rod_luck), default="Basic Rod", help="rod to fish with")
+    parser.add_argument("--cheat", action="store_true", help="use the cheat rarity table")
+    parser.add_argument("--price-cheat", action="store_true", help="apply the 10x price cheat")
+    parser.add_argument("--capacity", type=int, default=GameData().inventory_capacity, help="inventory capacity")
+    args = parser.parse_args(argv)
+
+    game_data = GameData()
+    game_data.current_rod = args.rod
+    game_data.cheat_mode = args.cheat
+    game_data.price_cheat = args.price_cheat
+    game_data.inventory_capacity = args.capacity
+
+    start = time.perf_counter()
+    stats, game_data, clock = run_simulation(args.catches, POLICIES[args.policy](policy_seed(args.seed)),
+                                             game_data, args.seed)
+    print_report(stats, game_data, clock, time.perf_counter() - start)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
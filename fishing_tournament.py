@@ -0,0 +1,204 @@
+"""
+Multi-process bot tournament for Fishing Mastery
+
+Usage:
+    python fishing_tournament.py [--sessions 64] [--catches 200] [--workers N]
+                                 [--policies expert,average,novice] [--seed 1]
+
+Runs many independent headless sessions in a ProcessPoolExecutor. Every
+session has its own GameData, seed and player policy and plays the whole
+game loop: the casting click, the four fishing stages, storing the catch,
+selling the whole inventory in one bulk pass through sell_catches when it
+is full and buying rod upgrades in the SHOP as soon as they are affordable.
+Results stream back as sessions finish and are aggregated incrementally into
+per-policy gold curves, rarity counts and quality histograms, together with
+sessions/sec for every worker process.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Once per worker otherwise
+
+import pygame
+
+import fishing_game_modular_fixed as game
+import fishing_sim as sim
+from fishing_logic import (
+    GameData, FISH_DATABASE, ROD_UPGRADES, SimulationClock, create_caught_fish, store_caught_fish,
+    sell_catches
+)
+
+# Keys that buy each rod on the SHOP screen (see handle_shop_purchase)
+SHOP_KEYS = {"Novice Rod": pygame.K_1, "Master Rod": pygame.K_2}
+
+# Quality score histogram buckets: 0-9, 10-19, ..., 90-100
+QUALITY_BINS = 10
+
+# ============================================================================
+# Bot Session
+# ============================================================================
+
+def click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+
+def sell_inventory(game_data):
+    """Sell every fish in one bulk pass"""
+    sell_catches(game_data, lambda fish: True)
+
+def visit_shop(game_data):
+    """Buy the best rod upgrade the bot can afford; never buys a worse rod"""
+    for rod in sorted(ROD_UPGRADES, key=lambda name: -ROD_UPGRADES[name]["luck"]):
+        if ROD_UPGRADES[rod]["luck"] <= game_data.rod_luck[game_data.current_rod]:
+            continue
+        if game_data.gold >= ROD_UPGRADES[rod]["price"]:
+            events = [pygame.event.Event(pygame.KEYDOWN, key=SHOP_KEYS[rod])]
+            game_data.current_rod, game_data.gold = game.handle_shop_purchase(
+                events, game_data.current_rod, game_data.gold)
+            return rod
+    return None
+
+def run_session(session_id, seed, policy_name, catches, curve_step):
+    """Play one seeded session in this worker process and return its results"""
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    random.seed(seed)
+    game_data = GameData()
+    clock = SimulationClock()
+    policy = sim.POLICIES[policy_name](sim.policy_seed(seed))
+    result = {
+        'session_id': session_id, 'policy': policy_name, 'seed': seed, 'worker': os.getpid(),
+        'gold_curve': [], 'rarities': Counter(), 'quality_histogram': [0] * QUALITY_BINS,
+        'purchases': [],
+    }
+
+    for catch in range(catches):
+        if len(game_data.inventory) >= game_data.inventory_capacity:
+            sell_inventory(game_data)
+            bought = visit_shop(game_data)
+            if bought:
+                result['purchases'].append((catch, bought))
+
+        if not game.handle_casting_input([click((game.WINDOW_WIDTH // 2, game.WINDOW_HEIGHT // 2))]):
+            raise RuntimeError("casting click was not accepted")
+        stage_scores = [sim.play_stage(stage, policy, clock) for stage in game.make_fishing_stages(clock)]
+        caught_fish = create_caught_fish(stage_scores, game_data)
+        store_caught_fish(game_data, caught_fish)
+        game_data.caught_fish = None
+
+        result['rarities'][caught_fish.rarity] += 1
+        bucket = min(QUALITY_BINS - 1, int(caught_fish.quality_score * QUALITY_BINS / 100))
+        result['quality_histogram'][bucket] += 1
+        if (catch + 1) % curve_step == 0:
+            # Net worth: gold plus what the unsold inventory would fetch
+            result['gold_curve'].append(game_data.gold + game_data.inventory.total_value)
+
+    result['final_gold'] = game_data.gold + game_data.inventory.total_value
+    result['final_rod'] = game_data.current_rod
+    result['game_seconds'] = clock.now
+    result['seconds'] = time.perf_counter() - start
+    result['cpu_seconds'] = time.process_time() - cpu_start
+    return result
+
+# ============================================================================
+# Aggregation
+# ============================================================================
+
+class TournamentStats:
+    """Running totals over finished sessions, per policy and per worker"""
+    def __init__(self):
+        self.sessions = Counter()
+        self.catches = Counter()
+        self.rarities = {}
+        self.quality_histograms = {}
+        self.curve_sums = {}
+        self.final_golds = {}
+        self.master_rod_sessions = Counter()
+        self.worker_sessions = Counter()
+        self.worker_seconds = Counter()
+
+    def add(self, result):
+        policy = result['policy']
+        self.sessions[policy] += 1
+        self.catches[policy] += sum(result['rarities'].values())
+        self.rarities.setdefault(policy, Counter()).update(result['rarities'])
+        histogram = self.quality_histograms.setdefault(policy, [0] * QUALITY_BINS)
+        for bucket, count in enumerate(result['quality_histogram']):
+            histogram[bucket] += count
+        curve = self.curve_sums.setdefault(policy, [0] * len(result['gold_curve']))
+        for point, gold in enumerate(result['gold_curve']):
+            curve[point] += gold
+        self.final_golds.setdefault(policy, []).append(result['final_gold'])
+        self.master_rod_sessions[policy] += result['final_rod'] == "Master Rod"
+        self.worker_sessions[result['worker']] += 1
+        self.worker_seconds[result['worker']] += result['cpu_seconds']
+
+    def mean_curve(self, policy):
+        return [total / self.sessions[policy] for total in self.curve_sums[policy]]
+
+    def report(self, elapsed, curve_step):
+        total_sessions = sum(self.sessions.values())
+        total_catches = sum(self.catches.values())
+        print(f"\n{total_sessions} sessions, {total_catches:,} catches in {elapsed:.2f}s: "
+              f"{total_sessions / elapsed:.1f} sessions/s, {total_catches / elapsed:,.0f} catches/s")
+        for worker in sorted(self.worker_sessions):
+            rate = self.worker_sessions[worker] / self.worker_seconds[worker]
+            print(f"  worker {worker}: {self.worker_sessions[worker]} sessions, {rate:.2f} sessions per CPU second")
+        # Linear scaling means the pool's wall-clock rate equals the sum of
+        # the workers' CPU-time rates; less means workers waited for a CPU
+        summed_rate = sum(self.worker_sessions[w] / self.worker_seconds[w] for w in self.worker_sessions)
+        print(f"  scaling efficiency: {total_sessions / elapsed / summed_rate:.0%} of the summed worker rates "
+              f"({len(self.worker_sessions)} workers, {os.cpu_count()} CPUs)")
+
+        for policy in sorted(self.sessions):
+            golds = sorted(self.final_golds[policy])
+            print(f"\n{policy}: {self.sessions[policy]} sessions, median final worth {golds[len(golds) // 2]:,}, "
+                  f"Master Rod in {self.master_rod_sessions[policy] / self.sessions[policy]:.0%} of sessions")
+            curve = self.mean_curve(policy)
+            points = range(0, len(curve), max(1, len(curve) // 5))
+            print("  mean worth  " + "  ".join(f"@{(point + 1) * curve_step}: {curve[point]:,.0f}" for point in points))
+            catches = self.catches[policy]
+            print("  rarity      " + "  ".join(f"{rarity} {self.rarities[policy][rarity] / catches:.1%}"
+                                              for rarity in FISH_DATABASE))
+            print("  quality     " + "  ".join(f"{bucket * 10}+ {count / catches:.0%}"
+                                              for bucket, count in enumerate(self.quality_histograms[policy]) if count))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fishing Mastery multi-process bot tournament")
+    parser.add_argument("--sessions", type=int, default=64, help="sessions to play")
+    parser.add_argument("--catches", type=int, default=200, help="catches per session")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--policies", default="expert,average,novice", help="comma-separated fishing_sim policies")
+    parser.add_argument("--curve-step", type=int, default=10, help="catches between gold curve points")
+    parser.add_argument("--seed", type=int, default=1, help="base seed; session i uses seed + i")
+    args = parser.parse_args(argv)
+
+    policies = args.policies.split(",")
+    for policy in policies:
+        if policy not in sim.POLICIES:
+            parser.error(f"unknown policy {policy!r}; choose from {', '.join(sorted(sim.POLICIES))}")
+
+    stats = TournamentStats()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(run_session, session, args.seed + session, policies[session % len(policies)],
+                                   args.catches, args.curve_step)
+                   for session in range(args.sessions)]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            stats.add(result)
+            print(f"[{done}/{args.sessions}] session {result['session_id']} ({result['policy']}, seed "
+                  f"{result['seed']}): worth {result['final_gold']:,}, {result['final_rod']}, "
+                  f"{result['seconds']:.2f}s in worker {result['worker']}")
+    stats.report(time.perf_counter() - start, args.curve_step)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
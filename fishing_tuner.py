@@ -0,0 +1,237 @@
+"""
+Difficulty auto-tuner for the fishing stage parameters
+
+Usage:
+    python fishing_tuner.py [--rounds 4] [--candidates 12] [--catches 150]
+                            [--workers N] [--seed 1] [--cache tuner_cache.json]
+                            [--out stage_parameters.json]
+
+Searches the STAGE_PARAMETERS knobs for the set whose simulated quality
+distributions come closest to a target for each player model. Every
+candidate plays the same seeded catches with every model (common random
+numbers, so candidates differ only by their parameters); line tension knobs
+are scored with LineTensionBatch against threshold policies. The first round
+samples the whole search space, later rounds sample ever closer around the
+best set so far. Candidates are evaluated in a ProcessPoolExecutor, and
+their simulated metrics are cached in a JSON file keyed by the parameter
+set, so repeated candidates and re-runs cost nothing; losses are
+recomputed from the metrics against the current targets on every run. The
+best set is written to the parameter file the game loads at startup.
+Requires NumPy.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Once per worker otherwise
+
+import numpy as np
+
+import fishing_batch as batch
+import fishing_game_modular_fixed as game
+import fishing_sim as sim
+from fishing_logic import (
+    QUALITY_TIERS, STAGE_PARAMETERS, STAGE_PARAMETERS_PATH, SimulationClock, calculate_quality, stage_parameters
+)
+
+# (stage, knob): (low, high, step); values are snapped to the step
+SEARCH_SPACE = {
+    ("CastTimingStage", "marker_speed"): (150, 450, 10),
+    ("CastTimingStage", "target_zone_size"): (0.05, 0.25, 0.01),
+    ("DepthControlStage", "ideal_zone_start"): (200, 280, 5),
+    ("DepthControlStage", "ideal_zone_end"): (220, 300, 5),
+    ("DepthControlStage", "marker_speed"): (100, 300, 10),
+    ("BiteReactionStage", "reaction_window"): (0.3, 1.0, 0.05),
+    ("ReelingRhythmStage", "total_presses"): (4, 12, 1),
+    ("LineTensionStage", "gravity"): (100, 400, 10),
+    ("LineTensionStage", "lift_force"): (-500, -150, 10),
+    ("LineTensionStage", "target_square_speed"): (40, 160, 5),
+}
+
+# Player models and the quality tiers (and mean line tension score) the
+# design wants them to reach. The cast score is the marker's position on the
+# bar, so aiming at the green zone caps it near 50 and quality near 87:
+# "Perfect" is out of reach for every model whatever the knobs.
+TUNER_PLAYERS = {
+    "expert": {
+        "policy": dict(timing_error=0.02, reaction_time=0.18, reaction_jitter=0.03, rhythm_accuracy=0.97,
+                       press_jitter=0.03, aim_in_zone=True),
+        "quality": {"Great": 0.7, "Good": 0.3},
+        "tension_offset": (-20, 5),
+        "tension_score": 70,
+    },
+    "average": {
+        "policy": dict(press_jitter=0.06, aim_in_zone=True),
+        "quality": {"Great": 0.2, "Good": 0.6, "Fair": 0.2},
+        "tension_offset": (-10, 15),
+        "tension_score": 50,
+    },
+    "novice": {
+        "policy": dict(timing_error=0.15, reaction_time=0.45, reaction_jitter=0.15, rhythm_accuracy=0.7,
+                       press_jitter=0.12, aim_in_zone=True),
+        "quality": {"Good": 0.3, "Fair": 0.4, "Poor": 0.3},
+        "tension_offset": (0, 30),
+        "tension_score": 30,
+    },
+}
+
+TENSION_INSTANCES = 256
+
+# Part of every cache key; bump it when the simulation changes so metrics
+# cached by older code are not reused
+CACHE_VERSION = 2
+
+# ============================================================================
+# Candidates
+# ============================================================================
+
+def snap(value, low, high, step):
+    value = min(high, max(low, round((value - low) / step) * step + low))
+    return int(value) if isinstance(step, int) else round(value, 6)
+
+def make_candidate(values):
+    """Build a {stage: {knob: value}} set from {(stage, knob): value}, keeping the depth zone valid"""
+    parameters = {}
+    for (stage_name, knob), value in values.items():
+        parameters.setdefault(stage_name, {})[knob] = value
+    depth = parameters.get("DepthControlStage", {})
+    if "ideal_zone_start" in depth and depth["ideal_zone_end"] < depth["ideal_zone_start"] + 10:
+        depth["ideal_zone_end"] = depth["ideal_zone_start"] + 10
+    return parameters
+
+def random_candidate(rng, center=None, scale=1.0):
+    """Sample the search space uniformly, or around center with a relative spread"""
+    values = {}
+    for key, (low, high, step) in SEARCH_SPACE.items():
+        if center is None:
+            value = rng.uniform(low, high)
+        else:
+            value = center[key[0]][key[1]] + rng.gauss(0, scale * (high - low) / 4)
+        values[key] = snap(value, low, high, step)
+    return make_candidate(values)
+
+def baseline_candidate():
+    """The knobs currently in STAGE_PARAMETERS"""
+    return make_candidate({key: STAGE_PARAMETERS[key[0]][key[1]] for key in SEARCH_SPACE})
+
+def cache_key(parameters, catches, seed):
+    return json.dumps([CACHE_VERSION, parameters, catches, seed], sort_keys=True)
+
+# ============================================================================
+# Evaluation
+# ============================================================================
+
+def evaluate_candidate(parameters, catches, seed):
+    """Simulate every player model with these knobs; return their quality fractions and tension scores"""
+    metrics = {}
+    for name, player in TUNER_PLAYERS.items():
+        random.seed(seed)
+        policy = sim.SkillPolicy(seed=sim.policy_seed(seed), **player["policy"])
+        clock = SimulationClock()
+        tiers = dict.fromkeys(QUALITY_TIERS, 0)
+        for _ in range(catches):
+            stage_scores = [sim.play_stage(stage, policy, clock) for stage in game.make_fishing_stages(clock, parameters)]
+            tiers[calculate_quality(stage_scores)] += 1
+        fractions = {tier: count / catches for tier, count in tiers.items()}
+
+        mean, stdev = player["tension_offset"]
+        offsets = np.random.default_rng(seed).normal(mean, stdev, TENSION_INSTANCES)
+        template = game.LineTensionStage(clock, parameters.get("LineTensionStage"))
+        stages = batch.LineTensionBatch(TENSION_INSTANCES, template, (game.WINDOW_WIDTH, game.WINDOW_HEIGHT))
+        _, scores = stages.run(batch.TensionThresholdPolicy(offsets))
+        metrics[name] = {"quality": fractions, "tension_score": float(scores.mean())}
+    return metrics
+
+def candidate_loss(metrics):
+    """Squared distance of the metrics from every player model's targets"""
+    loss = 0.0
+    for name, player in TUNER_PLAYERS.items():
+        fractions = metrics[name]["quality"]
+        loss += sum((fractions[tier] - player["quality"].get(tier, 0.0)) ** 2 for tier in QUALITY_TIERS)
+        loss += ((metrics[name]["tension_score"] - player["tension_score"]) / 100) ** 2
+    return loss
+
+def evaluate_all(candidates, cache, catches, seed, executor):
+    """Evaluate the uncached candidates in parallel and return [(loss, metrics, parameters)]"""
+    keys = [cache_key(parameters, catches, seed) for parameters in candidates]
+    pending = {}
+    for key, parameters in zip(keys, candidates):
+        if key not in cache and key not in pending:
+            pending[key] = parameters
+    futures = {key: executor.submit(evaluate_candidate, parameters, catches, seed)
+               for key, parameters in pending.items()}
+    for key, future in futures.items():
+        cache[key] = future.result()
+    return [(candidate_loss(cache[key]), cache[key], parameters) for key, parameters in zip(keys, candidates)], len(pending)
+
+def load_cache(path):
+    if path and os.path.exists(path):
+        with open(path) as file:
+            return json.load(file)
+    return {}
+
+def save_cache(cache, path):
+    if path:
+        with open(path, "w") as file:
+            json.dump(cache, file)
+
+def describe(metrics):
+    lines = []
+    for name, player in TUNER_PLAYERS.items():
+        fractions = metrics[name]["quality"]
+        tiers = "  ".join(f"{tier} {fractions[tier]:.0%}/{player['quality'].get(tier, 0):.0%}"
+                          for tier in QUALITY_TIERS if fractions[tier] or player["quality"].get(tier))
+        lines.append(f"    {name:<8} {tiers}   tension {metrics[name]['tension_score']:.0f}/{player['tension_score']}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fishing Mastery stage difficulty tuner")
+    parser.add_argument("--rounds", type=int, default=4, help="search rounds")
+    parser.add_argument("--candidates", type=int, default=12, help="candidates per round")
+    parser.add_argument("--catches", type=int, default=150, help="simulated catches per player model")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--cache", default="tuner_cache.json", help="evaluation cache file ('' to disable)")
+    parser.add_argument("--out", default=STAGE_PARAMETERS_PATH, help="parameter file to write")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    cache = load_cache(args.cache)
+    start = time.perf_counter()
+    best = None
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for round_number in range(args.rounds):
+            if best is None:
+                candidates = [baseline_candidate()] + [random_candidate(rng) for _ in range(args.candidates - 1)]
+            else:
+                scale = 0.5 ** round_number
+                candidates = [best[2]] + [random_candidate(rng, best[2], scale) for _ in range(args.candidates - 1)]
+            results, evaluated = evaluate_all(candidates, cache, args.catches, args.seed, executor)
+            if round_number == 0:
+                baseline = results[0]
+            best = min(results + ([best] if best else []), key=lambda result: result[0])
+            save_cache(cache, args.cache)
+            print(f"round {round_number + 1}: {evaluated} evaluated, {len(candidates) - evaluated} cached, "
+                  f"best loss {best[0]:.4f}")
+
+    print(f"\nTuned in {time.perf_counter() - start:.1f}s ({len(cache)} parameter sets in the cache)")
+    print(f"  baseline loss {baseline[0]:.4f} (observed/target)\n{describe(baseline[1])}")
+    print(f"  tuned loss {best[0]:.4f}\n{describe(best[1])}")
+
+    tuned = {stage_name: stage_parameters(stage_name, best[2].get(stage_name)) for stage_name in STAGE_PARAMETERS}
+    with open(args.out, "w") as file:
+        json.dump(tuned, file, indent=2)
+    print(f"\nWrote {args.out}:")
+    for stage_name, parameters in tuned.items():
+        print(f"  {stage_name}: " + ", ".join(f"{knob}={value}" for knob, value in parameters.items()))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,504 @@
+"""
+Correctness checks shared by the test suite and benchmarks.py
+
+Each check computes what is compared and returns it; the tests assert on
+the results with fixed seeds and small sizes, the benchmark subcommands
+run the same checks at benchmark scale and print PASS or FAIL.
+"""
+
+import os
+import pickle
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import fishing_game_modular_fixed as game
+import fishing_logic as logic
+
+# ============================================================================
+# Spawning
+# ============================================================================
+
+def spawn_fish_linear(rod_luck, cheat_mode):
+    """The old spawn_fish: rebuild the probabilities and scan them on every call"""
+    adjusted_chances = logic.rarity_probabilities(rod_luck, cheat_mode)
+    random_value = logic.random.random()
+    cumulative = 0
+    selected_rarity = "Common"
+    for rarity, chance in adjusted_chances.items():
+        cumulative += chance
+        if random_value <= cumulative:
+            selected_rarity = rarity
+            break
+    return {"name": logic.random.choice(logic.FISH_DATABASE[selected_rarity]), "rarity": selected_rarity}
+
+
+def chi_square_limit(degrees, z=3.09):
+    """Chi-square critical value at p=0.001 (Wilson-Hilferty approximation)"""
+    return degrees * (1 - 2 / (9 * degrees) + z * (2 / (9 * degrees)) ** 0.5) ** 3
+
+
+def spawn_distribution(luck, cheat_mode, draws, seed):
+    """Two-sample chi-square of spawn_fish_linear vs the alias sampler; returns (statistic, limit, degrees)"""
+    species = [(fish['name'], fish['rarity']) for fish in logic.get_all_fish_list()]
+    logic.random.seed(seed)
+    linear_counts = dict.fromkeys(species, 0)
+    alias_counts = dict.fromkeys(species, 0)
+    for _ in range(draws):
+        fish = spawn_fish_linear(luck, cheat_mode)
+        linear_counts[fish['name'], fish['rarity']] += 1
+        fish = logic.spawn_fish(luck, cheat_mode)
+        alias_counts[fish['name'], fish['rarity']] += 1
+    cells = [(linear_counts[key], alias_counts[key]) for key in species if linear_counts[key] + alias_counts[key]]
+    statistic = sum((a - b) ** 2 / (a + b) for a, b in cells)
+    return statistic, chi_square_limit(len(cells) - 1), len(cells) - 1
+
+
+def spawn_table_error(luck, cheat_mode):
+    """Largest difference between the alias tables' rarity odds and rarity_probabilities()"""
+    sampler = logic.get_spawn_sampler(luck, cheat_mode)
+    encoded = {rarity: 0.0 for rarity in logic.FISH_DATABASE}
+    for (name, rarity), chance in zip(sampler.outcomes, sampler.distribution()):
+        encoded[rarity] += chance
+    expected = logic.rarity_probabilities(luck, cheat_mode)
+    return max(abs(encoded[rarity] - expected[rarity]) for rarity in expected)
+
+# ============================================================================
+# NumPy Batch Spawning and Pricing
+# ============================================================================
+
+def batch_distribution(rarity_codes, species, luck):
+    """Chi-square of batch species counts against the alias tables; returns (statistic, limit, rarities match)"""
+    import numpy as np
+    import fishing_batch as batch
+
+    sampler = logic.get_spawn_sampler(luck, False)
+    expected = np.zeros(len(batch.SPECIES))
+    for outcome, chance in zip(sampler.outcomes, sampler.distribution()):
+        expected[batch.SPECIES.index(outcome)] += chance * len(species)
+    observed = np.bincount(species, minlength=len(batch.SPECIES))
+    statistic = float(((observed - expected) ** 2 / expected).sum())
+    rarity_matches = bool((batch.SPECIES_RARITY[species] == rarity_codes).all())
+    return statistic, chi_square_limit(len(batch.SPECIES) - 1), rarity_matches
+
+
+def batch_price_mismatches(rarity_codes, qualities):
+    """Batch prices that differ from calculate_selling_price(), with and without the 10x cheat"""
+    import fishing_batch as batch
+
+    game_data = logic.GameData()
+    mismatches = 0
+    for price_cheat in (False, True):
+        game_data.price_cheat = price_cheat
+        batch_prices = batch.calculate_selling_prices(rarity_codes, qualities, price_cheat)
+        for code, quality, price in zip(rarity_codes, qualities, batch_prices):
+            mismatches += price != logic.calculate_selling_price(batch.RARITY_NAMES[code], float(quality), game_data)
+    return mismatches
+
+# ============================================================================
+# Line Tension Batch
+# ============================================================================
+
+# The shipped knobs plus a tighter speed limit, so the check covers
+# instances that hit the velocity clamp as well as ones that do not
+TENSION_VARIANTS = [("as shipped", {}), ("tight speed limit", {"max_up_speed": -80, "max_down_speed": 90})]
+
+
+def run_scalar_tension(offset, knobs):
+    """Play one LineTensionStage with a threshold policy, sending SPACE key events like main()"""
+    import fishing_batch as batch
+
+    stage = game.LineTensionStage()
+    for knob, value in knobs.items():
+        setattr(stage, knob, value)
+    policy = batch.TensionThresholdPolicy(offset)
+    held = False
+    while not stage.completed:
+        stage.update(logic.SIM_STEP)
+        want = bool(policy(stage))
+        if want != held:
+            stage.handle_input([pygame.event.Event(pygame.KEYDOWN if want else pygame.KEYUP, key=pygame.K_SPACE)])
+            held = want
+    return stage.time_in_target, stage.score
+
+
+def run_batch_tension(offsets, knobs):
+    """Play one LineTensionBatch instance per threshold offset; returns (time_in_target, scores)"""
+    import fishing_batch as batch
+
+    stages = batch.LineTensionBatch(len(offsets), game.LineTensionStage(),
+                                    (game.WINDOW_WIDTH, game.WINDOW_HEIGHT), **knobs)
+    return stages.run(batch.TensionThresholdPolicy(offsets))
+
+
+def tension_mismatches(checked, scalar, time_in_target, scores):
+    """Batch instances whose time in target or score differ from the scalar results for them"""
+    return sum(in_target != time_in_target[i] or score != scores[i]
+               for i, (in_target, score) in zip(checked, scalar))
+
+# ============================================================================
+# Inventory Indexes
+# ============================================================================
+
+def random_catch(rng):
+    """A catch of a random species, sometimes one the catalog scan must not count"""
+    roll = rng.random()
+    if roll < 0.05:
+        info = {'name': "Common Fish", 'rarity': rng.choice(list(logic.FISH_DATABASE))}  # spawn_fish fallback
+    elif roll < 0.1:
+        info = {'name': rng.choice(logic.get_all_fish_list())['name'], 'rarity': rng.choice(list(logic.FISH_DATABASE))}
+    else:
+        info = dict(rng.choice(logic.get_all_fish_list()))
+    quality_score = rng.uniform(0, 100)
+    return logic.CatchRecord(logic.species_id(info['name'], info['rarity']), logic.calculate_quality([quality_score]),
+                             quality_score, logic.calculate_selling_price(info['rarity'], quality_score))
+
+
+def mutate_inventory(inventories, rng):
+    """Apply one random list operation to every inventory in the same way"""
+    size = len(inventories[0])
+    operation = rng.choice(["append", "append", "append", "insert", "extend", "pop", "pop", "pop_end",
+                            "remove", "setitem", "delitem", "delslice", "setslice", "iadd", "sort", "clear",
+                            "sell_where", "remove_catch"])
+    if operation in ("pop", "remove", "setitem", "delitem", "pop_end", "remove_catch") and not size:
+        operation = "append"
+    index = rng.randrange(size) if size else 0
+    catches = [random_catch(rng) for _ in range(rng.randrange(4))]
+    catch = catches[0] if catches else random_catch(rng)
+    rarity = rng.choice(list(logic.FISH_DATABASE))
+    hint = rng.choice([None, index, rng.randrange(size + 1)])  # Right, absent or possibly wrong position
+    start, stop = sorted(rng.randrange(size + 1) for _ in range(2))
+    if operation == "clear" and rng.random() >= 0.2:
+        operation = "sort"  # Keep most sequences long enough to grow
+    for inventory in inventories:
+        if operation == "append":
+            inventory.append(catch)
+        elif operation == "insert":
+            inventory.insert(index, catch)
+        elif operation == "extend":
+            inventory.extend(iter(catches))
+        elif operation == "pop":
+            inventory.pop(index)
+        elif operation == "pop_end":
+            inventory.pop()
+        elif operation == "remove":
+            inventory.remove(inventory[index])
+        elif operation == "setitem":
+            inventory[index] = catch
+        elif operation == "delitem":
+            del inventory[index]
+        elif operation == "delslice":
+            del inventory[start:stop]
+        elif operation == "setslice":
+            inventory[start:stop] = catches
+        elif operation == "iadd":
+            inventory += catches
+        elif operation == "sort":
+            inventory.sort(key=lambda fish: fish.price)
+        elif operation == "clear":
+            inventory.clear()
+        elif operation == "remove_catch":
+            if isinstance(inventory, logic.Inventory):
+                inventory.remove_catch(inventory[index], hint)
+            else:
+                del inventory[index]
+        elif operation == "sell_where":
+            if isinstance(inventory, logic.Inventory):
+                inventory.sell_where(lambda fish: fish.rarity == rarity)
+            else:
+                inventory[:] = [fish for fish in inventory if fish.rarity != rarity]
+    return operation
+
+
+def inventory_matches(inventory, plain):
+    """True if the Inventory's contents, running counts and sorted indexes equal scans of plain"""
+    return (list(inventory) == plain
+            and inventory.missing_fish_counts() == logic.get_missing_fish_counts(plain)
+            and set(inventory.caught_species()) == logic.get_caught_species(plain)
+            and inventory.total_value == sum(fish.price for fish in plain)
+            and all([key(fish) for fish in inventory.sorted_catches(order)] == sorted(map(key, plain), reverse=True)
+                    for order, key in logic.SORT_KEYS.items())
+            and pickle.loads(pickle.dumps(inventory)).catalog_counts == inventory.catalog_counts)
+
+
+def inventory_sequence(seed, operations, counts=None):
+    """Mutate an Inventory and a plain list alike; return the operation after which they diverged, or None"""
+    rng = random.Random(seed)
+    plain = []
+    inventory = logic.Inventory()
+    for order in logic.SORT_KEYS:
+        inventory.sorted_catches(order)  # Start maintaining every sorted index
+    for _ in range(operations):
+        operation = mutate_inventory([plain, inventory], rng)
+        if counts is not None:
+            counts[operation] = counts.get(operation, 0) + 1
+        if not inventory_matches(inventory, plain):
+            return operation
+    return None
+
+# ============================================================================
+# Bulk Selling
+# ============================================================================
+
+def sell_one_at_a_time(game_data, sold):
+    """The click path: pop(i) every catch for which sold(fish) is true"""
+    earned = 0
+    index = 0
+    while index < len(game_data.inventory):
+        if sold(game_data.inventory[index]):
+            earned += game_data.inventory.pop(index).price
+        else:
+            index += 1
+    game_data.gold += earned
+    return earned
+
+
+def best_of_species(inventory):
+    """The highest quality catch of each species, the first on ties"""
+    best = {}
+    for fish in inventory:
+        if fish.species not in best or fish.quality_score > best[fish.species].quality_score:
+            best[fish.species] = fish
+    return best
+
+
+# (label, bulk sell, predicate the one-at-a-time path sells by) per shortcut
+BULK_SELLS = [
+    ("sell Common", lambda game_data: logic.sell_rarity(game_data, "Common"),
+     lambda inventory: lambda fish: fish.rarity == "Common"),
+    ("sell below Good", lambda game_data: logic.sell_below_quality(game_data, "Good"),
+     lambda inventory: lambda fish: fish.quality in ("Fair", "Poor")),
+    ("sell all but best", logic.sell_all_but_best,
+     lambda inventory: (lambda best: lambda fish: best[fish.species] is not fish)(best_of_species(inventory))),
+]
+
+
+def bulk_sell_agrees(slow, fast, slow_earned, fast_earned):
+    """True if one-at-a-time and bulk selling earned the same and left the same inventory and counts"""
+    return (slow_earned == fast_earned and slow.gold == fast.gold and list(slow.inventory) == list(fast.inventory)
+            and fast.inventory.missing_fish_counts() == logic.get_missing_fish_counts(list(fast.inventory))
+            and fast.inventory.total_value == sum(fish.price for fish in fast.inventory))
+
+# ============================================================================
+# Hit Testing
+# ============================================================================
+
+def inventory_row_scan(pos, count):
+    """The old inventory hit test: try every row in turn"""
+    mouse_x, mouse_y = pos
+    for i in range(count):
+        item_y = 135 + (i * 40)
+        if 50 <= mouse_x <= 600 and item_y <= mouse_y <= item_y + 30:
+            return i
+    return None
+
+
+def row_scan(layout, pos, count, scroll):
+    """Brute-force RowLayout hit test: every row's hit band in turn"""
+    x, y = pos
+    for i in range(count):
+        row_y = layout.row_y(i, scroll)
+        if layout.left <= x <= layout.right and row_y + layout.hit_top <= y <= row_y + layout.hit_bottom:
+            return i
+    return None
+
+
+def fish_cell_scan(view, pos):
+    """Brute-force fish index hit test: the viewport, then every cell's rectangle"""
+    if not view.viewport.collidepoint(pos):
+        return None
+    for index in range(len(view.fish)):
+        x, y = view.cell_position(index)
+        if pygame.Rect(x, y, view.CELL_SIZE, view.CELL_SIZE + view.LABEL_HEIGHT).collidepoint(pos):
+            return index
+    return None
+
+
+def edge_points(xs, ys, rng, samples):
+    """Every point on the given vertical and horizontal lines across the window, plus random points"""
+    points = [(x, y) for x in xs for y in range(-10, game.WINDOW_HEIGHT + 10)]
+    points += [(x, y) for y in ys for x in range(-10, game.WINDOW_WIDTH + 10)]
+    points += [(rng.randrange(game.WINDOW_WIDTH), rng.randrange(game.WINDOW_HEIGHT)) for _ in range(samples)]
+    return points
+
+
+def row_hit_mismatches(layout, count, scroll, rng, samples):
+    """RowLayout.row_at against row_scan on every row edge pixel and at random points; returns (points, mismatches)"""
+    xs = [edge + d for edge in (layout.left, (layout.left + layout.right) // 2, layout.right) for d in (-1, 0, 1)]
+    ys = [layout.row_y(i, scroll) + edge + d for i in range(count + 1)
+          for edge in (layout.hit_top, layout.hit_bottom) for d in (-1, 0, 1)]
+    points = edge_points(xs, ys, rng, samples)
+    mismatches = sum(layout.row_at(point, count, scroll) != row_scan(layout, point, count, scroll) for point in points)
+    if scroll == 0 and layout is game.INVENTORY_ROWS:
+        mismatches += sum(layout.row_at(point, count) != inventory_row_scan(point, count) for point in points)
+    return len(points), mismatches
+
+
+def fish_cell_mismatches(view, scroll, rng, samples):
+    """FishIndexView.cell_at against fish_cell_scan on every cell and viewport edge pixel; returns (points, mismatches)"""
+    view.scroll = scroll
+    grid = view.layout
+    xs = [grid.left + column * grid.column_pitch + edge + d for column in range(grid.columns + 1)
+          for edge in (0, grid.cell_width) for d in (-1, 0, 1)]
+    ys = [grid.top + row * grid.row_pitch - scroll + edge + d for row in range(view.row_count() + 1)
+          for edge in (0, grid.cell_height) for d in (-1, 0, 1)]
+    ys += [view.viewport.top + d for d in (-1, 0, 1)] + [view.viewport.bottom + d for d in (-1, 0, 1)]
+    points = edge_points(xs, ys, rng, samples)
+    return len(points), sum(view.cell_at(point) != fish_cell_scan(view, point) for point in points)
+
+
+def visible_row_mismatches(layout, view, counts=(0, 1, 7, 25)):
+    """Scroll offsets at which RowLayout or the fish index grid report other visible rows than a scan"""
+    mismatches = 0
+    for count in counts:
+        for scroll in range(-layout.pitch, layout.row_y(count) - layout.top + layout.pitch):
+            for top, bottom in ((135, 550), (layout.top, layout.top + layout.pitch), (100, 101)):
+                shown = [i for i in range(count) if layout.row_y(i, scroll) + layout.hit_bottom >= top
+                         and layout.row_y(i, scroll) + layout.hit_top < bottom]
+                mismatches += list(layout.visible_rows(count, top, bottom, scroll)) != shown
+    for scroll in range(view.max_scroll() + 1):
+        view.scroll = scroll
+        grid = view.layout
+        shown = [row for row in range(view.row_count())
+                 if grid.cell_position(row * grid.columns, scroll)[1] + grid.cell_height > view.viewport.top
+                 and grid.cell_position(row * grid.columns, scroll)[1] < view.viewport.bottom]
+        mismatches += list(view.visible_rows()) != shown
+    return mismatches
+
+# ============================================================================
+# Rendering
+# ============================================================================
+
+def setup_screen():
+    """Create the (dummy) game window and the default font"""
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((game.WINDOW_WIDTH, game.WINDOW_HEIGHT))
+    return screen, pygame.font.Font(None, 36)
+
+
+def make_inventory(every=2):
+    """Build an inventory holding every n-th fish of the catalog"""
+    inventory = logic.Inventory()
+    for fish in game.get_all_fish_list()[::every]:
+        inventory.append(logic.CatchRecord(logic.species_id(fish['name'], fish['rarity']), "Good", 70, 100))
+    return inventory
+
+
+def make_menu_buttons(font):
+    """Create the main menu icon buttons the way main() does"""
+    icons = ["STARTFISHING", "GUIDE", "SHOP", "FISHINDEX", "INVENTORY", "QUIT"]
+    return [game.Button(game.WINDOW_WIDTH // 2 - 75, 200 + 60 * i, 150, 40, icon, game.GREEN,
+                        game.DARK_GREEN, font, f"assets/Main Menu Icons/{icon}.png")
+            for i, icon in enumerate(icons)]
+
+
+def make_stages():
+    """All five fishing stages, so stage 5 (line tension) can be drawn too"""
+    return [game.CastTimingStage(), game.DepthControlStage(), game.BiteReactionStage(),
+            game.ReelingRhythmStage(), game.LineTensionStage()]
+
+
+def render_scenarios(game_data):
+    """(label, state, stage number) for every screen of the game"""
+    caught = logic.CatchRecord(logic.species_id("Salmon", "Rare"), "Good", 70, 1183)
+    game_data.caught_fish = caught
+    scenarios = [(state, state, 1) for state in (
+        game.GameState.MAIN_MENU, game.GameState.GUIDE, game.GameState.SHOP, game.GameState.CASTING,
+        game.GameState.SELLING, game.GameState.FISH_DISPLAY, game.GameState.FISH_INDEX,
+        game.GameState.INVENTORY)]
+    scenarios += [(f"fishing stage {stage}", game.GameState.FISHING, stage) for stage in range(1, 6)]
+    return scenarios
+
+
+class DisplayMirror:
+    """Copies whatever the renderer pushes to the display into a front buffer
+
+    With the dummy video driver the display surface is the drawing surface,
+    so pushing cannot be observed directly; comparing the front buffer with
+    the screen after a frame shows whether every changed pixel was pushed.
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.front = screen.copy()
+
+    def __enter__(self):
+        self.flip, self.update = pygame.display.flip, pygame.display.update
+        pygame.display.flip, pygame.display.update = self.push_all, self.push
+        return self
+
+    def __exit__(self, *exc_info):
+        pygame.display.flip, pygame.display.update = self.flip, self.update
+
+    def push_all(self):
+        self.front.blit(self.screen, (0, 0))
+        self.flip()
+
+    def push(self, rects):
+        for rect in rects:
+            self.front.blit(self.screen, rect, rect)
+        self.update(rects)
+
+    def matches(self):
+        return pygame.image.tobytes(self.front, "RGB") == pygame.image.tobytes(self.screen, "RGB")
+
+
+def render_check(screen, font, small_font, state, stage_number, game_data, buttons, frames):
+    """Play frames of a screen with dirty rectangles, then expose the window
+
+    Returns (frames whose pushed pixels differ from the drawn screen, pixels
+    pushed by the frame after the expose).
+    """
+    renderer = game.RENDERER
+    game.RENDERER = game.DirtyRectRenderer("dirty")
+    stages = make_stages()
+    stages[4].space_held = True
+
+    def frame():
+        if state == game.GameState.FISHING:
+            stages[stage_number - 1].update(1 / game.FPS)
+        game.RENDERER.begin_frame(game.get_scene_key(state, stage_number, game_data))
+        game.draw_game_state(screen, font, small_font, state, stage_number, stages, buttons, game_data)
+        game.RENDERER.end_frame()
+
+    try:
+        mismatched = 0
+        with DisplayMirror(screen) as mirror:
+            for _ in range(frames):
+                frame()
+                mismatched += not mirror.matches()
+        pushed = game.RENDERER.total_pixels
+        game.handle_window_exposure([pygame.event.Event(pygame.WINDOWEXPOSED)])
+        frame()
+        return mismatched, game.RENDERER.total_pixels - pushed
+    finally:
+        game.RENDERER = renderer
+
+# ============================================================================
+# Catch Storage
+# ============================================================================
+
+def create_caught_fish_dict(stage_scores, game_data):
+    """The old create_caught_fish: a nested dict per catch"""
+    quality_score = sum(stage_scores) / len(stage_scores)
+    quality = logic.calculate_quality([quality_score])
+    fish_info = logic.spawn_fish(game_data.rod_luck[game_data.current_rod], game_data.cheat_mode)
+    return {
+        'info': fish_info,
+        'quality': quality,
+        'quality_score': quality_score,
+        'price': logic.calculate_selling_price(fish_info['rarity'], quality_score, game_data)
+    }
+
+
+def catch_store_mismatches(old, records, history):
+    """Catches that differ between nested dicts, CatchRecords and a CatchHistory built from the same seeds"""
+    return sum((fish['info']['name'], fish['info']['rarity'], fish['quality'], fish['quality_score'], fish['price'])
+               != (record.name, record.rarity, record.quality, record.quality_score, record.price)
+               or (record.species, record.quality, record.quality_score, record.price)
+               != (stored.species, stored.quality, stored.quality_score, stored.price)
+               for fish, record, stored in zip(old, records, history))
+
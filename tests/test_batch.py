@@ -0,0 +1,25 @@
+"""NumPy batch spawning and pricing against the scalar game logic"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import fishing_batch as batch
+import fishing_logic as logic
+from tests import checks
+
+LUCK = logic.GameData().rod_luck["Novice Rod"]
+
+
+def test_batch_species_follow_alias_tables():
+    rarity_codes, species = batch.spawn_fish_batch(200000, LUCK, False, np.random.default_rng(1))
+    statistic, limit, rarity_matches = checks.batch_distribution(rarity_codes, species, LUCK)
+    assert rarity_matches
+    assert statistic < limit
+
+
+def test_batch_prices_match_calculate_selling_price():
+    rng = np.random.default_rng(2)
+    rarity_codes, _ = batch.spawn_fish_batch(5000, LUCK, True, rng)
+    qualities = np.concatenate([rng.uniform(0, 100, 4998), [0.0, 100.0]])
+    assert checks.batch_price_mismatches(rarity_codes, qualities) == 0
@@ -0,0 +1,72 @@
+"""Bulk selling and the inventory screen's two-keypress sell shortcuts"""
+
+import random
+
+import pygame
+import pytest
+
+import fishing_game_modular_fixed as game
+import fishing_logic as logic
+from tests import checks
+
+
+def stocked_game_data(seed, size=500):
+    game_data = logic.GameData()
+    rng = random.Random(seed)
+    game_data.inventory = logic.Inventory(checks.random_catch(rng) for _ in range(size))
+    return game_data
+
+
+def key(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode="", mod=0)
+
+
+@pytest.mark.parametrize("label, bulk, make_sold", checks.BULK_SELLS, ids=[sell[0] for sell in checks.BULK_SELLS])
+def test_bulk_sell_matches_selling_one_at_a_time(label, bulk, make_sold):
+    slow, fast = stocked_game_data(1), stocked_game_data(1)
+    fast.inventory = logic.Inventory(slow.inventory)  # The same catch objects
+    slow_earned = checks.sell_one_at_a_time(slow, make_sold(slow.inventory))
+    fast_earned = bulk(fast)
+    assert 0 < len(fast.inventory) < 500
+    assert checks.bulk_sell_agrees(slow, fast, slow_earned, fast_earned)
+
+
+@pytest.mark.parametrize("shortcut", [pygame.K_1, pygame.K_q, pygame.K_b])
+def test_first_press_only_previews_and_second_press_sells(shortcut):
+    game_data = stocked_game_data(2)
+    pending = game.PendingSale()
+    catches = list(game_data.inventory)
+
+    assert game.handle_inventory_shortcuts([key(shortcut)], game_data, pending) == 0
+    assert pending.key == shortcut
+    assert list(game_data.inventory) == catches and game_data.gold == logic.GameData().gold
+    sold = game.inventory_shortcut_filter(shortcut, game_data.inventory)
+    assert (pending.count, pending.gold) == logic.sale_value(catches, sold)
+
+    gold = game_data.gold
+    earned = game.handle_inventory_shortcuts([key(shortcut)], game_data, pending)
+    assert earned == pending.gold and game_data.gold == gold + earned
+    assert len(game_data.inventory) == len(catches) - pending.count
+    assert pending.key is None
+
+
+@pytest.mark.parametrize("cancel", [key(pygame.K_DOWN), key(pygame.K_ESCAPE),
+                                    pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0))],
+                         ids=["other key", "escape", "click"])
+def test_other_input_cancels_the_pending_sale(cancel):
+    game_data = stocked_game_data(3)
+    pending = game.PendingSale()
+    catches = list(game_data.inventory)
+    game.handle_inventory_shortcuts([key(pygame.K_q), cancel], game_data, pending)
+    assert pending.key is None
+    assert game.handle_inventory_shortcuts([key(pygame.K_q)], game_data, pending) == 0
+    assert list(game_data.inventory) == catches
+
+
+def test_a_different_shortcut_rearms_instead_of_selling():
+    game_data = stocked_game_data(4)
+    pending = game.PendingSale()
+    catches = list(game_data.inventory)
+    assert game.handle_inventory_shortcuts([key(pygame.K_q), key(pygame.K_b)], game_data, pending) == 0
+    assert pending.key == pygame.K_b
+    assert list(game_data.inventory) == catches
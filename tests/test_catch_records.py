@@ -0,0 +1,33 @@
+"""CatchRecord and CatchHistory against the old nested-dict catches"""
+
+import pickle
+import random
+
+import fishing_logic as logic
+from tests import checks
+
+
+def build(create, catches=2000):
+    """create(stage_scores, game_data) for seeded stage scores, the way benchmarks.py catch-memory does"""
+    rng = random.Random(1)
+    logic.random.seed(1)
+    game_data = logic.GameData()
+    game_data.current_rod = "Master Rod"
+    return [create([rng.uniform(0, 100) for _ in range(4)], game_data) for _ in range(catches)]
+
+
+def test_records_and_history_hold_the_same_catches_as_dicts():
+    old = build(checks.create_caught_fish_dict)
+    records = build(logic.create_caught_fish)
+    history = logic.CatchHistory(build(logic.create_caught_fish))
+    assert len(old) == len(records) == len(list(history)) == 2000
+    assert checks.catch_store_mismatches(old, records, history) == 0
+
+
+def test_history_and_pickle_round_trip_records():
+    records = build(logic.create_caught_fish, 200)
+    history = logic.CatchHistory(records)
+    fields = lambda fish: (fish.species, fish.name, fish.rarity, fish.quality, fish.quality_score, fish.price)
+    assert [fields(fish) for fish in history] == [fields(fish) for fish in records]
+    assert fields(history[57]) == fields(records[57])
+    assert [fields(fish) for fish in pickle.loads(pickle.dumps(records))] == [fields(fish) for fish in records]
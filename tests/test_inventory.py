@@ -0,0 +1,22 @@
+"""Inventory running counts and sorted indexes against scans of a plain list"""
+
+import pytest
+
+import fishing_logic as logic
+from tests import checks
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_operations_keep_indexes_in_sync(seed):
+    assert checks.inventory_sequence(seed, operations=200) is None
+
+
+def test_remove_catch_removes_by_identity():
+    twin = logic.CatchRecord(0, "Good", 70.0, 100)
+    fish = logic.CatchRecord(0, "Good", 70.0, 100)  # Same sort keys as twin
+    inventory = logic.Inventory([twin, fish, twin])
+    inventory.sorted_catches("price")
+    inventory.remove_catch(fish, position=0)  # A stale position is ignored
+    assert list(inventory) == [twin, twin]
+    assert inventory.sorted_catches("price") == [twin, twin]
+    assert checks.inventory_matches(inventory, [twin, twin])
@@ -0,0 +1,45 @@
+"""Selling by clicking rows of the inventory screen"""
+
+import random
+
+import pygame
+
+import fishing_game_modular_fixed as game
+import fishing_logic as logic
+from tests import checks
+
+
+def click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+
+
+def row_center(view, row):
+    return 300, view.layout.row_y(row, view.scroll) + 5
+
+
+def test_click_in_sorted_scrolled_view_sells_the_catch_it_shows():
+    rng = random.Random(1)
+    inventory = logic.Inventory(checks.random_catch(rng) for _ in range(200))
+    view = game.InventoryView()
+    for order in game.InventoryView.SORT_ORDERS:
+        view.order = order
+        view.scroll = 0
+        view.scroll_by(1234, len(inventory))
+        for row in view.visible_rows(len(inventory))[1:-1]:
+            shown = view.catches(inventory, range(row, row + 1))[0]
+            count = len(inventory)
+            gold, sold = game.handle_inventory_selling([click(row_center(view, row))], inventory, 0, view)
+            assert sold and gold == shown.price
+            assert len(inventory) == count - 1
+            assert all(fish is not shown for fish in inventory)
+            break
+    assert checks.inventory_matches(inventory, list(inventory))
+
+
+def test_click_sells_from_a_plain_list():
+    rng = random.Random(2)
+    catches = [checks.random_catch(rng) for _ in range(5)]
+    inventory = list(catches)
+    gold, sold = game.handle_inventory_selling([click((300, game.INVENTORY_ROWS.row_y(2) + 5))], inventory, 0)
+    assert sold and gold == catches[2].price
+    assert inventory == catches[:2] + catches[3:]
@@ -0,0 +1,32 @@
+"""RowLayout and GridLayout arithmetic against brute-force scans of every row and cell"""
+
+import random
+
+import pytest
+
+import fishing_game_modular_fixed as game
+import fishing_logic as logic
+from tests import checks
+
+
+@pytest.mark.parametrize("scroll", [0, 37, 200])
+def test_inventory_row_hits_match_a_scan(scroll):
+    points, mismatches = checks.row_hit_mismatches(game.INVENTORY_ROWS, 8, scroll, random.Random(scroll), 500)
+    assert mismatches == 0
+
+
+def small_fish_index():
+    return game.FishIndexView(logic.get_all_fish_list()[:18])
+
+
+@pytest.mark.parametrize("scroll", [0, 37, "max"])
+def test_fish_index_cell_hits_match_a_scan(scroll):
+    view = small_fish_index()
+    assert view.max_scroll() > 37
+    scroll = view.max_scroll() if scroll == "max" else scroll
+    points, mismatches = checks.fish_cell_mismatches(view, scroll, random.Random(1), 500)
+    assert mismatches == 0
+
+
+def test_visible_rows_match_a_scan_at_every_scroll_offset():
+    assert checks.visible_row_mismatches(game.INVENTORY_ROWS, small_fish_index()) == 0
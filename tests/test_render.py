@@ -0,0 +1,27 @@
+"""Dirty rectangle rendering against what each screen draws"""
+
+import pytest
+
+import fishing_game_modular_fixed as game
+from tests import checks
+
+
+@pytest.fixture(scope="module")
+def scene():
+    screen, font = checks.setup_screen()
+    game.init_fish_atlases()
+    game_data = game.GameData()
+    game_data.background = "assets/Background/Stormy.jpg"
+    game_data.inventory = checks.make_inventory(every=5)
+    checks.render_scenarios(game_data)  # Sets the catch the SELLING and FISH_DISPLAY screens show
+    return screen, font, game.get_font(24), game_data, checks.make_menu_buttons(font)
+
+
+@pytest.mark.parametrize("label, state, stage_number", checks.render_scenarios(game.GameData()),
+                         ids=[str(scenario[0]) for scenario in checks.render_scenarios(game.GameData())])
+def test_dirty_frames_push_every_changed_pixel_and_expose_pushes_all(scene, label, state, stage_number):
+    screen, font, small_font, game_data, buttons = scene
+    mismatched, exposed_pixels = checks.render_check(screen, font, small_font, state, stage_number, game_data,
+                                                     buttons, frames=20)
+    assert mismatched == 0
+    assert exposed_pixels == screen.get_width() * screen.get_height()
@@ -0,0 +1,19 @@
+"""spawn_fish alias sampler against the old linear scan"""
+
+import pytest
+
+import fishing_logic as logic
+from tests import checks
+
+ROD_MODES = [(luck, cheat_mode) for luck in logic.GameData().rod_luck.values() for cheat_mode in (False, True)]
+
+
+@pytest.mark.parametrize("luck, cheat_mode", ROD_MODES)
+def test_alias_sampler_matches_linear_species_distribution(luck, cheat_mode):
+    statistic, limit, degrees = checks.spawn_distribution(luck, cheat_mode, draws=20000, seed=1)
+    assert statistic < limit
+
+
+@pytest.mark.parametrize("luck, cheat_mode", ROD_MODES)
+def test_alias_tables_encode_rarity_probabilities(luck, cheat_mode):
+    assert checks.spawn_table_error(luck, cheat_mode) < 1e-12
@@ -0,0 +1,40 @@
+"""LineTensionBatch against stepping LineTensionStage objects one at a time"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tests import checks
+
+
+@pytest.mark.parametrize("knobs", [knobs for _, knobs in checks.TENSION_VARIANTS],
+                         ids=[label for label, _ in checks.TENSION_VARIANTS])
+def test_batch_reproduces_scalar_stages(knobs):
+    offsets = np.linspace(-60, 60, 40)
+    checked = range(0, len(offsets), 4)
+    time_in_target, scores = checks.run_batch_tension(offsets, knobs)
+    scalar = [checks.run_scalar_tension(offsets[i], knobs) for i in checked]
+    assert checks.tension_mismatches(checked, scalar, time_in_target, scores) == 0
+
+
+def held_stage(held, steps):
+    """A LineTensionStage after steps simulation steps with SPACE held or released throughout"""
+    stage = checks.game.LineTensionStage()
+    if held:
+        stage.handle_input([checks.pygame.event.Event(checks.pygame.KEYDOWN, key=checks.pygame.K_SPACE)])
+    for _ in range(steps):
+        stage.update(checks.logic.SIM_STEP)
+    return stage
+
+
+def test_holding_space_lifts_the_bobber_up_to_the_speed_limit():
+    stage = held_stage(True, 120)
+    assert stage.bobber_velocity == stage.max_up_speed
+    assert stage.bobber_y < 250
+
+
+def test_releasing_space_lets_the_bobber_fall_up_to_the_speed_limit():
+    stage = held_stage(False, 30)
+    assert 0 < stage.bobber_velocity <= stage.max_down_speed
+    assert stage.bobber_y > 250
+    assert held_stage(False, 240).bobber_velocity == stage.max_down_speed